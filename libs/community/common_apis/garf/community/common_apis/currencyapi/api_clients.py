@@ -18,7 +18,6 @@ from __future__ import annotations
 
 import logging
 
-import requests
 from garf.community.common_apis import exceptions
 from garf.core import api_clients, query_editor
 
@@ -105,7 +104,9 @@ class CurrencyApiClient(api_clients.RestApiClient):
     # API key goes in a header, never in the URL.
     headers = {'apikey': self._api_key}
 
-    response = requests.get(url, params=params, headers=headers)
+    response = self.session.get(
+      url, params=params, headers=headers, timeout=self.timeout
+    )
     if response.status_code == self.OK:
       try:
         payload = response.json()
@@ -18,7 +18,6 @@ from __future__ import annotations
 
 import logging
 
-import requests
 from garf.community.common_apis import exceptions
 from garf.core import api_clients, query_editor
 
@@ -97,7 +96,7 @@ class OpenWeatherApiClient(api_clients.RestApiClient):
     # Inject auth last so user filters cannot override it.
     params['appid'] = self._api_key
 
-    response = requests.get(url, params=params)
+    response = self.session.get(url, params=params, timeout=self.timeout)
     if response.status_code == self.OK:
       data = response.json()
       if not isinstance(data, (dict, list)):
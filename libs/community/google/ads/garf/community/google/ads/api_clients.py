@@ -15,10 +15,12 @@
 
 from __future__ import annotations
 
+import contextlib
 import importlib
 import logging
 import os
 import re
+from collections.abc import Iterator
 from pathlib import Path
 from types import ModuleType
 from typing import Any, Final
@@ -45,6 +47,39 @@ google_ads_service = importlib.import_module(
 )
 
 
+_RETRY_POLICY: Final[dict[str, Any]] = {
+  'stop': tenacity.stop_after_attempt(3),
+  'wait': tenacity.wait_exponential(),
+  'retry': tenacity.retry_if_exception_type(
+    google_exceptions.InternalServerError
+  ),
+  'reraise': True,
+}
+
+
+@contextlib.contextmanager
+def _suppress_instrumentation() -> Iterator[None]:
+  """Disables auto instrumentation of gRPC calls."""
+  suppress_token = attach(set_value('suppress_instrumentation', True))
+  try:
+    yield
+  finally:
+    detach(suppress_token)
+
+
+# Descriptors and possible values of fields keyed by API version and field.
+_DESCRIPTOR_CACHE: dict[
+  tuple[str, str], protobuf.descriptor_pb2.FieldDescriptorProto
+] = {}
+_POSSIBLE_VALUES_CACHE: dict[tuple[str, str], frozenset] = {}
+
+
+def clear_descriptor_cache() -> None:
+  """Removes resolved field descriptors and their possible values."""
+  _DESCRIPTOR_CACHE.clear()
+  _POSSIBLE_VALUES_CACHE.clear()
+
+
 class FieldPossibleValues(pydantic.BaseModel):
   name: str
   values: set[Any]
@@ -148,7 +183,9 @@ class GoogleAdsApiClient(api_clients.BaseClient):
       config_dict: A dictionary containing authentication details.
       yaml_str: Strings representation of google-ads.yaml.
       version: Ads API version.
-      use_proto_plus: Whether to convert Enums to names in response.
+      use_proto_plus:
+        Whether to return proto-plus messages in response. Raw protobuf
+        messages (False) are faster to parse for large reports.
       ads_client: Instantiated GoogleAdsClient.
 
     Raises:
@@ -189,12 +226,18 @@ class GoogleAdsApiClient(api_clients.BaseClient):
     return importlib.import_module(f'{self._common_types_module}.segments')
 
   def _get_google_ads_row(self) -> google_ads_service.GoogleAdsRow:
-    """Gets GoogleAdsRow proto message for a given API version."""
+    """Gets GoogleAdsRow proto message for a given API version.
+
+    Raw protobuf message is returned when client does not use proto-plus.
+    """
     google_ads_service = importlib.import_module(
       f'google.ads.googleads.{self.api_version}.'
       f'services.types.google_ads_service'
     )
-    return google_ads_service.GoogleAdsRow()
+    row = google_ads_service.GoogleAdsRow()
+    if not self.client.use_proto_plus:
+      return google_ads_service.GoogleAdsRow.pb(row)
+    return row
 
   def get_types(self, request, **kwargs):
     return []
@@ -202,18 +245,17 @@ class GoogleAdsApiClient(api_clients.BaseClient):
   def _get_types(self, request):
     output = []
     for field_name in request.fields:
-      try:
-        descriptor = self._get_descriptor(field_name)
-        values = self._get_possible_values_for_resource(descriptor)
-        field = FieldPossibleValues(name=field_name, values=values)
-      except (AttributeError, ModuleNotFoundError):
-        field = FieldPossibleValues(
-          name=field_name,
-          values={
+      key = (self.api_version, field_name)
+      if (values := _POSSIBLE_VALUES_CACHE.get(key)) is None:
+        try:
+          descriptor = self._get_descriptor(field_name)
+          values = self._get_possible_values_for_resource(descriptor)
+        except (AttributeError, ModuleNotFoundError):
+          values = {
             '',
-          },
-        )
-      output.append(field)
+          }
+        values = _POSSIBLE_VALUES_CACHE.setdefault(key, frozenset(values))
+      output.append(FieldPossibleValues(name=field_name, values=set(values)))
     return output
 
   def _get_descriptor(
@@ -221,16 +263,24 @@ class GoogleAdsApiClient(api_clients.BaseClient):
   ) -> protobuf.descriptor_pb2.FieldDescriptorProto:
     """Gets descriptor for specified field.
 
+    Descriptors are resolved once per API version and field and shared
+    between all clients in the process.
+
     Args:
         field: Valid field name to be sent to Ads API.
 
     Returns:
         FieldDescriptorProto for specified field.
     """
-    resource, *sub_resource, base_field = field.split('.')
-    base_field = 'type_' if base_field == 'type' else base_field
-    target_resource = self._get_target_resource(resource, sub_resource)
-    return target_resource.meta.fields.get(base_field).descriptor
+    key = (self.api_version, field)
+    if (descriptor := _DESCRIPTOR_CACHE.get(key)) is None:
+      resource, *sub_resource, base_field = field.split('.')
+      base_field = 'type_' if base_field == 'type' else base_field
+      target_resource = self._get_target_resource(resource, sub_resource)
+      descriptor = _DESCRIPTOR_CACHE.setdefault(
+        key, target_resource.meta.fields.get(base_field).descriptor
+      )
+    return descriptor
 
   def _get_target_resource(
     self, resource: str, sub_resource: list[str] | None = None
@@ -334,43 +384,59 @@ class GoogleAdsApiClient(api_clients.BaseClient):
     }
 
   @override
-  @tenacity.retry(
-    stop=tenacity.stop_after_attempt(3),
-    wait=tenacity.wait_exponential(),
-    retry=tenacity.retry_if_exception_type(
-      google_exceptions.InternalServerError
-    ),
-    reraise=True,
-  )
   def get_response(
     self, request: query_editor.GoogleAdsApiQuery, account: int, **kwargs: str
   ) -> api_clients.GarfApiResponse:
-    """Executes a single API request for a given customer_id and GAQL query."""
+    """Executes a single API request for a given customer_id and GAQL query.
+
+    Request is re-issued on server errors and rows of the failed attempt are
+    discarded.
+    """
+    for attempt in tenacity.Retrying(**_RETRY_POLICY):
+      with attempt:
+        results = []
+        for response in self.get_response_stream(request, account, **kwargs):
+          results.extend(response.results)
+    return api_clients.GarfApiResponse(
+      results=results, results_placeholder=[self._get_google_ads_row()]
+    )
+
+  @override
+  def get_response_stream(
+    self, request: query_editor.GoogleAdsApiQuery, account: int, **kwargs: str
+  ) -> Iterator[api_clients.GarfApiResponse]:
+    """Yields each batch of search_stream response as soon as it arrives.
+
+    Errors are not retried since rows of earlier batches are already yielded;
+    callers retry by re-issuing the whole stream.
+    """
     span = trace.get_current_span()
     gaql_query = _create_gaql_query(request)
-    suppress_token = attach(set_value('suppress_instrumentation', True))
-    try:
-      response = self.ads_service.search_stream(
-        customer_id=account, query=gaql_query
+    with _suppress_instrumentation():
+      stream = iter(
+        self.ads_service.search_stream(customer_id=account, query=gaql_query)
       )
-      results = []
-      query_resource_consumption = 0
-      for batch in response:
-        query_resource_consumption += batch.query_resource_consumption
-        for result in batch.results:
-          results.append(result)
-    finally:
-      detach(suppress_token)
-
+      batch = next(stream, None)
+    query_resource_consumption = 0
+    num_batches = 0
+    while batch is not None:
+      query_resource_consumption += batch.query_resource_consumption
+      if batch.results:
+        num_batches += 1
+        yield api_clients.GarfApiResponse(results=list(batch.results))
+      with _suppress_instrumentation():
+        batch = next(stream, None)
     span.set_attributes(
       {
         'google.ads.query_resource_consumption': query_resource_consumption,
         'google.ads.account': account,
+        'google.ads.num_batches': num_batches,
       }
     )
-    return api_clients.GarfApiResponse(
-      results=results, results_placeholder=[self._get_google_ads_row()]
-    )
+    if not num_batches:
+      yield api_clients.GarfApiResponse(
+        results=[], results_placeholder=[self._get_google_ads_row()]
+      )
 
   def _init_client(
     self,
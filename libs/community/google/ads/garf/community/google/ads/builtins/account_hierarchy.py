@@ -68,7 +68,17 @@ def _fetch_account_hierarchy(
   report_fetcher: 'garf.community.google.ads.GoogleAdsApiReportFetcher',
   account: str | list[str],
   level: int = 0,
-) -> dict[str, Any]:
+) -> dict[int, dict[str, list[dict[str, Any]]]]:
+  """Fetches accounts under each manager level by level.
+
+  Args:
+    report_fetcher: Fetcher to query Google Ads API.
+    account: Seed manager account(s).
+    level: Level of seed accounts in hierarchy.
+
+  Returns:
+    Mapping between level in hierarchy and managers / direct accounts on it.
+  """
   seed_accounts_query = """
     SELECT
       customer_client.level AS level,
@@ -87,32 +97,30 @@ def _fetch_account_hierarchy(
 
   if isinstance(account, str):
     account = account.split(',')
-  hierarchy = report_fetcher.fetch(
-    query_specification=seed_accounts_query.format(level=level), account=account
-  )
   level_mapping = {}
-  for level_in_hierarchy, accounts in hierarchy.to_dict(
-    'level_in_hierarchy'
-  ).items():
+  visited_managers = set()
+  managers = {str(a).replace('-', '') for a in account}
+  # Managers of the same level are fetched at once so fetcher queries them
+  # concurrently; number of requests grows with depth of hierarchy.
+  while managers:
+    visited_managers.update(managers)
+    hierarchy = report_fetcher.fetch(
+      query_specification=seed_accounts_query.format(level=level),
+      account=sorted(managers),
+    )
     mccs = []
     direct_accounts = []
-    for row in accounts:
+    for row in hierarchy.to_list(row_type='dict'):
       if row.get('is_manager'):
         mccs.append(row)
       else:
         direct_accounts.append(row)
-    level_mapping[level_in_hierarchy] = {'mcc': mccs, 'direct': direct_accounts}
-
-  sub_mccs = level_mapping.get(level, {}).get('mcc')
-  if sub_mccs and (
-    accounts := {
-      a.get('account_id')
-      for a in sub_mccs
-      if a.get('account_id') != a.get('manager_id')
-    }
-  ):
-    result = _fetch_account_hierarchy(
-      report_fetcher, account=accounts, level=level + 1
-    )
-    level_mapping.update(result)
+    if mccs or direct_accounts:
+      level_mapping[level] = {'mcc': mccs, 'direct': direct_accounts}
+    managers = {
+      str(row.get('account_id'))
+      for row in mccs
+      if row.get('account_id') != row.get('manager_id')
+    } - visited_managers
+    level += 1
   return level_mapping
@@ -18,13 +18,12 @@ from __future__ import annotations
 import contextlib
 import importlib
 import operator
-import re
 from collections import abc
-from typing import Union, get_args
+from typing import Any, Callable, Union, get_args
 
 import proto  # type: ignore
 from garf.community.google.ads import api_clients, query_editor
-from garf.core import parsers
+from garf.core import parsers, query_parser
 from google import protobuf
 from proto.marshal.collections import repeated
 from typing_extensions import Self, TypeAlias
@@ -50,6 +49,10 @@ _NESTED_FIELD: TypeAlias = Union[
   _REPEATED_COMPOSITE,
 ]
 
+# Returned by parsers of the compiled getters for elements they don't handle;
+# unlike None or other falsy values it can't be a result of parsing.
+_NOT_PARSED = object()
+
 
 class BaseParser:
   """Base class for defining parsers.
@@ -92,12 +95,7 @@ class RepeatedParser(BaseParser):
         Parsed GoogleAdsRow element.
     """
     if isinstance(element, get_args(_REPEATED)) and 'customer' in str(element):
-      items: list[GoogleAdsRowElement] = []
-      for item in element:
-        items.append(
-          ResourceFormatter(item).get_resource_id().clean_resource_id().format()
-        )
-      return items
+      return [_format_resource_id(item) for item in element]
     return super().parse(element)
 
 
@@ -118,16 +116,7 @@ class RepeatedCompositeParser(BaseParser):
         Parsed GoogleAdsRow element.
     """
     if isinstance(element, get_args(_REPEATED_COMPOSITE)):
-      items = []
-      for item in element:
-        items.append(
-          ResourceFormatter(item)
-          .get_nested_resource()
-          .get_resource_id()
-          .clean_resource_id()
-          .format()
-        )
-      return items
+      return [_format_nested_resource_id(item) for item in element]
     return super().parse(element)
 
 
@@ -175,9 +164,7 @@ class MessageToDictParser(BaseParser):
         Parsed GoogleAdsRow element.
     """
     if issubclass(type(element), proto.Message):
-      return protobuf.json_format.MessageToDict(
-        element._pb, preserving_proto_field_name=True
-      )
+      return _message_to_dict(element)
     return super().parse(element)
 
 
@@ -207,7 +194,12 @@ class GoogleAdsRowParser(parsers.ProtoParser):
     self.virtual_columns = query_specification.virtual_columns
     self.column_names = query_specification.column_names
     self.parser_chain = self._init_parsers_chain()
+    self._has_custom_parsers_chain = (
+      type(self)._init_parsers_chain
+      is not GoogleAdsRowParser._init_parsers_chain
+    )
     self.row_getter = operator.attrgetter(*query_specification.fields)
+    self._row_element_getters: dict[str, parsers.RowElementGetter] = {}
     # Some segments are automatically converted to 0 when not present
     # For this case we specify attribute `respect_null` which converts
     # such attributes to None rather than 0
@@ -234,22 +226,238 @@ class GoogleAdsRowParser(parsers.ProtoParser):
     """Parses a single element from row.
 
     Args:
-        extracted_attribute: A single element from GoogleAdsRow.
-        column: Corresponding name of the element.
+        row: A single GoogleAdsRow.
+        key: Name of the field to extract from the row.
 
     Returns:
         Parsed element.
     """
-    getter = operator.attrgetter(key)
-    row = getter(row)
-    if isinstance(row, abc.MutableSequence):
-      parsed_element = [
-        self.parser_chain.parse(element) or element for element in row
-      ]
-    else:
-      parsed_element = self.parser_chain.parse(row) or row
+    if self._has_custom_parsers_chain:
+      return self._parse_row_element_with_chain(row, key)
+    return self._get_row_element_getter(key)(row)
+
+  def compile_row_element_getter(self, key: str) -> parsers.RowElementGetter:
+    """Builds a function to get and parse a single field of a row."""
+    if (
+      type(self).parse_row_element is not GoogleAdsRowParser.parse_row_element
+      or self._has_custom_parsers_chain
+    ):
+      return super().compile_row_element_getter(key)
+    return self._get_row_element_getter(key)
+
+  def _parse_row_element_with_chain(
+    self, row: GoogleAdsRowElement, key: str
+  ) -> GoogleAdsRowElement:
+    """Parses a single element from row with parser chain."""
+    element = operator.attrgetter(key)(row)
+    if isinstance(element, abc.MutableSequence):
+      return [self._parse_with_chain(item) for item in element]
+    return self._parse_with_chain(element)
+
+  def _parse_with_chain(
+    self, element: GoogleAdsRowElement
+  ) -> GoogleAdsRowElement:
+    """Parses element with parser chain, keeps element if none handles it."""
+    if (parsed := self.parser_chain.parse(element)) is None:
+      return element
+    return parsed
+
+  def _get_row_element_getter(self, key: str) -> parsers.RowElementGetter:
+    """Returns a cached function to get and parse a field of a row.
+
+    Getter is compiled once per type of row: proto-plus rows are parsed
+    with the parser chain resolved once per element type, raw protobuf
+    rows (`use_proto_plus=False`) - with accessors built from message
+    descriptor.
+    """
+    if getter := self._row_element_getters.get(key):
+      return getter
+    getters: dict[type, parsers.RowElementGetter] = {}
+
+    def getter(row):
+      if (row_getter := getters.get(type(row))) is None:
+        row_getter = getters[type(row)] = _compile_row_element_getter(row, key)
+      return row_getter(row)
+
+    self._row_element_getters[key] = getter
+    return getter
+
+
+def _compile_row_element_getter(
+  row: GoogleAdsRowElement, key: str
+) -> parsers.RowElementGetter:
+  """Builds a function to get and parse a field from rows of the same type."""
+  if isinstance(row, protobuf.message.Message):
+    return _compile_raw_getter(row.DESCRIPTOR, key)
+  return _compile_proto_plus_getter(key)
+
+
+def _compile_proto_plus_getter(key: str) -> parsers.RowElementGetter:
+  """Builds a function to get and parse a field from proto-plus messages.
+
+  Parser for elements of a field is resolved once per element type
+  from the first element met instead of walking the parser chain for
+  every row.
+  """
+  attribute_getter = operator.attrgetter(key)
+  element_parsers: dict[type, Callable[[Any], Any] | None] = {}
+
+  def parse_element(element):
+    try:
+      element_parser = element_parsers[type(element)]
+    except KeyError:
+      element_parser = element_parsers[type(element)] = _resolve_parser(element)
+    if element_parser is None:
+      return element
+    if (parsed := element_parser(element)) is _NOT_PARSED:
+      return element
+    return parsed
+
+  def getter(row):
+    value = attribute_getter(row)
+    if isinstance(value, abc.MutableSequence):
+      return [parse_element(element) for element in value]
+    return parse_element(value)
+
+  return getter
+
+
+def _compile_raw_getter(
+  descriptor: protobuf.descriptor.Descriptor, key: str
+) -> parsers.RowElementGetter:
+  """Builds a function to get and parse a field from raw protobuf messages.
+
+  Field is located via message descriptor so enums are converted to their
+  names and messages to dictionaries without wrapping them into proto-plus
+  objects. Produces the same values as parsing proto-plus messages.
+
+  Args:
+      descriptor: Descriptor of a message to get field from.
+      key: Name of the field, i.e. `campaign.bidding_strategy_type`.
+
+  Returns:
+      Function to get and parse a field from a message.
+
+  Raises:
+      GarfFieldError: If field is missing in a message.
+  """
+  field_names = []
+  field = None
+  for name in key.split('.'):
+    fields = descriptor.fields_by_name if descriptor else {}
+    # proto-plus adds trailing underscore to reserved names, i.e. `type_`.
+    if not (field := fields.get(name) or fields.get(name.rstrip('_'))):
+      raise query_parser.GarfFieldError(f'field {key} is missing in row')
+    field_names.append(field.name)
+    descriptor = field.message_type
+  attribute_getter = operator.attrgetter('.'.join(field_names))
+  parse_element = _resolve_raw_parser(field)
+  if _is_repeated(field):
+    if parse_element is None:
+      return lambda row: list(attribute_getter(row))
+    return lambda row: [parse_element(e) for e in attribute_getter(row)]
+  if parse_element is None:
+    return attribute_getter
+  return lambda row: parse_element(attribute_getter(row))
+
+
+def _resolve_raw_parser(
+  field: protobuf.descriptor.FieldDescriptor,
+) -> Callable[[Any], Any] | None:
+  """Finds a function to parse raw protobuf values of a field.
+
+  Args:
+      field: Descriptor of a field.
+
+  Returns:
+      Function to parse values of the field or None if they should be
+      returned as is.
+  """
+  if field.type == field.TYPE_ENUM:
+    names = {value.number: value.name for value in field.enum_type.values}
+    return lambda element: names.get(element, element)
+  if field.type != field.TYPE_MESSAGE:
+    return None
+  fields = field.message_type.fields_by_name
+  for attribute in ('name', 'text', 'asset', 'value'):
+    if attribute in fields:
+      attribute_getter = operator.attrgetter(attribute)
+      parse_attribute = _resolve_raw_parser(fields[attribute])
+      if parse_attribute is None:
+        return attribute_getter
+      return lambda element: parse_attribute(attribute_getter(element))
+  return lambda element: protobuf.json_format.MessageToDict(
+    element, preserving_proto_field_name=True
+  )
+
+
+def _is_repeated(field: protobuf.descriptor.FieldDescriptor) -> bool:
+  if (is_repeated := getattr(field, 'is_repeated', None)) is not None:
+    return is_repeated
+  return field.label == field.LABEL_REPEATED
+
+
+def _resolve_parser(
+  element: GoogleAdsRowElement,
+) -> Callable[[Any], Any] | None:
+  """Finds a parser from the parser chain that handles element's type.
+
+  Mirrors order of parsers in `GoogleAdsRowParser._init_parsers_chain`.
+
+  Args:
+      element: A sample element of a GoogleAdsRow.
+
+  Returns:
+      Function to parse elements of the same type or None if they should be
+      returned as is.
+  """
+  # RepeatedComposite is a subclass of Repeated, so it's checked first.
+  if isinstance(element, get_args(_REPEATED_COMPOSITE)):
+    return _parse_repeated_composite
+  if isinstance(element, get_args(_REPEATED)):
+    return _parse_repeated
+  for attribute in ('name', 'text', 'asset', 'value'):
+    if hasattr(element, attribute):
+      return operator.attrgetter(attribute)
+  if issubclass(type(element), proto.Message):
+    return _message_to_dict
+  return None
+
+
+def _parse_repeated(element: _REPEATED) -> list[GoogleAdsRowElement] | object:
+  if 'customer' in str(element):
+    return [_format_resource_id(item) for item in element]
+  return _NOT_PARSED
+
+
+def _parse_repeated_composite(
+  element: _REPEATED_COMPOSITE,
+) -> list[GoogleAdsRowElement]:
+  # Customer resources are formatted as by RepeatedParser which precedes
+  # RepeatedCompositeParser in the chain.
+  if (parsed := _parse_repeated(element)) is not _NOT_PARSED:
+    return parsed
+  return [_format_nested_resource_id(item) for item in element]
+
+
+def _message_to_dict(element: proto.Message) -> dict[str, Any]:
+  return protobuf.json_format.MessageToDict(
+    element._pb, preserving_proto_field_name=True
+  )
+
+
+def _format_resource_id(element: str) -> str | int:
+  """Extracts id from resource name, i.e. `customers/1/campaigns/2` -> 2."""
+  resource_id = str(element).strip().rsplit('/', 1)[-1].replace('"', '')
+  try:
+    return int(resource_id)
+  except ValueError:
+    return resource_id
+
 
-    return parsed_element
+def _format_nested_resource_id(element: str) -> str | int:
+  """Extracts id from nested resource, i.e. `asset: "customers/1/assets/2"`."""
+  return _format_resource_id(str(element).strip().split(': ')[1])
 
 
 class ResourceFormatter:
@@ -261,7 +469,7 @@ class ResourceFormatter:
 
   def get_nested_resource(self) -> Self:
     """Extract nested resources from the API response field."""
-    self.element = re.split(': ', self.element)[1]
+    self.element = self.element.split(': ')[1]
     return self
 
   def get_resource_id(self) -> Self:
@@ -270,12 +478,12 @@ class ResourceFormatter:
     Resource name looks like `customer/123/campaigns/321`.
     `get_resource_id` returns `321`.
     """
-    self.element = re.split('/', self.element)[-1]
+    self.element = self.element.rsplit('/', 1)[-1]
     return self
 
   def clean_resource_id(self) -> Self:
     """Ensures that resource_id is cleaned up and converted to int."""
-    self.element = re.sub('"', '', self.element)
+    self.element = self.element.replace('"', '')
     with contextlib.suppress(ValueError):
       self.element = int(self.element)
     return self
@@ -17,12 +17,14 @@
 from __future__ import annotations
 
 import asyncio
-import functools
-import operator
+import hashlib
+import json
+import logging
 import warnings
 from typing import Literal
 
 import garf.core
+import tenacity
 from garf.community.google.ads import (
   api_clients,
   builtins,
@@ -32,7 +34,11 @@ from garf.community.google.ads import (
   version,
 )
 from garf.community.google.ads.telemetry import tracer
+from garf.core import cache, concurrency
 from opentelemetry import trace
+from typing_extensions import override
+
+logger = logging.getLogger(__name__)
 
 
 class GoogleAdsApiReportFetcherError(exceptions.GoogleAdsApiError):
@@ -54,12 +60,29 @@ class GoogleAdsApiReportFetcher(garf.core.ApiReportFetcher):
     ),
     builtin_queries=builtins.BUILTIN_QUERIES,
     parallel_threshold: int = 10,
+    max_parallel: int | None = None,
+    expand_mcc_cache_ttl_seconds: int = 0,
     **kwargs: str,
   ) -> None:
-    """Initializes GoogleAdsApiReportFetcher."""
+    """Initializes GoogleAdsApiReportFetcher.
+
+    Args:
+      api_client: Instantiated api client.
+      parser: Type of parser to convert API response.
+      query_spec: Class to perform query parsing.
+      builtin_queries:
+        Mapping between query name and function for generating GarfReport.
+      parallel_threshold: Initial number of accounts to fetch concurrently.
+      max_parallel:
+        Max number of accounts to fetch concurrently, 4x `parallel_threshold`
+        by default.
+      expand_mcc_cache_ttl_seconds:
+        Lifespan of cached MCC expansion results, 0 disables caching.
+    """
     if not api_client:
       api_client = api_clients.GoogleAdsApiClient(**kwargs)
     self.parallel_threshold = parallel_threshold
+    self.max_parallel = max_parallel
     if kwargs.get('no_expand_mcc'):
       preprocessors = {}
     elif kwargs.get('expand_mcc') in (None, True):
@@ -74,6 +97,13 @@ class GoogleAdsApiReportFetcher(garf.core.ApiReportFetcher):
       preprocessors=preprocessors,
       **kwargs,
     )
+    self.expand_mcc_cache = (
+      cache.GarfCache(
+        self.cache.location, ttl_seconds=int(expand_mcc_cache_ttl_seconds)
+      )
+      if int(expand_mcc_cache_ttl_seconds)
+      else None
+    )
 
   def fetch(
     self,
@@ -141,7 +171,43 @@ class GoogleAdsApiReportFetcher(garf.core.ApiReportFetcher):
         args=args,
       )
     )
-    return functools.reduce(operator.add, reports)
+    return garf.core.GarfReport.concat(reports)
+
+  @override
+  def _fetch_report(
+    self, query: query_editor.GoogleAdsApiQuery, **kwargs: str
+  ) -> garf.core.GarfReport:
+    """Parses each batch of search_stream response as soon as it arrives.
+
+    Only parsed rows are kept in memory, protobuf messages of a batch are
+    released before the next batch is received. On server errors rows of the
+    failed attempt are discarded and the whole stream is requested again.
+    """
+    parser = self.parser(query)
+    column_names = [c for c in query.column_names if c != '_']
+    for attempt in tenacity.Retrying(**api_clients._RETRY_POLICY):
+      with attempt:
+        results = []
+        results_placeholder = []
+        for response in self.api_client.call_api_stream(query, **kwargs):
+          if response:
+            results.extend(parser.parse_response(response))
+          elif not results_placeholder:
+            results_placeholder = response.results_placeholder
+    if results:
+      return garf.core.GarfReport(
+        results=results,
+        column_names=column_names,
+        query_specification=query,
+      )
+    trace.get_current_span().set_attribute('is_placeholder_report', True)
+    return garf.core.GarfReport(
+      results_placeholder=parser.parse_response(
+        garf.core.api_clients.GarfApiResponse(results=results_placeholder)
+      ),
+      column_names=column_names,
+      query_specification=query,
+    )
 
   async def _process_accounts(
     self,
@@ -149,17 +215,15 @@ class GoogleAdsApiReportFetcher(garf.core.ApiReportFetcher):
     account: list[str],
     args,
   ):
-    semaphore = asyncio.Semaphore(value=self.parallel_threshold)
-
-    async def run_with_semaphore(fn):
-      async with semaphore:
-        return await fn
+    limiter = concurrency.AdaptiveLimiter(
+      initial_limit=self.parallel_threshold, max_limit=self.max_parallel
+    )
 
     tasks = [
       self.afetch(query_specification=query, account=str(acc), args=args)
       for acc in account
     ]
-    return await asyncio.gather(*(run_with_semaphore(task) for task in tasks))
+    return await asyncio.gather(*(limiter.run(task) for task in tasks))
 
   @tracer.start_as_current_span('expand_mcc')
   def expand_mcc(
@@ -171,6 +235,9 @@ class GoogleAdsApiReportFetcher(garf.core.ApiReportFetcher):
   ) -> list[str]:
     """Performs Manager account(s) expansion to child accounts.
 
+    When `expand_mcc_cache_ttl_seconds` is set non-empty results of expansion
+    are saved to cache and reused until they expire.
+
     Args:
       account: Manager account(s) to be expanded.
       customer_ids_query: GAQL query used to reduce the number of customer_ids.
@@ -192,6 +259,73 @@ class GoogleAdsApiReportFetcher(garf.core.ApiReportFetcher):
       )
       account = customer_ids
     span.set_attribute('accounts.seed_accounts', account)
+    if not self.expand_mcc_cache:
+      return self._expand_mcc(account, customer_ids_query, expand_mcc_type)
+    hash_identifier = self._expand_mcc_hash_identifier(
+      account, customer_ids_query, expand_mcc_type
+    )
+    provider = self.expand_mcc_cache.cache_provider
+    try:
+      cached_accounts = provider.load(hash_identifier, None)
+      span.set_attribute('accounts.is_cached', True)
+      if not cached_accounts:
+        return []
+      return cached_accounts['account_id'].to_list()
+    except cache.GarfCacheFileNotFoundError:
+      pass
+    accounts = self._expand_mcc(account, customer_ids_query, expand_mcc_type)
+    if not accounts:
+      return accounts
+    try:
+      provider.save(
+        garf.core.GarfReport(
+          results=[[a] for a in accounts], column_names=['account_id']
+        ),
+        hash_identifier,
+      )
+    except Exception as e:
+      logger.warning('Failed to cache expanded accounts: %s', e)
+    return accounts
+
+  def _expand_mcc_hash_identifier(
+    self,
+    account: str | list[str],
+    customer_ids_query: str | None,
+    expand_mcc_type: str,
+  ) -> str:
+    """Builds unique identifier of MCC expansion for cache.
+
+    Identifier depends on credentials and login customer of the client
+    since accessible accounts differ between them.
+    """
+    if isinstance(account, (str, int)):
+      account = str(account).split(',')
+    ads_client = getattr(self.api_client, 'client', None)
+    credentials = getattr(ads_client, 'credentials', None)
+    expansion = {
+      'source': self.alias,
+      'login_customer_id': str(getattr(ads_client, 'login_customer_id', None)),
+      'credentials': str(
+        getattr(credentials, 'service_account_email', None)
+        or getattr(credentials, 'client_id', None)
+      ),
+      'account': sorted(str(a).replace('-', '') for a in account),
+      'customer_ids_query': customer_ids_query,
+      'expand_mcc_type': expand_mcc_type,
+    }
+    expansion_hash = hashlib.md5(
+      json.dumps(expansion).encode('utf-8'), usedforsecurity=False
+    ).hexdigest()
+    return f'expand_mcc:{expansion_hash}'
+
+  def _expand_mcc(
+    self,
+    account: str | list[str],
+    customer_ids_query: str | None,
+    expand_mcc_type: Literal['roots', 'leaves', 'hierarchy'],
+  ) -> list[str]:
+    """Gets all accounts under provided seed accounts from API."""
+    span = trace.get_current_span()
     if expand_mcc_type == 'roots':
       query = """
           SELECT customer_client.id FROM customer_client
@@ -0,0 +1,88 @@
+# Copyright 2026 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import garf.core
+from garf.community.google.ads.builtins import account_hierarchy
+
+_COLUMN_NAMES = [
+  'level',
+  'manager_name',
+  'manager_id',
+  'is_manager',
+  'level_in_hierarchy',
+  'account_id',
+  'account_name',
+]
+
+# Manager -> list of (account_id, is_manager) directly linked to it.
+_HIERARCHY = {
+  1: [(2, True), (3, True), (10, False)],
+  2: [(3, True), (20, False)],
+  3: [(30, False)],
+}
+
+
+class FakeReportFetcher:
+  def __init__(self):
+    self.fetched_accounts = []
+
+  def fetch(self, query_specification, account):
+    self.fetched_accounts.append(account)
+    level_in_hierarchy = int(
+      query_specification.split(' AS level_in_hierarchy')[0].split()[-1]
+    )
+    results = []
+    for manager in account:
+      manager_id = int(manager)
+      results.append(
+        [0, 'mcc', manager_id, True, level_in_hierarchy, manager_id, 'mcc']
+      )
+      for account_id, is_manager in _HIERARCHY.get(manager_id, []):
+        results.append(
+          [
+            1,
+            'mcc',
+            manager_id,
+            is_manager,
+            level_in_hierarchy,
+            account_id,
+            'account',
+          ]
+        )
+    return garf.core.GarfReport(results=results, column_names=_COLUMN_NAMES)
+
+
+class TestGetAccountHierarchy:
+  def test_fetches_all_managers_of_level_at_once(self):
+    fetcher = FakeReportFetcher()
+
+    account_hierarchy.get_account_hierarchy(fetcher, account='1')
+
+    assert fetcher.fetched_accounts == [['1'], ['2', '3']]
+
+  def test_returns_all_accounts_under_seed_account(self):
+    fetcher = FakeReportFetcher()
+
+    report = account_hierarchy.get_account_hierarchy(fetcher, account='1')
+
+    assert sorted(
+      (row.mcc_id, row.account_id, row.is_manager) for row in report
+    ) == [
+      (1, 2, True),
+      (1, 3, True),
+      (1, 10, False),
+      (2, 3, True),
+      (2, 20, False),
+      (3, 30, False),
+    ]
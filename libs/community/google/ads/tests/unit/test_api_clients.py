@@ -0,0 +1,162 @@
+# Copyright 2026 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import pytest
+import tenacity
+from garf.community.google.ads import api_clients, query_editor
+from google.api_core import exceptions as google_exceptions
+
+GoogleAdsRow = api_clients.google_ads_service.GoogleAdsRow
+
+_QUERY = 'SELECT campaign.id AS campaign_id FROM campaign'
+
+
+def _batch(mocker, *campaign_ids):
+  return mocker.Mock(
+    results=[GoogleAdsRow(campaign={'id': id_}) for id_ in campaign_ids],
+    query_resource_consumption=1,
+  )
+
+
+@pytest.fixture
+def query():
+  return query_editor.GoogleAdsApiQuery(text=_QUERY).generate()
+
+
+@pytest.fixture
+def client(mocker):
+  mocker.patch.dict(api_clients._RETRY_POLICY, wait=tenacity.wait_none())
+  return api_clients.GoogleAdsApiClient(
+    ads_client=mocker.Mock(), version=api_clients.GOOGLE_ADS_API_VERSION
+  )
+
+
+class TestGoogleAdsApiClient:
+  def test_get_response_stream_yields_each_batch(self, mocker, client, query):
+    client.ads_service.search_stream.return_value = iter(
+      [_batch(mocker, 1, 2), _batch(mocker, 3)]
+    )
+
+    responses = list(client.get_response_stream(query, account=1))
+
+    assert [
+      [row.campaign.id for row in response.results] for response in responses
+    ] == [[1, 2], [3]]
+
+  def test_get_response_stream_yields_placeholder_for_empty_response(
+    self, client, query
+  ):
+    client.ads_service.search_stream.return_value = iter([])
+
+    responses = list(client.get_response_stream(query, account=1))
+
+    assert len(responses) == 1
+    assert not responses[0]
+    assert responses[0].results_placeholder == [GoogleAdsRow()]
+
+  def test_get_response_stream_does_not_retry_error(self, client, query):
+    client.ads_service.search_stream.side_effect = (
+      google_exceptions.InternalServerError('error')
+    )
+
+    with pytest.raises(google_exceptions.InternalServerError):
+      next(client.get_response_stream(query, account=1))
+
+    assert client.ads_service.search_stream.call_count == 1
+
+  def test_get_response_stream_does_not_retry_error_after_first_batch(
+    self, mocker, client, query
+  ):
+    def failing_stream():
+      yield _batch(mocker, 1)
+      raise google_exceptions.InternalServerError('error')
+
+    client.ads_service.search_stream.return_value = failing_stream()
+
+    responses = client.get_response_stream(query, account=1)
+    next(responses)
+    with pytest.raises(google_exceptions.InternalServerError):
+      next(responses)
+
+    assert client.ads_service.search_stream.call_count == 1
+
+  def test_get_response_retries_whole_stream_on_error_after_first_batch(
+    self, mocker, client, query
+  ):
+    def failing_stream():
+      yield _batch(mocker, 1)
+      raise google_exceptions.InternalServerError('error')
+
+    client.ads_service.search_stream.side_effect = [
+      failing_stream(),
+      iter([_batch(mocker, 1), _batch(mocker, 2)]),
+    ]
+
+    response = client.get_response(query, account=1)
+
+    assert client.ads_service.search_stream.call_count == 2
+    assert [row.campaign.id for row in response.results] == [1, 2]
+
+  def test_get_response_does_not_nest_retries(self, client, query):
+    client.ads_service.search_stream.side_effect = (
+      google_exceptions.InternalServerError('error')
+    )
+
+    with pytest.raises(google_exceptions.InternalServerError):
+      client.get_response(query, account=1)
+
+    assert client.ads_service.search_stream.call_count == 3
+
+
+class TestGoogleAdsApiClientDescriptorCache:
+  @pytest.fixture(autouse=True)
+  def clear_cache(self):
+    api_clients.clear_descriptor_cache()
+    yield
+    api_clients.clear_descriptor_cache()
+
+  def test_get_descriptor_resolves_field_once_per_version(self, mocker):
+    resolver = mocker.spy(
+      api_clients.GoogleAdsApiClient, '_get_target_resource'
+    )
+    clients = [
+      api_clients.GoogleAdsApiClient(
+        ads_client=mocker.Mock(), version=api_clients.GOOGLE_ADS_API_VERSION
+      )
+      for _ in range(2)
+    ]
+
+    descriptors = [
+      client._get_descriptor('campaign.status')
+      for client in clients
+      for _ in range(2)
+    ]
+
+    assert resolver.call_count == 1
+    assert all(descriptor is descriptors[0] for descriptor in descriptors)
+
+  def test_get_types_returns_values_not_shared_between_clients(self, mocker):
+    request = mocker.Mock(fields=['campaign.status'])
+    first_client, second_client = (
+      api_clients.GoogleAdsApiClient(
+        ads_client=mocker.Mock(), version=api_clients.GOOGLE_ADS_API_VERSION
+      )
+      for _ in range(2)
+    )
+
+    first_client._get_types(request)[0].values.add('UNKNOWN_VALUE')
+    values = second_client._get_types(request)[0].values
+
+    assert 'ENABLED' in values
+    assert 'UNKNOWN_VALUE' not in values
@@ -0,0 +1,183 @@
+# Copyright 2026 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import pytest
+from garf.community.google.ads import parsers, query_editor
+from garf.core import api_clients, query_parser
+
+GoogleAdsRow = parsers.google_ads_service.GoogleAdsRow
+
+_QUERY = """
+  SELECT
+    ad_group.id AS ad_group_id,
+    ad_group.name AS ad_group_name,
+    ad_group.status AS status,
+    ad_group.type AS ad_group_type,
+    ad_group.labels AS labels,
+    segments.date AS date,
+    metrics.clicks AS clicks
+  FROM ad_group
+"""
+
+_EXPECTED_ROW = [
+  1,
+  'test',
+  'ENABLED',
+  'SEARCH_STANDARD',
+  ['customers/1/labels/2'],
+  '2026-01-01',
+  10,
+]
+
+
+@pytest.fixture
+def serialized_row():
+  return GoogleAdsRow.serialize(
+    GoogleAdsRow(
+      ad_group={
+        'id': 1,
+        'name': 'test',
+        'status': 2,
+        'type_': 2,
+        'labels': ['customers/1/labels/2'],
+      },
+      segments={'date': '2026-01-01'},
+      metrics={'clicks': 10},
+    )
+  )
+
+
+@pytest.fixture
+def parser():
+  query = query_editor.GoogleAdsApiQuery(text=_QUERY).generate()
+  return parsers.GoogleAdsRowParser(query)
+
+
+class TestGoogleAdsRowParser:
+  def test_parse_response_returns_parsed_proto_plus_rows(
+    self, parser, serialized_row
+  ):
+    row = GoogleAdsRow.deserialize(serialized_row)
+
+    result = parser.parse_response(api_clients.GarfApiResponse(results=[row]))
+
+    assert result == [_EXPECTED_ROW]
+
+  def test_parse_response_returns_parsed_raw_protobuf_rows(
+    self, parser, serialized_row
+  ):
+    row = GoogleAdsRow.pb().FromString(serialized_row)
+
+    result = parser.parse_response(api_clients.GarfApiResponse(results=[row]))
+
+    assert result == [_EXPECTED_ROW]
+
+  def test_parse_row_element_raises_error_on_missing_raw_field(
+    self, parser, serialized_row
+  ):
+    row = GoogleAdsRow.pb().FromString(serialized_row)
+
+    with pytest.raises(query_parser.GarfFieldError):
+      parser.parse_row_element(row, 'ad_group.unknown_field')
+
+  @pytest.mark.parametrize(
+    'key',
+    [
+      'ad_group.status',
+      'ad_group.campaign',
+      'ad_group.labels',
+      'ad_group_ad.ad.responsive_search_ad.headlines',
+      'ad_group_ad.policy_summary',
+    ],
+    ids=['enum', 'resource', 'repeated', 'repeated_composite', 'message'],
+  )
+  def test_compile_row_element_getter_returns_same_value_as_parser_chain(
+    self, parser, key
+  ):
+    row = GoogleAdsRow.deserialize(
+      GoogleAdsRow.serialize(
+        GoogleAdsRow(
+          ad_group={
+            'status': 2,
+            'campaign': 'customers/1/campaigns/2',
+            'labels': ['customers/1/labels/2'],
+          },
+          ad_group_ad={
+            'ad': {
+              'responsive_search_ad': {
+                'headlines': [{'text': 'first'}, {'text': 'second'}]
+              }
+            },
+            'policy_summary': {'approval_status': 2},
+          },
+        )
+      )
+    )
+    expected = parser._parse_row_element_with_chain(row, key)
+
+    assert parser.compile_row_element_getter(key)(row) == expected
+
+  def test_resolve_parser_parses_repeated_composite_as_parser_chain(
+    self, parser
+  ):
+    row = GoogleAdsRow(
+      ad_group_ad={
+        'ad': {
+          'responsive_search_ad': {
+            'headlines': [{'text': 'first'}, {'text': 'second'}]
+          }
+        }
+      }
+    )
+    element = row.ad_group_ad.ad.responsive_search_ad.headlines
+
+    parsed = parsers._resolve_parser(element)(element)
+
+    assert parsed == ['first', 'second']
+    assert parsed == parser.parser_chain.parse(element)
+
+  @pytest.mark.parametrize('row_type', ['proto_plus', 'raw'])
+  def test_compile_row_element_getter_keeps_falsy_parsed_values(
+    self, parser, row_type
+  ):
+    row = GoogleAdsRow(
+      ad_group_ad={
+        'ad': {'responsive_search_ad': {'headlines': [{'text': ''}]}}
+      }
+    )
+    if row_type == 'raw':
+      row = GoogleAdsRow.pb(row)
+    key = 'ad_group_ad.ad.responsive_search_ad.headlines'
+
+    assert parser.compile_row_element_getter(key)(row) == ['']
+
+  def test_parse_response_uses_overridden_parsers_chain(self, serialized_row):
+    class UpperCaseParser(parsers.BaseParser):
+      def parse(self, element):
+        return str(element).upper()
+
+    class CustomGoogleAdsRowParser(parsers.GoogleAdsRowParser):
+      def _init_parsers_chain(self):
+        return UpperCaseParser(None)
+
+    query = query_editor.GoogleAdsApiQuery(
+      text='SELECT ad_group.name AS name FROM ad_group'
+    ).generate()
+    row = GoogleAdsRow.deserialize(serialized_row)
+
+    result = CustomGoogleAdsRowParser(query).parse_response(
+      api_clients.GarfApiResponse(results=[row])
+    )
+
+    assert result == [['TEST']]
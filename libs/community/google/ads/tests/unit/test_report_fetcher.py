@@ -0,0 +1,201 @@
+# Copyright 2026 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import time
+
+import pytest
+import tenacity
+from garf.community.google.ads import api_clients, report_fetcher
+from garf.core import cache
+from google.api_core import exceptions as google_exceptions
+
+GoogleAdsRow = api_clients.google_ads_service.GoogleAdsRow
+
+_QUERY = 'SELECT campaign.id AS campaign_id FROM campaign'
+
+
+def _batch(mocker, *campaign_ids):
+  return mocker.Mock(
+    results=[GoogleAdsRow(campaign={'id': id_}) for id_ in campaign_ids],
+    query_resource_consumption=1,
+  )
+
+
+@pytest.fixture
+def api_client(mocker):
+  mocker.patch.dict(api_clients._RETRY_POLICY, wait=tenacity.wait_none())
+  return api_clients.GoogleAdsApiClient(
+    ads_client=mocker.Mock(), version=api_clients.GOOGLE_ADS_API_VERSION
+  )
+
+
+@pytest.fixture
+def fetcher(api_client):
+  return report_fetcher.GoogleAdsApiReportFetcher(api_client=api_client)
+
+
+class TestGoogleAdsApiReportFetcher:
+  def test_fetch_parses_all_batches_of_response(
+    self, mocker, api_client, fetcher
+  ):
+    api_client.ads_service.search_stream.return_value = iter(
+      [_batch(mocker, 1, 2), _batch(mocker, 3)]
+    )
+
+    report = fetcher.fetch(_QUERY, account='1')
+
+    assert report.results == [[1], [2], [3]]
+    assert report.column_names == ['campaign_id']
+
+  def test_fetch_returns_placeholder_report_for_empty_response(
+    self, api_client, fetcher
+  ):
+    api_client.ads_service.search_stream.return_value = iter([])
+
+    report = fetcher.fetch(_QUERY, account='1')
+
+    assert not report
+    assert report.results_placeholder == [[0]]
+
+  def test_fetch_requests_whole_stream_again_on_error_after_first_batch(
+    self, mocker, api_client, fetcher
+  ):
+    def failing_stream():
+      yield _batch(mocker, 1, 2)
+      raise google_exceptions.InternalServerError('error')
+
+    api_client.ads_service.search_stream.side_effect = [
+      failing_stream(),
+      iter([_batch(mocker, 1, 2), _batch(mocker, 3)]),
+    ]
+
+    report = fetcher.fetch(_QUERY, account='1')
+
+    assert api_client.ads_service.search_stream.call_count == 2
+    assert report.results == [[1], [2], [3]]
+
+  def test_fetch_raises_error_after_all_attempts(self, api_client, fetcher):
+    api_client.ads_service.search_stream.side_effect = (
+      google_exceptions.InternalServerError('error')
+    )
+
+    with pytest.raises(google_exceptions.InternalServerError):
+      fetcher.fetch(_QUERY, account='1')
+
+    assert api_client.ads_service.search_stream.call_count == 3
+
+
+class TestGoogleAdsApiReportFetcherExpandMcc:
+  @pytest.fixture
+  def api_client(self, mocker):
+    ads_client = mocker.Mock(
+      login_customer_id='1',
+      credentials=mocker.Mock(service_account_email='test@example.com'),
+    )
+    return api_clients.GoogleAdsApiClient(
+      ads_client=ads_client, version=api_clients.GOOGLE_ADS_API_VERSION
+    )
+
+  @pytest.fixture
+  def fetcher(self, api_client, tmp_path):
+    return report_fetcher.GoogleAdsApiReportFetcher(
+      api_client=api_client,
+      cache_path=tmp_path,
+      expand_mcc_cache_ttl_seconds=3600,
+    )
+
+  def test_expand_mcc_fetches_accounts_on_cache_miss(self, mocker, fetcher):
+    expand = mocker.patch.object(
+      fetcher, '_expand_mcc', return_value=['2', '3']
+    )
+
+    accounts = fetcher.expand_mcc('1')
+
+    assert accounts == ['2', '3']
+    expand.assert_called_once()
+
+  def test_expand_mcc_returns_cached_accounts_on_cache_hit(
+    self, mocker, fetcher
+  ):
+    expand = mocker.patch.object(
+      fetcher, '_expand_mcc', return_value=['2', '3']
+    )
+    fetcher.expand_mcc('1')
+
+    accounts = fetcher.expand_mcc('1')
+
+    assert accounts == ['2', '3']
+    expand.assert_called_once()
+
+  def test_expand_mcc_does_not_cache_empty_result(self, mocker, fetcher):
+    expand = mocker.patch.object(fetcher, '_expand_mcc', return_value=[])
+    fetcher.expand_mcc('1')
+
+    accounts = fetcher.expand_mcc('1')
+
+    assert accounts == []
+    assert expand.call_count == 2
+
+  def test_expand_mcc_fetches_accounts_when_cache_expired(
+    self, mocker, fetcher
+  ):
+    expand = mocker.patch.object(
+      fetcher, '_expand_mcc', return_value=['2', '3']
+    )
+    fetcher.expand_mcc('1')
+    expired_at = time.time() + 3600
+    mocker.patch.object(cache, 'time').time.return_value = expired_at
+    mocker.patch.object(
+      cache.FileGarfCache,
+      'max_cache_timestamp',
+      new_callable=mocker.PropertyMock,
+      return_value=expired_at,
+    )
+
+    accounts = fetcher.expand_mcc('1')
+
+    assert accounts == ['2', '3']
+    assert expand.call_count == 2
+
+  def test_expand_mcc_does_not_share_cache_between_login_customers(
+    self, mocker, api_client, fetcher
+  ):
+    expand = mocker.patch.object(
+      fetcher, '_expand_mcc', return_value=['2', '3']
+    )
+    fetcher.expand_mcc('1')
+    api_client.client.login_customer_id = '2'
+
+    fetcher.expand_mcc('1')
+
+    assert expand.call_count == 2
+
+  def test_expand_mcc_does_not_use_cache_with_zero_ttl(
+    self, mocker, api_client, tmp_path
+  ):
+    fetcher = report_fetcher.GoogleAdsApiReportFetcher(
+      api_client=api_client,
+      cache_path=tmp_path,
+      expand_mcc_cache_ttl_seconds=0,
+    )
+    expand = mocker.patch.object(
+      fetcher, '_expand_mcc', return_value=['2', '3']
+    )
+    fetcher.expand_mcc('1')
+
+    accounts = fetcher.expand_mcc('1')
+
+    assert accounts == ['2', '3']
+    assert expand.call_count == 2
+    assert not list(tmp_path.iterdir())
@@ -13,6 +13,7 @@
 # limitations under the License.
 """Creates API client for Google Analytics API."""
 
+import math
 from collections import defaultdict
 
 from garf.community.google.analytics import query_editor
@@ -27,6 +28,7 @@ from google.analytics.data_v1beta.types import (
   Metric,
   NumericValue,
   RunReportRequest,
+  RunReportResponse,
 )
 from typing_extensions import override
 
@@ -40,10 +42,23 @@ _NUMERIC_OPERATORS = {
 }
 
 
+# Max number of rows returned by Data API in a single response.
+_PAGE_SIZE = 250_000
+
+
 class GoogleAnalyticsApiClient(api_clients.BaseClient):
-  def __init__(self) -> None:
-    """Initializes GoogleAnalyticsApiClient."""
+  def __init__(
+    self, page_size: int = _PAGE_SIZE, max_parallel_pages: int = 4
+  ) -> None:
+    """Initializes GoogleAnalyticsApiClient.
+
+    Args:
+      page_size: Number of rows requested in a single call to API.
+      max_parallel_pages: Max number of pages fetched in parallel.
+    """
     self._client = None
+    self.page_size = page_size
+    self.max_parallel_pages = max_parallel_pages
 
   @property
   def client(self):
@@ -59,20 +74,39 @@ class GoogleAnalyticsApiClient(api_clients.BaseClient):
     analytics_request = build_request(
       property_id=property_id, query_elements=request
     )
-    response = self.client.run_report(analytics_request)
+    limit = request.limit
+    paginator = api_clients.OffsetPaginator(
+      limit=min(limit, self.page_size) if limit else self.page_size,
+      total=lambda response: min(response.row_count, limit or math.inf),
+      max_workers=self.max_parallel_pages,
+    )
+    client = self.client
     results = []
-    dimension_headers = [header.name for header in response.dimension_headers]
-    metric_headers = [header.name for header in response.metric_headers]
-    for row in response.rows:
-      response_row: dict[str, dict[str, str]] = defaultdict(dict)
-      for value, header in zip(row.dimension_values, dimension_headers):
-        response_row[f'dimension.{header}'] = value.value
-      for value, header in zip(row.metric_values, metric_headers):
-        response_row[f'metric.{header}'] = value.value
-      results.append(response_row)
+    for response in paginator.pages(
+      lambda page_params: client.run_report(
+        RunReportRequest(analytics_request, **page_params)
+      )
+    ):
+      results.extend(_parse_rows(response))
+    if limit:
+      results = results[:limit]
     return api_clients.GarfApiResponse(results=results)
 
 
+def _parse_rows(response: RunReportResponse) -> list[dict[str, str]]:
+  dimension_headers = [header.name for header in response.dimension_headers]
+  metric_headers = [header.name for header in response.metric_headers]
+  results = []
+  for row in response.rows:
+    response_row: dict[str, dict[str, str]] = defaultdict(dict)
+    for value, header in zip(row.dimension_values, dimension_headers):
+      response_row[f'dimension.{header}'] = value.value
+    for value, header in zip(row.metric_values, metric_headers):
+      response_row[f'metric.{header}'] = value.value
+    results.append(response_row)
+  return results
+
+
 def build_request(
   property_id: str,
   query_elements: query_editor.GoogleAnalyticsApiQuery,
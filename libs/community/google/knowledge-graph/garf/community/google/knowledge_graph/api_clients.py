@@ -15,33 +15,40 @@
 
 import os
 
-import requests
 from garf.community.google.knowledge_graph import query_editor
 from garf.core import api_clients
 from typing_extensions import override
 
+_DEFAULT_ENDPOINT = 'https://kgsearch.googleapis.com/v1'
 
-class KnowledgeGraphApiClient(api_clients.BaseClient):
+
+class KnowledgeGraphApiClient(api_clients.RestApiClient):
   def __init__(
     self,
     api_key: str = os.getenv('KG_API_KEY'),
+    endpoint: str = _DEFAULT_ENDPOINT,
     **kwargs: str,
   ) -> None:
     """Initializes KnowledgeGraphApiClient."""
+    super().__init__(endpoint=endpoint, **kwargs)
     self.api_key = api_key
-    self.query_args = kwargs
 
   @override
   def get_response(
     self, request: query_editor.KnowledgeGraphApiQuery, **kwargs: str
   ) -> api_clients.GarfApiResponse:
-    service_url = 'https://kgsearch.googleapis.com/v1/entities:search'
     params = {
       request.resource_name: request.filters,
       'limit': 100,
       'key': self.api_key,
     }
-    response = requests.get(service_url, params=params)
+    response = self.session.get(
+      f'{self.endpoint}/entities:search', params=params, timeout=self.timeout
+    )
+    if response.status_code != self.OK:
+      raise api_clients.GarfApiError(
+        'Failed to get data from API, reason: ', response.text
+      )
     results = []
     for result in response.json().get('itemListElement', []):
       tmp_result = result.get('result')
@@ -194,19 +194,17 @@ class YouTubeDataApiClient(api_clients.BaseClient):
     sub_service = getattr(self.service, request.resource_name)()
     part_str = ','.join(fields)
 
-    result = self._list(sub_service, part=part_str, **api_parameters)
+    paginator = api_clients.PageTokenPaginator(items='items')
     results = []
-    if data := result.get('items'):
-      results.extend(data)
-    while result.get('nextPageToken'):
-      result = self._list(
+    for page in paginator.pages(
+      lambda page_params: self._list(
         sub_service,
         part=part_str,
-        next_page_token=result.get('nextPageToken'),
+        next_page_token=page_params.get('pageToken'),
         **api_parameters,
       )
-      if data := result.get('items'):
-        results.extend(data)
+    ):
+      results.extend(paginator.get_items(page))
 
     if not results:
       types = self.get_types(request)
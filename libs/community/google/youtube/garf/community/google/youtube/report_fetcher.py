@@ -13,11 +13,10 @@
 # limitations under the License.
 """Defines report fetcher."""
 
-import functools
 import itertools
 import logging
-import operator
 from collections.abc import Iterable, MutableSequence
+from concurrent import futures
 from typing import Final
 
 import garf.core.query_editor
@@ -30,6 +29,7 @@ from garf.community.google.youtube import (
   version,
 )
 from garf.core import parsers, report, report_fetcher
+from opentelemetry import context as otel_context
 from typing_extensions import override
 
 logger = logging.getLogger('garf.community.google.youtube.report_fetcher')
@@ -61,11 +61,21 @@ class YouTubeDataApiReportFetcher(report_fetcher.ApiReportFetcher):
       query_editor.YouTubeDataApiQuery
     ),
     builtin_queries=builtins.BUILTIN_QUERIES,
+    parallel_threshold: int = 10,
     **kwargs: str,
   ) -> None:
-    """Initializes YouTubeDataApiReportFetcher."""
+    """Initializes YouTubeDataApiReportFetcher.
+
+    Args:
+      api_client: Instantiated YouTubeDataApiClient.
+      parser: Type of parser to convert API response.
+      query_spec: Class to perform query parsing.
+      builtin_queries: Mapping between query name and built-in function.
+      parallel_threshold: Max number of requests for ids sent in parallel.
+    """
     if not api_client:
       api_client = api_clients.YouTubeDataApiClient(**kwargs)
+    self.parallel_threshold = int(parallel_threshold)
     super().__init__(api_client, parser, query_spec, builtin_queries, **kwargs)
 
   @override
@@ -76,7 +86,6 @@ class YouTubeDataApiReportFetcher(report_fetcher.ApiReportFetcher):
     title: str | None = None,
     **kwargs,
   ) -> report.GarfReport:
-    results = []
     filter_identifier = list(
       set(api_clients.ALLOWED_PARAMETERS).intersection(set(kwargs.keys()))
     )
@@ -105,27 +114,31 @@ class YouTubeDataApiReportFetcher(report_fetcher.ApiReportFetcher):
         title=title,
         **kwargs,
       )
-    if name == 'id':
-      for batch in _batched(ids, MAX_BATCH_SIZE):
-        res = super().fetch(
-          query_specification=query_specification,
-          args=args,
-          title=title,
-          **{name: batch},
-          **kwargs,
-        )
-        results.append(res)
-    else:
-      for element in ids:
-        res = super().fetch(
+    elements = list(_batched(ids, MAX_BATCH_SIZE)) if name == 'id' else ids
+    fetch = super().fetch
+    fetch_context = otel_context.get_current()
+
+    def fetch_element(element: str | list[str]) -> report.GarfReport:
+      token = otel_context.attach(fetch_context)
+      try:
+        return fetch(
           query_specification=query_specification,
           args=args,
           title=title,
           **{name: element},
           **kwargs,
         )
-        results.append(res)
-    res = functools.reduce(operator.add, results)
+      finally:
+        otel_context.detach(token)
+
+    if len(elements) > 1 and self.parallel_threshold > 1:
+      with futures.ThreadPoolExecutor(
+        max_workers=min(self.parallel_threshold, len(elements))
+      ) as executor:
+        results = list(executor.map(fetch_element, elements))
+    else:
+      results = [fetch_element(element) for element in elements]
+    res = report.GarfReport.concat(results)
     if sorts := (
       query_editor.YouTubeDataApiQuery(text=query_specification)
       .generate()
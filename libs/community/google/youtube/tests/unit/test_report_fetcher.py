@@ -24,6 +24,11 @@ class TestYouTubeDataApiReportFetcher:
   def fetcher(self):
     return YouTubeDataApiReportFetcher()
 
+  def test_init_converts_parallel_threshold_to_int(self):
+    fetcher = YouTubeDataApiReportFetcher(parallel_threshold='2')
+
+    assert fetcher.parallel_threshold == 2
+
   def test_fetch_returns_filtered_data(self, mocker, fetcher):
     query = """
       SELECT
@@ -14,7 +14,6 @@
 
 """Handles to Prometheus HTTP API querying."""
 
-import requests
 from garf.community.prometheus import exceptions, query_editor
 from garf.core import api_clients
 
@@ -38,7 +37,9 @@ class PrometheusApiClient(api_clients.RestApiClient):
   ) -> api_clients.GarfApiResponse:
     url = f'{self.endpoint}/api/v1/{request.resource_name}'
     headers = {k: v for k, v in kwargs.items() if not isinstance(v, bool)}
-    response = requests.get(url, params=request.filters, headers=headers)
+    response = self.session.get(
+      url, params=request.filters, headers=headers, timeout=self.timeout
+    )
     if response.status_code == self.OK:
       results = response.json()
       if request.resource_name == 'query_range':
@@ -23,19 +23,23 @@ import json
 import os
 import random
 import string
+import threading
 import time
-from collections.abc import Sequence
-from typing import Any, Union
+from collections.abc import Iterator, Sequence
+from concurrent import futures
+from typing import TYPE_CHECKING, Any, Callable, Union
 from urllib.parse import urlparse
 
 import pydantic
-import requests
-import smart_open
-from garf.core import exceptions, query_editor, telemetry
+from garf.core import exceptions, query_editor, rate_limiter, telemetry
 from garf.core.telemetry import tracer
+from opentelemetry import context as otel_context
 from opentelemetry import trace
 from typing_extensions import TypeAlias, override
 
+if TYPE_CHECKING:
+  import requests
+
 ApiRowElement: TypeAlias = Union[int, float, str, bool, list, dict, None]
 ApiResponseRow: TypeAlias = dict[str, ApiRowElement]
 
@@ -111,7 +115,13 @@ def _validate_endpoint_url(url: str) -> None:
 
 
 class BaseClient(abc.ABC):
-  """Base API client class."""
+  """Base API client class.
+
+  Attributes:
+    rate_limiter: Optional limiter to pace requests to API.
+  """
+
+  rate_limiter: rate_limiter.RateLimiter | None = None
 
   @tracer.start_as_current_span('call_api')
   def call_api(
@@ -119,17 +129,63 @@ class BaseClient(abc.ABC):
   ) -> GarfApiResponse:
     """Method for getting response."""
     span = trace.get_current_span()
-    response = self.get_response(request, **kwargs)
+    with self._rate_limit():
+      response = self.get_response(request, **kwargs)
     span.set_attribute('num_rows_api_response', len(response.results))
     telemetry.api_counter.add(1, {'api.client.class': self.__class__.__name__})
     return response
 
+  def call_api_stream(
+    self, request: query_editor.BaseQueryElements, **kwargs: str
+  ) -> Iterator[GarfApiResponse]:
+    """Method for getting response page by page.
+
+    Rate limiter is acquired for each page request and released before
+    the page is yielded to the consumer.
+    """
+    # Span is made current only while the page is requested, not while
+    # consumer processes a yielded page; it ends when generator is closed.
+    span = tracer.start_span('call_api_stream')
+    try:
+      with trace.use_span(span, end_on_exit=False):
+        telemetry.api_counter.add(
+          1, {'api.client.class': self.__class__.__name__}
+        )
+        responses = self.get_response_stream(request, **kwargs)
+      num_rows = 0
+      while True:
+        with trace.use_span(span, end_on_exit=False), self._rate_limit():
+          if (response := next(responses, None)) is None:
+            break
+          num_rows += len(response.results)
+        yield response
+      span.set_attribute('num_rows_api_response', num_rows)
+    finally:
+      span.end()
+
+  def _rate_limit(self) -> contextlib.AbstractContextManager[None]:
+    """Waits until request is allowed by rate limiter if it's set."""
+    if self.rate_limiter:
+      return self.rate_limiter.acquire()
+    return contextlib.nullcontext()
+
   @abc.abstractmethod
   def get_response(
     self, request: query_editor.BaseQueryElements, **kwargs: str
   ) -> GarfApiResponse:
     """Method for getting response."""
 
+  def get_response_stream(
+    self, request: query_editor.BaseQueryElements, **kwargs: str
+  ) -> Iterator[GarfApiResponse]:
+    """Method for getting response page by page.
+
+    Clients that receive data from API in pages should override this method
+    to yield each page as soon as it arrives; by default the whole response is
+    returned as a single page.
+    """
+    yield self.get_response(request, **kwargs)
+
   def get_types(
     self, request: query_editor.BaseQueryElements | None = None, **kwargs: str
   ) -> dict[str, Any]:
@@ -137,36 +193,403 @@ class BaseClient(abc.ABC):
     raise NotImplementedError
 
 
+PageField: TypeAlias = Union[str, Callable[[Any], Any]]
+
+
+class HttpPage:
+  """Single page of HTTP response.
+
+  Attributes:
+    data: Parsed JSON body of the response.
+    links: Parsed Link header of the response.
+  """
+
+  def __init__(self, response: requests.Response) -> None:
+    """Initializes HttpPage from requests.Response."""
+    self.data = response.json()
+    self.links = response.links
+
+
+def _get_field(page: Any, field: PageField | None) -> Any:
+  """Gets value from a page by dot separated path or a function."""
+  if isinstance(page, HttpPage):
+    page = page.data
+  if field is None:
+    return page
+  if callable(field):
+    return field(page)
+  for key in field.split('.'):
+    if page is None:
+      return None
+    if isinstance(page, dict):
+      page = page.get(key)
+    else:
+      page = getattr(page, key, None)
+  return page
+
+
+class Paginator(abc.ABC):
+  """Fetches all pages of a paginated API response.
+
+  Paginators request pages via `fetch_page` callable which receives
+  pagination parameters specific to a paginator and returns a page.
+
+  Attributes:
+    items: Path to (or function to get) items from a page.
+    max_pages: Max number of pages to fetch.
+  """
+
+  def __init__(
+    self, items: PageField | None = None, max_pages: int | None = None
+  ) -> None:
+    """Initializes Paginator.
+
+    Args:
+      items: Path to (or function to get) items from a page.
+      max_pages: Max number of pages to fetch.
+    """
+    self.items = items
+    self.max_pages = max_pages
+
+  def get_items(self, page: Any) -> list[Any]:
+    """Extracts items from a page."""
+    data = _get_field(page, self.items)
+    if data is None:
+      return []
+    if isinstance(data, Sequence) and not isinstance(data, (str, bytes)):
+      return list(data)
+    return [data]
+
+  @abc.abstractmethod
+  def pages(self, fetch_page: Callable[[dict[str, Any]], Any]) -> Iterator[Any]:
+    """Yields pages in order.
+
+    Args:
+      fetch_page: Function to get a page for pagination parameters.
+
+    Yields:
+      Pages of API response.
+    """
+
+
+class PageTokenPaginator(Paginator):
+  """Follows next page token returned in each page.
+
+  Attributes:
+    token_param: Request parameter to pass page token in.
+    next_token: Path to (or function to get) next page token from a page.
+  """
+
+  def __init__(
+    self,
+    token_param: str = 'pageToken',
+    next_token: PageField = 'nextPageToken',
+    **kwargs: Any,
+  ) -> None:
+    """Initializes PageTokenPaginator.
+
+    Args:
+      token_param: Request parameter to pass page token in.
+      next_token: Path to (or function to get) next page token from a page.
+      **kwargs: Arguments of Paginator.
+    """
+    super().__init__(**kwargs)
+    self.token_param = token_param
+    self.next_token = next_token
+
+  @override
+  def pages(self, fetch_page: Callable[[dict[str, Any]], Any]) -> Iterator[Any]:
+    params: dict[str, Any] = {}
+    num_pages = 0
+    while True:
+      page = fetch_page(params)
+      num_pages += 1
+      yield page
+      if self.max_pages and num_pages >= self.max_pages:
+        return
+      if not (token := _get_field(page, self.next_token)):
+        return
+      params = {self.token_param: token}
+
+
+class CursorPaginator(PageTokenPaginator):
+  """Follows cursor returned in each page."""
+
+  def __init__(
+    self,
+    cursor_param: str = 'cursor',
+    next_cursor: PageField = 'next_cursor',
+    **kwargs: Any,
+  ) -> None:
+    """Initializes CursorPaginator.
+
+    Args:
+      cursor_param: Request parameter to pass cursor in.
+      next_cursor: Path to (or function to get) next cursor from a page.
+      **kwargs: Arguments of Paginator.
+    """
+    super().__init__(token_param=cursor_param, next_token=next_cursor, **kwargs)
+
+
+class OffsetPaginator(Paginator):
+  """Requests pages by offset and limit.
+
+  When total number of items is reported by API, all pages after the first
+  one are fetched in parallel; otherwise pages are fetched until a page
+  is not full.
+
+  Attributes:
+    limit: Number of items per page.
+    offset_param: Request parameter to pass offset in.
+    limit_param: Request parameter to pass limit in.
+    total: Path to (or function to get) total number of items from a page.
+    max_workers: Max number of pages to fetch in parallel.
+  """
+
+  def __init__(
+    self,
+    limit: int = 100,
+    offset_param: str = 'offset',
+    limit_param: str = 'limit',
+    total: PageField | None = None,
+    max_workers: int = 1,
+    **kwargs: Any,
+  ) -> None:
+    """Initializes OffsetPaginator.
+
+    Args:
+      limit: Number of items per page.
+      offset_param: Request parameter to pass offset in.
+      limit_param: Request parameter to pass limit in.
+      total: Path to (or function to get) total number of items from a page.
+      max_workers: Max number of pages to fetch in parallel.
+      **kwargs: Arguments of Paginator.
+    """
+    super().__init__(**kwargs)
+    self.limit = limit
+    self.offset_param = offset_param
+    self.limit_param = limit_param
+    self.total = total
+    self.max_workers = max_workers
+
+  @override
+  def pages(self, fetch_page: Callable[[dict[str, Any]], Any]) -> Iterator[Any]:
+    page = fetch_page(self._params(0))
+    yield page
+    total = _get_field(page, self.total) if self.total else None
+    if total is not None:
+      offsets = range(self.limit, int(total), self.limit)
+      if self.max_pages:
+        offsets = offsets[: self.max_pages - 1]
+      yield from self._fetch_pages(fetch_page, offsets)
+      return
+    offset = 0
+    num_pages = 1
+    while len(self.get_items(page)) >= self.limit:
+      if self.max_pages and num_pages >= self.max_pages:
+        return
+      offset += self.limit
+      page = fetch_page(self._params(offset))
+      num_pages += 1
+      yield page
+
+  def _params(self, offset: int) -> dict[str, int]:
+    return {self.offset_param: offset, self.limit_param: self.limit}
+
+  def _fetch_pages(
+    self, fetch_page: Callable[[dict[str, Any]], Any], offsets: Sequence[int]
+  ) -> Iterator[Any]:
+    if self.max_workers <= 1 or len(offsets) <= 1:
+      for offset in offsets:
+        yield fetch_page(self._params(offset))
+      return
+    fetch_context = otel_context.get_current()
+
+    def fetch(offset: int) -> Any:
+      token = otel_context.attach(fetch_context)
+      try:
+        return fetch_page(self._params(offset))
+      finally:
+        otel_context.detach(token)
+
+    with futures.ThreadPoolExecutor(
+      max_workers=min(self.max_workers, len(offsets))
+    ) as executor:
+      yield from executor.map(fetch, offsets)
+
+
+class LinkHeaderPaginator(Paginator):
+  """Follows URL of the next page from HTTP Link header.
+
+  Attributes:
+    rel: Relation type of the next page link.
+  """
+
+  def __init__(self, rel: str = 'next', **kwargs: Any) -> None:
+    """Initializes LinkHeaderPaginator.
+
+    Args:
+      rel: Relation type of the next page link.
+      **kwargs: Arguments of Paginator.
+    """
+    super().__init__(**kwargs)
+    self.rel = rel
+
+  @override
+  def pages(self, fetch_page: Callable[[dict[str, Any]], Any]) -> Iterator[Any]:
+    params: dict[str, Any] = {}
+    num_pages = 0
+    while True:
+      page = fetch_page(params)
+      num_pages += 1
+      yield page
+      if self.max_pages and num_pages >= self.max_pages:
+        return
+      links = getattr(page, 'links', None) or {}
+      if not (url := links.get(self.rel, {}).get('url')):
+        return
+      params = {'url': url}
+
+
 class RestApiClient(BaseClient):
-  """Specifies REST client."""
+  """Specifies REST client.
+
+  Requests are sent via a pooled HTTP session which keeps connections alive
+  between calls and retries throttled (429) and failed (5xx) requests
+  with exponential backoff.
+
+  Attributes:
+    endpoint: Base URL of API.
+    timeout: Seconds to wait for connection and response.
+    pool_size: Max number of connections kept alive per host.
+    max_retries: Number of retries for throttled and failed requests.
+    backoff_factor: Base of exponential delay between retries.
+    paginator: Strategy to fetch all pages of response.
+  """
 
   OK = 200
+  RETRY_STATUSES = (429, 500, 502, 503, 504)
 
   def __init__(
-    self, endpoint: str, allow_unsafe_endpoint: bool = False, **kwargs: str
+    self,
+    endpoint: str,
+    allow_unsafe_endpoint: bool = False,
+    timeout: float | None = 60,
+    pool_size: int = 10,
+    max_retries: int = 3,
+    backoff_factor: float = 0.5,
+    paginator: Paginator | None = None,
+    **kwargs: str,
   ) -> None:
-    """Initializes RestApiClient."""
+    """Initializes RestApiClient.
+
+    Args:
+      endpoint: Base URL of API.
+      allow_unsafe_endpoint: Whether to skip validation of endpoint.
+      timeout: Seconds to wait for connection and response.
+      pool_size: Max number of connections kept alive per host.
+      max_retries: Number of retries for throttled and failed requests.
+      backoff_factor: Base of exponential delay between retries.
+      paginator: Strategy to fetch all pages of response.
+    """
     if not allow_unsafe_endpoint:
       _validate_endpoint_url(endpoint)
     self.endpoint = endpoint
+    self.allow_unsafe_endpoint = allow_unsafe_endpoint
+    self.timeout = timeout
+    self.pool_size = pool_size
+    self.max_retries = max_retries
+    self.backoff_factor = backoff_factor
+    self.paginator = paginator
     self.query_args = kwargs
+    self._session = None
+    self._session_lock = threading.Lock()
+
+  @property
+  def session(self) -> requests.Session:
+    """HTTP session shared by all requests of the client."""
+    if self._session is None:
+      with self._session_lock:
+        if self._session is None:
+          self._session = self._create_session()
+    return self._session
+
+  def _create_session(self) -> requests.Session:
+    import requests
+    from requests.adapters import HTTPAdapter
+    from urllib3.util.retry import Retry
+
+    retry = Retry(
+      total=self.max_retries,
+      backoff_factor=self.backoff_factor,
+      status_forcelist=self.RETRY_STATUSES,
+      respect_retry_after_header=True,
+      raise_on_status=False,
+    )
+    adapter = HTTPAdapter(
+      pool_connections=self.pool_size,
+      pool_maxsize=self.pool_size,
+      max_retries=retry,
+    )
+    session = requests.Session()
+    session.mount('http://', adapter)
+    session.mount('https://', adapter)
+    return session
+
+  def close(self) -> None:
+    """Closes pooled connections."""
+    if self._session is not None:
+      self._session.close()
+      self._session = None
 
   @override
   def get_response(
     self, request: query_editor.BaseQueryElements, **kwargs: str
   ) -> GarfApiResponse:
-    url = f'{self.endpoint}/{request.resource_name}'
-    params = {}
-    for param in request.filters:
-      key, value = param.split('=')
-      params[key.strip()] = value.strip()
+    if not self.paginator:
+      page = self._fetch_page(request, {}, **kwargs)
+      results = page.data if isinstance(page.data, list) else [page.data]
+      return GarfApiResponse(results=results)
+    results = []
+    for response in self.get_response_stream(request, **kwargs):
+      results.extend(response.results)
+    return GarfApiResponse(results=results)
+
+  @override
+  def get_response_stream(
+    self, request: query_editor.BaseQueryElements, **kwargs: str
+  ) -> Iterator[GarfApiResponse]:
+    if not self.paginator:
+      yield self.get_response(request, **kwargs)
+      return
+    for page in self.paginator.pages(
+      lambda page_params: self._fetch_page(request, page_params, **kwargs)
+    ):
+      yield GarfApiResponse(results=self.paginator.get_items(page))
+
+  def _fetch_page(
+    self,
+    request: query_editor.BaseQueryElements,
+    page_params: dict[str, Any],
+    **kwargs: str,
+  ) -> HttpPage:
     headers = {k: v for k, v in kwargs.items() if not isinstance(v, bool)}
-    response = requests.get(url, params=params, headers=headers)
+    if url := page_params.get('url'):
+      if not self.allow_unsafe_endpoint:
+        _validate_endpoint_url(url)
+      params = None
+    else:
+      url = f'{self.endpoint}/{request.resource_name}'
+      params = {}
+      for param in request.filters:
+        key, value = param.split('=')
+        params[key.strip()] = value.strip()
+      params.update(page_params)
+    response = self.session.get(
+      url, params=params, headers=headers, timeout=self.timeout
+    )
     if response.status_code == self.OK:
-      results = response.json()
-      if not isinstance(results, list):
-        results = [results]
-      return GarfApiResponse(results=results)
+      return HttpPage(response)
     raise GarfApiError('Failed to get data from API, reason: ', response.text)
 
 
@@ -176,6 +599,7 @@ class FakeApiClientOptions(pydantic.BaseModel):
   n_rows: int = 0
   delay_seconds: float = 0.0
   failure_rate: float = 0.0
+  page_size: int = 0
 
 
 class FakeApiClient(BaseClient):
@@ -230,6 +654,20 @@ class FakeApiClient(BaseClient):
       results=results, results_placeholder=results_placeholder
     )
 
+  @override
+  def get_response_stream(
+    self, request: query_editor.BaseQueryElements | None = None, **kwargs: str
+  ) -> Iterator[GarfApiResponse]:
+    response = self.get_response(request, **kwargs)
+    if not (page_size := self.options.page_size) or not response:
+      yield response
+      return
+    for i in range(0, len(response.results), page_size):
+      yield GarfApiResponse(
+        results=response.results[i : i + page_size],
+        results_placeholder=response.results_placeholder,
+      )
+
   def _convert_request(self, request: query_editor.BaseQueryElements):
     characters = string.ascii_letters + string.digits
     conversion_rules = {
@@ -296,6 +734,8 @@ class FakeApiClient(BaseClient):
     Raises:
       GarfApiError: When file with data not found.
     """
+    import smart_open
+
     try:
       with smart_open.open(file_location, 'r', encoding='utf-8') as f:
         data = json.load(f)
@@ -318,6 +758,8 @@ class FakeApiClient(BaseClient):
     Raises:
       GarfApiError: When file with data not found.
     """
+    import smart_open
+
     try:
       with smart_open.open(file_location, 'r', encoding='utf-8') as f:
         reader = csv.DictReader(f)
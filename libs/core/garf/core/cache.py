@@ -16,30 +16,78 @@
 
 from __future__ import annotations
 
+import collections
+import contextlib
+import copy
+import dataclasses
 import datetime
 import hashlib
+import importlib.util
 import json
 import logging
+import math
 import os
 import pathlib
 import shutil
-from typing import Final
+import sys
+import threading
+import time
+import uuid
+from typing import TYPE_CHECKING, Final, Iterator, Literal
 
-import redis
-import smart_open
 from garf.core import exceptions, query_editor, report
+from opentelemetry import metrics
+
+if TYPE_CHECKING:
+  import redis
 
 logger = logging.getLogger(__name__)
+meter = metrics.get_meter('garf.core')
+
+memory_cache_hits_counter = meter.create_counter(
+  'garf_memory_cache_hits', description='Reports loaded from memory cache'
+)
+memory_cache_misses_counter = meter.create_counter(
+  'garf_memory_cache_misses', description='Reports not found in memory cache'
+)
+memory_cache_evictions_counter = meter.create_counter(
+  'garf_memory_cache_evictions',
+  description='Reports evicted from memory cache',
+)
 
 
 class GarfCacheFileNotFoundError(exceptions.GarfError):
   """Exception for not found cached report."""
 
 
+def _default_serialization() -> str:
+  if importlib.util.find_spec('pyarrow'):
+    return 'arrow'
+  return 'json'
+
+
+CacheSerialization = Literal['json', 'arrow']
+
+
 DEFAULT_CACHE_LOCATION: Final[str] = os.getenv(
   'GARF_CACHE_LOCATION', str(pathlib.Path.home() / '.garf/cache/')
 )
 DEFAULT_CACHE_TTL: Final[int] = os.getenv('GARF_CACHE_TTL_SECONDS', 3600)
+DEFAULT_CACHE_SERIALIZATION: Final[str] = os.getenv(
+  'GARF_CACHE_SERIALIZATION', _default_serialization()
+)
+DEFAULT_CACHE_COMPRESSION: Final[str | None] = (
+  os.getenv('GARF_CACHE_COMPRESSION', 'zstd') or None
+)
+DEFAULT_CACHE_LOCK_TIMEOUT: Final[int] = int(
+  os.getenv('GARF_CACHE_LOCK_TIMEOUT_SECONDS', 600)
+)
+DEFAULT_MEMORY_CACHE_MAX_ENTRIES: Final[int] = int(
+  os.getenv('GARF_MEMORY_CACHE_MAX_ENTRIES', 128)
+)
+DEFAULT_MEMORY_CACHE_MAX_BYTES: Final[int] = int(
+  os.getenv('GARF_MEMORY_CACHE_MAX_BYTES', 256 * 1024 * 1024)
+)
 
 
 class GarfCache:
@@ -50,6 +98,9 @@ class GarfCache:
     location: str | None = None,
     ttl_seconds: int = DEFAULT_CACHE_TTL,
     cache_provider=None,
+    enable_memory_cache: bool = True,
+    serialization: CacheSerialization = DEFAULT_CACHE_SERIALIZATION,
+    compression: str | None = DEFAULT_CACHE_COMPRESSION,
   ) -> None:
     """Initializes new cache.
 
@@ -57,15 +108,30 @@ class GarfCache:
       location: Cache location.
       ttl_seconds: Maximum lifespan of cached objects.
       cache_provider: Instantiated cache provider.
+      enable_memory_cache: Whether to keep recently used reports in memory.
+      serialization: Format of stored reports (json or arrow).
+      compression: Compression codec for arrow serialization (zstd or lz4).
     """
     self.location = location or DEFAULT_CACHE_LOCATION
     self.ttl_seconds = int(ttl_seconds)
     if cache_provider:
       self.cache_provider = cache_provider
     elif str(self.location).startswith('redis'):
-      self.cache_provider = RedisGarfCache(self.location, self.ttl_seconds)
+      self.cache_provider = RedisGarfCache(
+        self.location,
+        self.ttl_seconds,
+        serialization=serialization,
+        compression=compression,
+      )
     else:
-      self.cache_provider = FileGarfCache(self.location, self.ttl_seconds)
+      self.cache_provider = FileGarfCache(
+        self.location,
+        self.ttl_seconds,
+        serialization=serialization,
+        compression=compression,
+      )
+    if enable_memory_cache:
+      self.cache_provider = InMemoryGarfCache(self.cache_provider)
 
   def load(
     self, query: query_editor.BaseQueryElements, args=None, kwargs=None
@@ -83,15 +149,7 @@ class GarfCache:
     Raises:
       GarfCacheFileNotFoundError: If cached report not found
     """
-    args_hash = args.hash if args else ''
-    kwargs_hash = (
-      hashlib.md5(
-        json.dumps(kwargs).encode('utf-8'), usedforsecurity=False
-      ).hexdigest()
-      if kwargs
-      else ''
-    )
-    hash_identifier = f'{query.hash}:{args_hash}:{kwargs_hash}'
+    hash_identifier = _hash_identifier(query, args, kwargs)
     return self.cache_provider.load(hash_identifier, query)
 
   def save(
@@ -109,23 +167,333 @@ class GarfCache:
       args: Query parameters.
       kwargs: Optional keyword arguments.
     """
-    args_hash = args.hash if args else ''
-    kwargs_hash = (
-      hashlib.md5(
-        json.dumps(kwargs).encode('utf-8'), usedforsecurity=False
-      ).hexdigest()
-      if kwargs
-      else ''
-    )
-    hash_identifier = f'{query.hash}:{args_hash}:{kwargs_hash}'
+    hash_identifier = _hash_identifier(query, args, kwargs)
     result = self.cache_provider.save(fetched_report, hash_identifier)
     logger.info('Report is saved to cache: %s', result)
 
+  @contextlib.contextmanager
+  def lock(
+    self,
+    query: query_editor.BaseQueryElements,
+    args=None,
+    kwargs=None,
+    timeout: int = DEFAULT_CACHE_LOCK_TIMEOUT,
+  ) -> Iterator[None]:
+    """Ensures that only one caller generates report for a query at a time.
+
+    Callers within a process are serialized with a lock per query, callers
+    from different processes rely on the lock of cache provider (if any).
+    When lock cannot be acquired within timeout caller proceeds without it.
+
+    Args:
+      query: Query elements.
+      args: Query parameters.
+      kwargs: Optional keyword arguments.
+      timeout: Maximum number of seconds to wait for the lock.
+    """
+    hash_identifier = _hash_identifier(query, args, kwargs)
+    provider = self.cache_provider
+    key = f'{type(provider).__name__}:{provider.location}:{hash_identifier}'
+    with _process_locks.acquire(key, timeout):
+      if provider_lock := getattr(provider, 'lock', None):
+        with provider_lock(hash_identifier, timeout):
+          yield
+      else:
+        yield
+
   @property
   def size(self) -> int:
     return 0
 
 
+def _hash_identifier(
+  query: query_editor.BaseQueryElements, args=None, kwargs=None
+) -> str:
+  """Builds unique identifier of a query with its parameters."""
+  args_hash = args.hash if args else ''
+  kwargs_hash = (
+    hashlib.md5(
+      json.dumps(kwargs).encode('utf-8'), usedforsecurity=False
+    ).hexdigest()
+    if kwargs
+    else ''
+  )
+  return f'{query.hash}:{args_hash}:{kwargs_hash}'
+
+
+class _KeyedLocks:
+  """Thread locks created on demand for each key."""
+
+  def __init__(self) -> None:
+    self._locks: dict[str, list[threading.Lock | int]] = {}
+    self._lock = threading.Lock()
+
+  @contextlib.contextmanager
+  def acquire(self, key: str, timeout: int) -> Iterator[None]:
+    with self._lock:
+      lock_with_waiters = self._locks.setdefault(key, [threading.Lock(), 0])
+      lock_with_waiters[1] += 1
+    lock = lock_with_waiters[0]
+    acquired = lock.acquire(timeout=timeout)
+    if not acquired:
+      logger.warning('Failed to acquire cache lock %s in %d s', key, timeout)
+    try:
+      yield
+    finally:
+      if acquired:
+        lock.release()
+      with self._lock:
+        lock_with_waiters[1] -= 1
+        if not lock_with_waiters[1]:
+          del self._locks[key]
+
+
+_process_locks = _KeyedLocks()
+
+
+@dataclasses.dataclass
+class MemoryCacheStats:
+  """Usage statistics of memory cache.
+
+  Attributes:
+    hits: Number of reports loaded from memory.
+    misses: Number of lookups not found in memory.
+    evictions: Number of reports removed to keep cache within limits.
+    entries: Number of reports currently in memory.
+    size: Estimated size of reports currently in memory in bytes.
+  """
+
+  hits: int = 0
+  misses: int = 0
+  evictions: int = 0
+  entries: int = 0
+  size: int = 0
+
+
+@dataclasses.dataclass
+class _MemoryCacheEntry:
+  report: report.GarfReport
+  size: int
+  expires_at: float
+
+
+class MemoryCache:
+  """Thread-safe LRU storage of reports bounded by number of entries and size.
+
+  Attributes:
+    max_entries: Maximum number of reports stored in memory.
+    max_bytes: Maximum estimated size of reports stored in memory.
+  """
+
+  def __init__(
+    self,
+    max_entries: int = DEFAULT_MEMORY_CACHE_MAX_ENTRIES,
+    max_bytes: int = DEFAULT_MEMORY_CACHE_MAX_BYTES,
+  ) -> None:
+    """Initializes MemoryCache.
+
+    Args:
+      max_entries: Maximum number of reports stored in memory.
+      max_bytes: Maximum estimated size of reports stored in memory.
+    """
+    self.max_entries = max_entries
+    self.max_bytes = max_bytes
+    self._entries: collections.OrderedDict[str, _MemoryCacheEntry] = (
+      collections.OrderedDict()
+    )
+    self._size = 0
+    self._hits = 0
+    self._misses = 0
+    self._evictions = 0
+    self._lock = threading.Lock()
+
+  def get(self, key: str) -> report.GarfReport | None:
+    """Returns copy of a stored report or None if report is missing."""
+    with self._lock:
+      entry = self._entries.get(key)
+      if entry and entry.expires_at <= time.time():
+        self._remove(key)
+        entry = None
+      if not entry:
+        self._misses += 1
+        memory_cache_misses_counter.add(1)
+        return None
+      self._entries.move_to_end(key)
+      self._hits += 1
+    memory_cache_hits_counter.add(1)
+    return _copy_report(entry.report)
+
+  def put(
+    self, key: str, cached_report: report.GarfReport, expires_at: float
+  ) -> None:
+    """Stores copy of a report until expiration timestamp."""
+    size = _estimate_report_size(cached_report)
+    if size > self.max_bytes or not self.max_entries:
+      return
+    entry = _MemoryCacheEntry(_copy_report(cached_report), size, expires_at)
+    evictions = 0
+    with self._lock:
+      if key in self._entries:
+        self._remove(key)
+      self._entries[key] = entry
+      self._size += size
+      while (
+        len(self._entries) > self.max_entries or self._size > self.max_bytes
+      ):
+        self._remove(next(iter(self._entries)))
+        evictions += 1
+      self._evictions += evictions
+    if evictions:
+      memory_cache_evictions_counter.add(evictions)
+
+  def clear(self) -> None:
+    """Removes all reports and resets statistics."""
+    with self._lock:
+      self._entries.clear()
+      self._size = 0
+      self._hits = 0
+      self._misses = 0
+      self._evictions = 0
+
+  @property
+  def stats(self) -> MemoryCacheStats:
+    with self._lock:
+      return MemoryCacheStats(
+        hits=self._hits,
+        misses=self._misses,
+        evictions=self._evictions,
+        entries=len(self._entries),
+        size=self._size,
+      )
+
+  def _remove(self, key: str) -> None:
+    self._size -= self._entries.pop(key).size
+
+
+memory_cache = MemoryCache()
+
+
+class InMemoryGarfCache:
+  """Serves reports from process memory before reaching cache provider.
+
+  Memory storage is shared by all instances so reports saved by one fetcher
+  are available to other fetchers using the same cache provider location.
+
+  Attributes:
+    cache_provider: Cache provider used when report is not found in memory.
+    storage: Memory storage of reports.
+  """
+
+  def __init__(
+    self,
+    cache_provider: FileGarfCache | RedisGarfCache,
+    storage: MemoryCache | None = None,
+  ) -> None:
+    """Initializes InMemoryGarfCache.
+
+    Args:
+      cache_provider: Cache provider used when report is not found in memory.
+      storage: Memory storage of reports, process-wide one by default.
+    """
+    self.cache_provider = cache_provider
+    self.storage = storage or memory_cache
+
+  @property
+  def location(self):
+    return self.cache_provider.location
+
+  @property
+  def ttl_seconds(self) -> int:
+    return self.cache_provider.ttl_seconds
+
+  def load(self, hash_identifier: str, query) -> report.GarfReport:
+    """Loads report from memory or cache provider.
+
+    Args:
+      hash_identifier: Unique identifier of a query.
+
+    Returns:
+      Cached report.
+
+    Raises:
+      GarfCacheFileNotFoundError: If cached report not found
+    """
+    key = self._key(hash_identifier)
+    if (cached_report := self.storage.get(key)) is not None:
+      logger.debug('Report is loaded from cache memory: %s', hash_identifier)
+      cached_report.query_specification = query
+      return cached_report
+    loaded_report = self.cache_provider.load(hash_identifier, query)
+    if expires_at := getattr(self.cache_provider, 'expires_at', None):
+      expiration = expires_at(hash_identifier)
+    else:
+      expiration = time.time() + int(self.ttl_seconds)
+    self.storage.put(key, loaded_report, expiration)
+    return loaded_report
+
+  def save(
+    self, fetched_report: report.GarfReport, hash_identifier: str
+  ) -> str:
+    """Saves report to memory and cache provider.
+
+    Args:
+      fetched_report: Report to save.
+      hash_identifier: Unique identifier of a query.
+    """
+    result = self.cache_provider.save(fetched_report, hash_identifier)
+    self.storage.put(
+      self._key(hash_identifier),
+      fetched_report,
+      time.time() + int(self.ttl_seconds),
+    )
+    return result
+
+  def clean(self) -> None:
+    """Removes all cached reports from memory and cache provider."""
+    self.storage.clear()
+    self.cache_provider.clean()
+
+  def __getattr__(self, attr: str):
+    if attr == 'cache_provider':
+      raise AttributeError(attr)
+    return getattr(self.cache_provider, attr)
+
+  def _key(self, hash_identifier: str) -> str:
+    provider = self.cache_provider
+    return f'{type(provider).__name__}:{provider.location}:{hash_identifier}'
+
+
+def _copy_report(cached_report: report.GarfReport) -> report.GarfReport:
+  """Copies report so changes to it do not affect stored report."""
+  if cached_report.is_columnar:
+    return report.GarfReport.from_arrow(
+      cached_report.to_arrow(), cached_report.query_specification
+    )
+  return report.GarfReport(
+    results=[
+      [
+        copy.deepcopy(value) if isinstance(value, (list, dict)) else value
+        for value in row
+      ]
+      for row in cached_report.results
+    ],
+    column_names=list(cached_report.column_names),
+    results_placeholder=copy.deepcopy(cached_report.results_placeholder),
+    query_specification=cached_report.query_specification,
+    auto_convert_to_scalars=cached_report.auto_convert_to_scalars,
+  )
+
+
+def _estimate_report_size(cached_report: report.GarfReport) -> int:
+  """Approximates memory used by report data in bytes."""
+  if cached_report.is_columnar:
+    return cached_report.to_arrow().nbytes
+  size = sys.getsizeof(cached_report.results)
+  for row in cached_report.results:
+    size += sys.getsizeof(row) + sum(sys.getsizeof(value) for value in row)
+  return size
+
+
 class RedisGarfCache:
   """Stores and loads reports from Redis."""
 
@@ -134,12 +502,21 @@ class RedisGarfCache:
     location: str | None = None,
     ttl_seconds: int = DEFAULT_CACHE_TTL,
     redis_client: redis.Redis | None = None,
+    serialization: CacheSerialization = DEFAULT_CACHE_SERIALIZATION,
+    compression: str | None = DEFAULT_CACHE_COMPRESSION,
   ) -> None:
     self.location = location or DEFAULT_CACHE_LOCATION
-    self.r = redis_client or redis.Redis.from_url(
-      self.location, decode_responses=True
-    )
+    if not redis_client:
+      import redis
+
+      redis_client = redis.Redis.from_url(self.location)
+    self.r = redis_client
     self.ttl_seconds = ttl_seconds
+    if serialization != 'json' and self.r.get_encoder().decode_responses:
+      logger.debug('Redis client decodes responses, using json serialization')
+      serialization = 'json'
+    self.serialization = serialization
+    self.compression = compression
 
   def load(self, hash_identifier: str, query) -> report.GarfReport:
     """Loads report from cache based on query definition.
@@ -156,9 +533,7 @@ class RedisGarfCache:
     if not (data := self.r.get(hash_identifier)):
       raise GarfCacheFileNotFoundError
     logger.debug('Report is loaded from cache: %s', str(hash_identifier))
-    loaded_report = report.GarfReport.from_json(data)
-    loaded_report.query_specification = query
-    return loaded_report
+    return _deserialize_report(data, query)
 
   def save(
     self,
@@ -171,11 +546,47 @@ class RedisGarfCache:
       fetched_report: Report to save.
       hash_identifier: Unique identifier of a query.
     """
-    data = json.dumps(fetched_report.to_list(row_type='dict'))
+    data, _ = _serialize_report(
+      fetched_report, self.serialization, self.compression
+    )
     self.r.set(hash_identifier, data, ex=self.ttl_seconds)
     logger.info('Report is saved to cache: %s', str(hash_identifier))
     return hash_identifier
 
+  @contextlib.contextmanager
+  def lock(self, hash_identifier: str, timeout: int) -> Iterator[None]:
+    """Holds Redis lock key while report for a query is generated.
+
+    Args:
+      hash_identifier: Unique identifier of a query.
+      timeout: Maximum number of seconds to wait for and hold the lock.
+    """
+    lock_key = f'{hash_identifier}:lock'
+    token = uuid.uuid4().hex
+    deadline = time.time() + timeout
+    while not (
+      acquired := self.r.set(lock_key, token, nx=True, ex=max(timeout, 1))
+    ):
+      if time.time() > deadline:
+        logger.warning('Failed to acquire cache lock %s', lock_key)
+        break
+      time.sleep(_LOCK_POLL_INTERVAL)
+    try:
+      yield
+    finally:
+      if acquired and (holder := self.r.get(lock_key)) is not None:
+        if isinstance(holder, bytes):
+          holder = holder.decode('utf-8')
+        if holder == token:
+          self.r.delete(lock_key)
+
+  def expires_at(self, hash_identifier: str) -> float:
+    """Returns timestamp when cached report is removed from Redis."""
+    ttl = self.r.ttl(hash_identifier)
+    if ttl is None or ttl < 0:
+      ttl = self.ttl_seconds
+    return time.time() + int(ttl)
+
 
 class FileGarfCache:
   """Stores and loads reports from remote or local file storage.
@@ -188,6 +599,8 @@ class FileGarfCache:
     self,
     location: str | None = None,
     ttl_seconds: int = DEFAULT_CACHE_TTL,
+    serialization: CacheSerialization = DEFAULT_CACHE_SERIALIZATION,
+    compression: str | None = DEFAULT_CACHE_COMPRESSION,
   ) -> None:
     location = location or DEFAULT_CACHE_LOCATION
     if '://' in str(location):
@@ -197,6 +610,8 @@ class FileGarfCache:
       self.location = pathlib.Path(location)
       self.type = 'local'
     self.ttl_seconds = ttl_seconds
+    self.serialization = serialization
+    self.compression = compression
 
   @property
   def max_cache_timestamp(self) -> float:
@@ -216,29 +631,29 @@ class FileGarfCache:
     Raises:
       GarfCacheFileNotFoundError: If cached report not found
     """
-    if self.type == 'local':
-      cached_path = self.location / f'{hash_identifier}.json'
-    else:
-      cached_path = f'{self.location}/{hash_identifier}.json'
-    if (
-      self.type == 'local'
-      and cached_path.exists()
-      and cached_path.stat().st_ctime > self.max_cache_timestamp
-    ):
-      with smart_open.open(cached_path, 'r', encoding='utf-8') as f:
-        data = json.load(f)
-    elif self.type == 'remote':
-      try:
-        with smart_open.open(cached_path, 'r', encoding='utf-8') as f:
-          data = json.load(f)
-      except Exception as e:
-        raise GarfCacheFileNotFoundError from e
+    import smart_open
+
+    for extension in _CACHE_FILE_EXTENSIONS:
+      cached_path = self._cached_path(hash_identifier, extension)
+      if self.type == 'local':
+        if (
+          cached_path.exists()
+          and cached_path.stat().st_ctime > self.max_cache_timestamp
+        ):
+          with smart_open.open(cached_path, 'rb') as f:
+            data = f.read()
+          break
+      else:
+        try:
+          with smart_open.open(cached_path, 'rb') as f:
+            data = f.read()
+          break
+        except Exception:
+          continue
     else:
       raise GarfCacheFileNotFoundError
     logger.debug('Report is loaded from cache: %s', str(cached_path))
-    loaded_report = report.GarfReport.from_json(json.dumps(data))
-    loaded_report.query_specification = query
-    return loaded_report
+    return _deserialize_report(data, query)
 
   def save(
     self, fetched_report: report.GarfReport, hash_identifier: str
@@ -249,17 +664,81 @@ class FileGarfCache:
       fetched_report: Report to save.
       hash_identifier: Unique identifier of a query.
     """
+    import smart_open
+
     if self.type == 'local':
       self.location.mkdir(parents=True, exist_ok=True)
-    if self.type == 'local':
-      cached_path = self.location / f'{hash_identifier}.json'
-    else:
-      cached_path = f'{self.location}/{hash_identifier}.json'
-    with smart_open.open(str(cached_path), 'w', encoding='utf-8') as f:
-      json.dump(fetched_report.to_list(row_type='dict'), f)
+    data, extension = _serialize_report(
+      fetched_report, self.serialization, self.compression
+    )
+    cached_path = self._cached_path(hash_identifier, extension)
+    if isinstance(data, str):
+      data = data.encode('utf-8')
+    with smart_open.open(str(cached_path), 'wb') as f:
+      f.write(data)
+    for other_extension in _CACHE_FILE_EXTENSIONS:
+      if other_extension != extension and self.type == 'local':
+        self._cached_path(hash_identifier, other_extension).unlink(
+          missing_ok=True
+        )
     logger.info('Report is saved to cache: %s', str(cached_path))
     return str(cached_path)
 
+  @contextlib.contextmanager
+  def lock(self, hash_identifier: str, timeout: int) -> Iterator[None]:
+    """Holds lock file while report for a query is generated.
+
+    Lock files older than timeout are considered abandoned and removed.
+    Remote storages are not locked.
+
+    Args:
+      hash_identifier: Unique identifier of a query.
+      timeout: Maximum number of seconds to wait for and hold the lock.
+    """
+    if self.type == 'remote':
+      yield
+      return
+    self.location.mkdir(parents=True, exist_ok=True)
+    lock_path = self._cached_path(hash_identifier, 'lock')
+    deadline = time.time() + timeout
+    acquired = False
+    while not acquired:
+      try:
+        os.close(os.open(lock_path, os.O_CREAT | os.O_EXCL | os.O_WRONLY))
+        acquired = True
+      except FileExistsError:
+        with contextlib.suppress(FileNotFoundError):
+          if lock_path.stat().st_mtime < time.time() - timeout:
+            logger.warning('Removing abandoned cache lock %s', lock_path)
+            lock_path.unlink(missing_ok=True)
+            continue
+        if time.time() > deadline:
+          logger.warning('Failed to acquire cache lock %s', lock_path)
+          break
+        time.sleep(_LOCK_POLL_INTERVAL)
+    try:
+      yield
+    finally:
+      if acquired:
+        lock_path.unlink(missing_ok=True)
+
+  def _cached_path(
+    self, hash_identifier: str, extension: str
+  ) -> str | pathlib.Path:
+    if self.type == 'local':
+      return self.location / f'{hash_identifier}.{extension}'
+    return f'{self.location}/{hash_identifier}.{extension}'
+
+  def expires_at(self, hash_identifier: str) -> float:
+    """Returns timestamp when cached report becomes outdated."""
+    if self.type == 'remote':
+      return time.time() + int(self.ttl_seconds)
+    for extension in _CACHE_FILE_EXTENSIONS:
+      cached_path = self._cached_path(hash_identifier, extension)
+      if cached_path.exists():
+        return cached_path.stat().st_ctime + int(self.ttl_seconds)
+    return time.time()
+
   @property
   def size(self) -> int:
     total_size = 0
@@ -297,9 +776,10 @@ class FileGarfCache:
     prune_date = datetime.datetime.now(
       datetime.timezone.utc
     ) - datetime.timedelta(days=ttl)
-    for file_path in self.location.rglob('*.json'):
+    for file_path in self.location.rglob('*'):
       if (
-        file_path.is_file()
+        file_path.suffix[1:] in _CACHE_FILE_EXTENSIONS
+        and file_path.is_file()
         and datetime.datetime.fromtimestamp(
           file_path.stat().st_mtime, datetime.timezone.utc
         )
@@ -308,3 +788,106 @@ class FileGarfCache:
         pruned_file_size += os.path.getsize(file_path)
         file_path.unlink()
     return pruned_file_size
+
+
+_CACHE_FILE_EXTENSIONS: Final[tuple[str, ...]] = ('arrow', 'json')
+_ARROW_STREAM_MARKER: Final[bytes] = b'\xff\xff\xff\xff'
+_LOCK_POLL_INTERVAL: Final[float] = 0.1
+
+
+def _serialize_report(
+  fetched_report: report.GarfReport,
+  serialization: CacheSerialization,
+  compression: str | None = None,
+) -> tuple[bytes | str, str]:
+  """Converts report to data stored in cache.
+
+  Arrow serialization stores report as an Arrow IPC stream with optional
+  compression. Reports which cannot be represented as Arrow table without
+  losing data or changing types of values (i.e. too large integers or
+  integers mixed with floats in a column) are stored as JSON.
+
+  Args:
+    fetched_report: Report to serialize.
+    serialization: Preferred serialization format.
+    compression: Compression codec for arrow serialization.
+
+  Returns:
+    Serialized report and its format.
+  """
+  if serialization == 'arrow':
+    import pyarrow as pa
+
+    try:
+      table = fetched_report.to_arrow()
+    except Exception as e:
+      logger.debug('Report cannot be converted to Arrow: %s', e)
+      table = None
+    if table is not None and _is_lossless(fetched_report, table):
+      if compression and not pa.Codec.is_available(compression):
+        logger.warning('Compression %s is not available', compression)
+        compression = None
+      sink = pa.BufferOutputStream()
+      options = pa.ipc.IpcWriteOptions(compression=compression)
+      with pa.ipc.new_stream(sink, table.schema, options=options) as writer:
+        writer.write_table(table)
+      return sink.getvalue().to_pybytes(), 'arrow'
+  return json.dumps(fetched_report.to_list(row_type='dict')), 'json'
+
+
+def _deserialize_report(
+  data: bytes | str, query: query_editor.BaseQueryElements
+) -> report.GarfReport:
+  """Restores report from data stored in cache."""
+  if isinstance(data, bytes) and data.startswith(_ARROW_STREAM_MARKER):
+    import pyarrow as pa
+
+    return report.GarfReport.from_arrow(
+      pa.ipc.open_stream(data).read_all(), query_specification=query
+    )
+  if isinstance(data, bytes):
+    data = data.decode('utf-8')
+  loaded_report = report.GarfReport.from_json(data)
+  loaded_report.query_specification = query
+  return loaded_report
+
+
+def _is_lossless(fetched_report: report.GarfReport, table) -> bool:
+  """Checks whether report is restored from Arrow table without changes."""
+  if any(_has_struct(field.type) for field in table.schema):
+    return False
+  if fetched_report.is_columnar:
+    return True
+  restored_rows = zip(*(column.to_pylist() for column in table.columns))
+  return all(
+    _is_same_value(list(row), list(restored_row))
+    for row, restored_row in zip(fetched_report.results, restored_rows)
+  )
+
+
+def _is_same_value(value, restored_value) -> bool:
+  """Compares values including their types, NaN is equal to NaN."""
+  if type(value) is not type(restored_value):
+    return False
+  if isinstance(value, list):
+    return len(value) == len(restored_value) and all(
+      map(_is_same_value, value, restored_value)
+    )
+  if isinstance(value, float) and math.isnan(value):
+    return math.isnan(restored_value)
+  return value == restored_value
+
+
+def _has_struct(data_type) -> bool:
+  """Checks whether Arrow type contains struct converted from dictionaries.
+
+  Dictionaries with different keys are merged into single struct so such
+  values are not restored as is.
+  """
+  import pyarrow as pa
+
+  if pa.types.is_struct(data_type):
+    return True
+  if pa.types.is_list(data_type) or pa.types.is_large_list(data_type):
+    return _has_struct(data_type.value_type)
+  return False
@@ -0,0 +1,171 @@
+# Copyright 2026 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Limits number of concurrently running tasks based on API feedback."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from collections.abc import Awaitable
+from typing import Callable, TypeVar
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar('T')
+
+_OVERLOAD_STATUS_CODES = frozenset({429, 500, 502, 503, 504})
+_OVERLOAD_STATUS_NAMES = frozenset(
+  {'RESOURCE_EXHAUSTED', 'UNAVAILABLE', 'INTERNAL', 'DEADLINE_EXCEEDED'}
+)
+
+
+def is_overload_error(error: BaseException) -> bool:
+  """Checks whether error signals that API is throttling or overloaded.
+
+  Quota (429 / RESOURCE_EXHAUSTED) and server side (5xx / UNAVAILABLE)
+  errors are searched in the error and all errors that caused it.
+
+  Args:
+    error: Exception raised by a task.
+
+  Returns:
+    Whether concurrency should be reduced.
+  """
+  while error:
+    for status in _get_statuses(error):
+      if status in _OVERLOAD_STATUS_CODES or status in _OVERLOAD_STATUS_NAMES:
+        return True
+    error = error.__cause__ or error.__context__
+  return False
+
+
+def _get_statuses(error: BaseException) -> list[int | str]:
+  """Extracts HTTP status codes and gRPC status names from error."""
+  statuses = []
+  if (response := getattr(error, 'response', None)) is not None:
+    statuses.append(getattr(response, 'status_code', None))
+  statuses.append(getattr(error, 'status_code', None))
+  code = getattr(error, 'code', None)
+  if (grpc_error := getattr(error, 'error', None)) and callable(
+    getattr(grpc_error, 'code', None)
+  ):
+    code = grpc_error.code
+  if callable(code):
+    try:
+      code = code()
+    except Exception:
+      code = None
+  statuses.append(getattr(code, 'name', code))
+  return [status for status in statuses if status is not None]
+
+
+class AdaptiveLimiter:
+  """Limits concurrency of tasks with AIMD (additive increase / mult. decrease).
+
+  Limit grows by one after a full window of healthy tasks (successful and
+  not slower than `latency_tolerance` times the fastest observed one) and is
+  multiplied by `backoff_ratio` when a task fails with an overload error.
+  Failures of tasks started before the last decrease are ignored so a burst
+  of failures shrinks the limit only once.
+
+  Attributes:
+    min_limit: Lowest number of concurrent tasks.
+    max_limit: Highest number of concurrent tasks.
+    backoff_ratio: Multiplier applied to limit on overload errors.
+    latency_tolerance: Max ratio of task latency to the fastest one.
+    is_overload: Function to identify overload errors.
+  """
+
+  def __init__(
+    self,
+    initial_limit: int = 10,
+    min_limit: int = 1,
+    max_limit: int | None = None,
+    backoff_ratio: float = 0.5,
+    latency_tolerance: float = 2.0,
+    is_overload: Callable[[BaseException], bool] = is_overload_error,
+  ) -> None:
+    """Initializes AdaptiveLimiter.
+
+    Args:
+      initial_limit: Number of concurrent tasks to start with.
+      min_limit: Lowest number of concurrent tasks.
+      max_limit: Highest number of concurrent tasks, 4x initial by default.
+      backoff_ratio: Multiplier applied to limit on overload errors.
+      latency_tolerance: Max ratio of task latency to the fastest one.
+      is_overload: Function to identify overload errors.
+    """
+    self.min_limit = max(min_limit, 1)
+    self.max_limit = max(max_limit or initial_limit * 4, self.min_limit)
+    self.backoff_ratio = backoff_ratio
+    self.latency_tolerance = latency_tolerance
+    self.is_overload = is_overload
+    self._limit = float(min(max(initial_limit, self.min_limit), self.max_limit))
+    self._in_flight = 0
+    self._min_latency: float | None = None
+    self._last_decrease = float('-inf')
+    self._condition: asyncio.Condition | None = None
+
+  @property
+  def limit(self) -> int:
+    """Current number of allowed concurrent tasks."""
+    return int(self._limit)
+
+  async def run(self, task: Awaitable[T]) -> T:
+    """Runs task once there is a free slot and adjusts limit by its outcome.
+
+    Args:
+      task: Awaitable to execute.
+
+    Returns:
+      Result of the task.
+    """
+    if self._condition is None:
+      self._condition = asyncio.Condition()
+    async with self._condition:
+      await self._condition.wait_for(lambda: self._in_flight < self.limit)
+      self._in_flight += 1
+    start_time = time.monotonic()
+    try:
+      result = await task
+    except Exception as e:
+      self.on_error(e, start_time)
+      raise
+    else:
+      self.on_success(time.monotonic() - start_time)
+      return result
+    finally:
+      async with self._condition:
+        self._in_flight -= 1
+        self._condition.notify_all()
+
+  def on_success(self, latency: float) -> None:
+    """Increases limit after a healthy task."""
+    if self._min_latency is None or latency < self._min_latency:
+      self._min_latency = latency
+    if latency > self._min_latency * self.latency_tolerance:
+      return
+    self._limit = min(self._limit + 1 / self._limit, self.max_limit)
+
+  def on_error(self, error: BaseException, start_time: float) -> None:
+    """Decreases limit when task failed due to API overload."""
+    if not self.is_overload(error) or start_time < self._last_decrease:
+      return
+    self._limit = max(self._limit * self.backoff_ratio, self.min_limit)
+    self._last_decrease = time.monotonic()
+    logger.warning(
+      'API is overloaded, reducing concurrency to %d: %s', self.limit, error
+    )
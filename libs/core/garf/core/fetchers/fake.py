@@ -37,6 +37,7 @@ logger = logging.getLogger(__name__)
 class FakeApiReportFetcher(report_fetcher.ApiReportFetcher):
   """Returns simulated data."""
 
+  alias = 'fake'
   version: str = version.__version__
 
   def __init__(
@@ -39,6 +39,7 @@ class RestApiReportFetcher(report_fetcher.ApiReportFetcher):
     parser: Type of parser to convert API response.
   """
 
+  alias = 'rest'
   version: str = version.__version__
 
   def __init__(
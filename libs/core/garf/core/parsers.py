@@ -21,8 +21,8 @@ import contextlib
 import functools
 import logging
 import operator
-from collections.abc import Mapping, MutableSequence
-from typing import Any
+from collections.abc import Mapping, MutableSequence, Sequence
+from typing import Callable
 
 from garf.core import (
   api_clients,
@@ -31,6 +31,7 @@ from garf.core import (
   query_parser,
 )
 from garf.core.telemetry import tracer
+from typing_extensions import TypeAlias
 
 logger = logging.getLogger(__name__)
 
@@ -43,8 +44,128 @@ VALID_VIRTUAL_COLUMN_OPERATORS = (
 )
 
 
+RowElementGetter: TypeAlias = Callable[
+  [api_clients.ApiResponseRow], api_clients.ApiRowElement
+]
+
+
+class VirtualColumnExpression:
+  """Expression of virtual column compiled to a code object.
+
+  Fields of virtual column become variables of the expression so it's parsed,
+  validated and compiled once and then evaluated for each row.
+
+  Attributes:
+    variables: Names of variables in the expression for each field.
+    code: Compiled expression or None if expression contains invalid operators.
+  """
+
+  def __init__(self, fields: Sequence[str], substitute_expression: str) -> None:
+    """Compiles expression.
+
+    Args:
+      fields: Fields participating in calculations.
+      substitute_expression: Expression with placeholder for each field.
+
+    Raises:
+      SyntaxError: If expression cannot be parsed.
+    """
+    self.variables = [f'_field_{i}' for i in range(len(fields))]
+    expression = substitute_expression
+    for field, variable in zip(fields, self.variables):
+      expression = expression.replace(
+        f'{{{field.replace(".", "_")}}}', variable
+      )
+    tree = ast.parse(expression, mode='eval')
+    valid = all(
+      isinstance(node, VALID_VIRTUAL_COLUMN_OPERATORS)
+      or (isinstance(node, ast.Name) and node.id in self.variables)
+      or isinstance(node, ast.Load)
+      for node in ast.walk(tree)
+    )
+    self.code = compile(tree, filename='', mode='eval') if valid else None
+
+  @classmethod
+  def from_virtual_column(
+    cls, virtual_column: query_parser.VirtualColumn
+  ) -> VirtualColumnExpression:
+    """Gets compiled expression for a virtual column."""
+    return _compile_virtual_column_expression(
+      tuple(virtual_column.fields), virtual_column.substitute_expression
+    )
+
+  def evaluate(
+    self, values: Sequence[api_clients.ApiRowElement]
+  ) -> api_clients.ApiRowElement:
+    """Evaluates expression for values of fields.
+
+    Values are treated as literals of the expression, so numeric strings
+    are used as numbers while any other non-numeric values make expression
+    invalid. If values cannot be used with expression operators they are
+    converted to strings (i.e. for concatenation).
+
+    Args:
+      values: Value for each field of the expression.
+
+    Returns:
+      Result of the expression, 0 when division by zero occurred or None
+      if expression is invalid.
+    """
+    if self.code is None:
+      return None
+    try:
+      literals = [_to_literal(value) for value in values]
+    except ValueError:
+      return None
+    try:
+      return self._evaluate(literals)
+    except TypeError:
+      return self._evaluate([str(value) for value in values])
+
+  def _evaluate(
+    self, values: Sequence[api_clients.ApiRowElement]
+  ) -> api_clients.ApiRowElement:
+    try:
+      return eval(
+        self.code, {'__builtins__': None}, dict(zip(self.variables, values))
+      )
+    except ZeroDivisionError:
+      return 0
+
+
+@functools.lru_cache(maxsize=1024)
+def _compile_virtual_column_expression(
+  fields: tuple[str, ...], substitute_expression: str
+) -> VirtualColumnExpression:
+  return VirtualColumnExpression(fields, substitute_expression)
+
+
+def _to_literal(value: api_clients.ApiRowElement) -> api_clients.ApiRowElement:
+  """Converts value to a constant it represents in the expression.
+
+  Raises:
+    ValueError: If value is not a constant.
+  """
+  if value is None or type(value) in (int, float, bool):
+    return value
+  value = str(value)
+  with contextlib.suppress(ValueError):
+    return int(value)
+  try:
+    node = ast.parse(value.strip(), mode='eval').body
+  except SyntaxError as e:
+    raise ValueError(value) from e
+  if not isinstance(node, ast.Constant):
+    raise ValueError(value)
+  return node.value
+
+
 class BaseParser(abc.ABC):
-  """An interface for all parsers to implement."""
+  """An interface for all parsers to implement.
+
+  Parser compiles a parsing plan - a getter for each column of the query -
+  once and applies it to every row of the response.
+  """
 
   def __init__(
     self, query_specification: query_editor.BaseQueryElements, **kwargs: str
@@ -62,72 +183,96 @@ class BaseParser(abc.ABC):
       if not response.results:
         span.set_attribute('num_results', 0)
         return [[]]
-      results = []
-      for result in response.results:
-        results.append(self.parse_row(result))
+      parse_row = self.parse_row
+      results = [parse_row(result) for result in response.results]
       span.set_attribute('num_results', len(results))
       return results
 
+  @functools.cached_property
+  def parsing_plan(self) -> list[RowElementGetter]:
+    """Getters for each column in the query in order of column_names."""
+    plan = []
+    fields = self.query_spec.fields
+    index = 0
+    for column in self.query_spec.column_names:
+      if column == '_':
+        index += 1
+        continue
+      if virtual_column := self.query_spec.virtual_columns.get(column):
+        plan.append(self.compile_virtual_column(virtual_column))
+      elif customizer := self.query_spec.customizers.get(column):
+        plan.append(self.compile_customizer(customizer, fields[index]))
+        index += 1
+      else:
+        plan.append(self.compile_row_element_getter(fields[index]))
+        index += 1
+    return plan
+
+  def compile_row_element_getter(self, key: str) -> RowElementGetter:
+    """Builds a function to get a single element from a row by key."""
+    return functools.partial(self.parse_row_element, key=key)
+
+  def compile_virtual_column(
+    self, virtual_column: query_parser.VirtualColumn
+  ) -> RowElementGetter:
+    """Builds a function to calculate virtual column for a row."""
+    if _is_overridden(self, BaseParser, 'process_virtual_column'):
+      return functools.partial(
+        self.process_virtual_column, virtual_column=virtual_column
+      )
+    value = virtual_column.value
+    if virtual_column.type == 'built-in':
+      return lambda row: value
+    try:
+      expression = VirtualColumnExpression.from_virtual_column(virtual_column)
+    except SyntaxError:
+      return lambda row: value
+    getters = [
+      self.compile_row_element_getter(field) for field in virtual_column.fields
+    ]
+    evaluate = expression.evaluate
+    return lambda row: evaluate([getter(row) for getter in getters])
+
+  def compile_customizer(
+    self, customizer: query_parser.Customizer, field: str
+  ) -> RowElementGetter:
+    """Builds a function to apply customizer to a field of a row."""
+    if _is_overridden(self, BaseParser, 'process_customizer'):
+      return functools.partial(
+        self.process_customizer, customizer=customizer, field=field
+      )
+    if customizer.type == 'slice':
+      return functools.partial(
+        self._process_customizer_slice, customizer=customizer, field=field
+      )
+    if customizer.type == 'nested_field':
+      return functools.partial(
+        self._process_nested_field, customizer=customizer, field=field
+      )
+    if customizer.type == 'resource_index':
+      return functools.partial(
+        self._process_resource_index, customizer=customizer, field=field
+      )
+    return lambda row: row
+
   @abc.abstractmethod
   def get_row_element(self, row, key):
     """Defines how to get a single element from a row."""
 
-  def _evalute_virtual_column(
-    self,
-    fields: list[str],
-    virtual_column_values: dict[str, Any],
-    substitute_expression: str,
-  ) -> api_clients.ApiRowElement:
-    virtual_column_replacements = {
-      field.replace('.', '_'): value
-      for field, value in zip(fields, virtual_column_values)
-    }
-    virtual_column_expression = substitute_expression.format(
-      **virtual_column_replacements
-    )
-    try:
-      tree = ast.parse(virtual_column_expression, mode='eval')
-      valid = all(
-        isinstance(node, VALID_VIRTUAL_COLUMN_OPERATORS)
-        for node in ast.walk(tree)
-      )
-      if valid:
-        return eval(
-          compile(tree, filename='', mode='eval'), {'__builtins__': None}
-        )
-    except ZeroDivisionError:
-      return 0
-    return None
-
   def process_virtual_column(
     self,
     row: api_clients.ApiResponseRow,
-    virtual_column: query_editor.VirtualColumn,
+    virtual_column: query_parser.VirtualColumn,
   ) -> api_clients.ApiRowElement:
     if virtual_column.type == 'built-in':
       return virtual_column.value
-    virtual_column_values = [
-      self.parse_row_element(row, field) for field in virtual_column.fields
-    ]
     try:
-      result = self._evalute_virtual_column(
-        virtual_column.fields,
-        virtual_column_values,
-        virtual_column.substitute_expression,
-      )
-    except TypeError:
-      virtual_column_values = [
-        f"'{self.parse_row_element(row, field)}'"
-        for field in virtual_column.fields
-      ]
-      result = self._evalute_virtual_column(
-        virtual_column.fields,
-        virtual_column_values,
-        virtual_column.substitute_expression,
-      )
+      expression = VirtualColumnExpression.from_virtual_column(virtual_column)
     except SyntaxError:
       return virtual_column.value
-    return result
+    return expression.evaluate(
+      [self.parse_row_element(row, field) for field in virtual_column.fields]
+    )
 
   def process_customizer(
     self,
@@ -153,18 +298,16 @@ class BaseParser(abc.ABC):
 
   def _process_nested_field(self, row, customizer, field):
     nested_field = self.get_row_element(row, field)
-    values_ = str(customizer.value).split('.')
-    if len(values_) > 1:
-      new_customizer = query_parser.Customizer(
-        type='nested_field', value='.'.join(values_[1:])
-      )
-      return self._process_nested_field(
-        row=nested_field, customizer=new_customizer, field=values_[0]
-      )
+    *parent_fields, value = str(customizer.value).split('.')
+    for parent_field in parent_fields:
+      row = nested_field
+      nested_field = self.get_row_element(row, parent_field)
+    if not parent_fields:
+      value = customizer.value
     if isinstance(nested_field, MutableSequence):
       results = []
       for f in nested_field:
-        result = self.parse_row_element(f, customizer.value)
+        result = self.parse_row_element(f, value)
         if result:
           if isinstance(result, MutableSequence):
             for r in result:
@@ -174,10 +317,10 @@ class BaseParser(abc.ABC):
             results.append(result)
       return results
     try:
-      return self.parse_row_element(nested_field, customizer.value)
+      return self.parse_row_element(nested_field, value)
     except (query_parser.GarfFieldError, AttributeError) as e:
       raise query_parser.GarfCustomizerError(
-        f'nested field {customizer.value} is missing in row {row}'
+        f'nested field {value} is missing in row {row}'
       ) from e
 
   def _process_resource_index(self, row, customizer, field):
@@ -205,23 +348,7 @@ class BaseParser(abc.ABC):
     row: api_clients.ApiResponseRow,
   ) -> list[api_clients.ApiRowElement]:
     """Parses single row from response."""
-    results = []
-    fields = self.query_spec.fields
-    index = 0
-    for column in self.query_spec.column_names:
-      if column == '_':
-        index += 1
-        continue
-      if virtual_column := self.query_spec.virtual_columns.get(column):
-        result = self.process_virtual_column(row, virtual_column)
-      elif customizer := self.query_spec.customizers.get(column):
-        result = self.process_customizer(row, customizer, fields[index])
-        index += 1
-      else:
-        result = self.parse_row_element(row, fields[index])
-        index += 1
-      results.append(result)
-    return results
+    return [getter(row) for getter in self.parsing_plan]
 
   @abc.abstractmethod
   def parse_row_element(
@@ -251,6 +378,26 @@ class DictParser(BaseParser):
     except (TypeError, KeyError):
       return None
 
+  def compile_row_element_getter(self, key: str) -> RowElementGetter:
+    """Builds a function to get nested element from a dict by key."""
+    if _is_overridden(self, DictParser, 'parse_row_element', 'get_row_element'):
+      return super().compile_row_element_getter(key)
+    path = key.split('.')
+
+    def getter(row):
+      if type(row) is not dict and not isinstance(row, Mapping):
+        raise GarfParserError
+      if (result := row.get(key)) is not None:
+        return result
+      try:
+        for element in path:
+          row = row[element]
+      except (TypeError, KeyError):
+        return None
+      return row
+
+    return getter
+
 
 class NumericConverterDictParser(DictParser):
   """Extracts nested dict elements with numerical conversions."""
@@ -282,6 +429,33 @@ class NumericConverterDictParser(DictParser):
     except KeyError:
       return None
 
+  def compile_row_element_getter(self, key: str) -> RowElementGetter:
+    """Builds a function to get nested element with int/float conversion."""
+    if _is_overridden(
+      self,
+      NumericConverterDictParser,
+      'parse_row_element',
+      'get_row_element',
+      '_convert_field',
+    ):
+      return functools.partial(self.parse_row_element, key=key)
+    path = key.split('.')
+    convert_field = self._convert_field
+
+    def getter(row):
+      if result := row.get(key):
+        return convert_field(result)
+      try:
+        for element in path:
+          row = row[element]
+      except KeyError:
+        return None
+      if isinstance(row, MutableSequence) or row in (True, False):
+        return row
+      return convert_field(row)
+
+    return getter
+
 
 class ProtoParser(BaseParser):
   """Extracts attribute from Protobuf messages."""
@@ -301,6 +475,33 @@ class ProtoParser(BaseParser):
         f'field {key} is missing in row {row}'
       ) from e
 
+  def compile_row_element_getter(self, key: str) -> RowElementGetter:
+    """Builds a function to get nested attribute from a Protobuf message."""
+    if _is_overridden(
+      self, ProtoParser, 'parse_row_element', 'get_row_element'
+    ):
+      return super().compile_row_element_getter(key)
+    attribute_getter = operator.attrgetter(key)
+
+    def getter(row):
+      try:
+        return attribute_getter(row)
+      except AttributeError as e:
+        raise query_parser.GarfFieldError(
+          f'field {key} is missing in row {row}'
+        ) from e
+
+    return getter
+
 
 class GarfParserError(exceptions.GarfError):
   """Incorrect data format for parser."""
+
+
+def _is_overridden(parser: BaseParser, base: type[BaseParser], *methods: str):
+  """Checks whether any of base class methods are overridden by parser."""
+  parser_class = type(parser)
+  return any(
+    getattr(parser_class, method) is not getattr(base, method)
+    for method in methods
+  )
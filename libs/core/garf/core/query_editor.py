@@ -15,12 +15,15 @@
 
 from __future__ import annotations
 
+import collections
+import copy
 import datetime
 import hashlib
 import json
 import logging
 import re
-from typing import Generator, Union
+import threading
+from typing import Any, Generator, Union
 
 import jinja2
 import pydantic
@@ -128,6 +131,43 @@ class BaseQueryElements(pydantic.BaseModel):
     ).hexdigest()
 
 
+class _QueryCache:
+  """Thread-safe LRU cache of query specifications state after generation."""
+
+  def __init__(self, maxsize: int = 1024) -> None:
+    self.maxsize = maxsize
+    self._queries: collections.OrderedDict[tuple, dict[str, Any]] = (
+      collections.OrderedDict()
+    )
+    self._lock = threading.Lock()
+
+  def get(self, key: tuple) -> dict[str, Any] | None:
+    with self._lock:
+      if (state := self._queries.get(key)) is not None:
+        self._queries.move_to_end(key)
+      return state
+
+  def put(self, key: tuple, state: dict[str, Any]) -> None:
+    with self._lock:
+      self._queries[key] = state
+      self._queries.move_to_end(key)
+      while len(self._queries) > self.maxsize:
+        self._queries.popitem(last=False)
+
+  def clear(self) -> None:
+    with self._lock:
+      self._queries.clear()
+
+
+_QUERY_CACHE = _QueryCache()
+_TEMPLATE_DEPENDENCY = re.compile(r'{%-?\s*(include|import|extends|from)\b')
+
+
+def clear_query_cache() -> None:
+  """Removes all memoized query elements."""
+  _QUERY_CACHE.clear()
+
+
 class CommonParametersMixin:
   """Helper mixin to inject set of common parameters to all queries."""
 
@@ -213,6 +253,52 @@ class QuerySpecification(CommonParametersMixin):
     return common_params
 
   def generate(self) -> BaseQueryElements:
+    """Parses query text into query elements.
+
+    Results are memoized per query text, title and parameters so repeated
+    generation of the same query skips parsing; on a hit the whole state of
+    query specification after generation is restored and each call gets
+    its own copy of query elements.
+    """
+    cache_key = self._cache_key
+    if cache_key and (state := _QUERY_CACHE.get(cache_key)) is not None:
+      self.__dict__.update(copy.deepcopy(state))
+      return self.query
+    query = self._generate()
+    if cache_key:
+      _QUERY_CACHE.put(cache_key, copy.deepcopy(self.__dict__))
+    return query
+
+  @property
+  def _cache_key(self) -> tuple | None:
+    """Identifies query elements generated from the query.
+
+    Includes current date since common parameters and date macros are
+    resolved to actual dates. Queries including other templates are not
+    memoized since content of included files is not part of the key.
+    """
+    if _TEMPLATE_DEPENDENCY.search(self.query.text):
+      return None
+    try:
+      args_hash = self.args.hash
+    except TypeError:
+      return None
+    current_datetime = (
+      self.common_params.get('current_datetime')
+      if 'current_datetime' in self.query.text
+      else None
+    )
+    return (
+      type(self),
+      self.query.text,
+      self.query.title,
+      args_hash,
+      self.unsafe_macro,
+      datetime.date.today(),
+      current_datetime,
+    )
+
+  def _generate(self) -> BaseQueryElements:
     self.remove_comments().expand()
     self.extract_resource_name()
     (
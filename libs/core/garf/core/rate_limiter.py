@@ -0,0 +1,404 @@
+# Copyright 2026 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Paces requests to APIs to stay within their quotas.
+
+Limits are defined per fetcher alias either programmatically via
+`set_rate_limit` or with `GARF_RATE_LIMITS` environment variable containing
+JSON mapping between alias and limits, i.e.
+`{"youtube-data-api": {"requests_per_second": 5, "daily_quota": 10000}}`.
+
+State of limiters is kept in memory (shared between threads) or,
+when `GARF_RATE_LIMITER_LOCATION` points to a folder or Redis instance,
+shared between processes.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import datetime
+import json
+import logging
+import os
+import pathlib
+import threading
+import time
+import uuid
+from collections.abc import Iterator
+from typing import TYPE_CHECKING, Any, Callable, Final, TypeVar, Union
+
+import pydantic
+from garf.core import exceptions, telemetry
+
+if TYPE_CHECKING:
+  import redis
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar('T')
+
+DEFAULT_RATE_LIMITER_LOCATION: Final[str | None] = (
+  os.getenv('GARF_RATE_LIMITER_LOCATION') or None
+)
+_POLL_INTERVAL: Final[float] = 0.05
+_STATE_LOCK_TIMEOUT: Final[int] = 10
+
+
+class RateLimitExceededError(exceptions.GarfError):
+  """Raised when daily quota of an API is exhausted."""
+
+
+class RateLimit(pydantic.BaseModel):
+  """Limits for requests to a single API.
+
+  Attributes:
+    requests_per_second: Average number of requests per second.
+    burst: Max number of requests sent at once, defaults to requests_per_second.
+    max_concurrency: Max number of requests in flight.
+    daily_quota: Number of quota units available per day (UTC).
+    quota_cost: Quota units consumed by a single request.
+    slot_timeout: Seconds after which unreleased concurrency slot expires.
+  """
+
+  model_config = pydantic.ConfigDict(extra='forbid')
+
+  requests_per_second: float | None = pydantic.Field(default=None, gt=0)
+  burst: int | None = pydantic.Field(default=None, gt=0)
+  max_concurrency: int | None = pydantic.Field(default=None, gt=0)
+  daily_quota: int | None = pydantic.Field(default=None, gt=0)
+  quota_cost: int = 1
+  slot_timeout: int = 600
+
+  def __bool__(self) -> bool:
+    return bool(
+      self.requests_per_second or self.max_concurrency or self.daily_quota
+    )
+
+
+class MemoryRateLimiterStorage:
+  """Keeps state of rate limiters in memory of the current process."""
+
+  def __init__(self) -> None:
+    self._states: dict[str, dict[str, Any]] = {}
+    self._lock = threading.Lock()
+
+  def update(self, key: str, fn: Callable[[dict[str, Any]], T]) -> T:
+    """Atomically modifies state of a rate limiter.
+
+    Args:
+      key: Identifier of a rate limiter.
+      fn: Function that modifies state in place.
+
+    Returns:
+      Result of a function.
+    """
+    with self._lock:
+      return fn(self._states.setdefault(key, {}))
+
+
+class FileRateLimiterStorage:
+  """Keeps state of rate limiters in local files shared between processes.
+
+  Attributes:
+    location: Folder where state files are stored.
+  """
+
+  def __init__(self, location: str | os.PathLike[str]) -> None:
+    self.location = pathlib.Path(location)
+    self._lock = threading.Lock()
+
+  def update(self, key: str, fn: Callable[[dict[str, Any]], T]) -> T:
+    """Atomically modifies state of a rate limiter.
+
+    Args:
+      key: Identifier of a rate limiter.
+      fn: Function that modifies state in place.
+
+    Returns:
+      Result of a function.
+    """
+    self.location.mkdir(parents=True, exist_ok=True)
+    state_path = self.location / f'{key}.json'
+    lock_path = self.location / f'{key}.lock'
+    with self._lock:
+      while True:
+        try:
+          os.close(os.open(lock_path, os.O_CREAT | os.O_EXCL | os.O_WRONLY))
+          break
+        except FileExistsError:
+          with contextlib.suppress(FileNotFoundError):
+            if lock_path.stat().st_mtime < time.time() - _STATE_LOCK_TIMEOUT:
+              logger.warning('Removing abandoned rate limiter lock %s', key)
+              lock_path.unlink(missing_ok=True)
+              continue
+          time.sleep(_POLL_INTERVAL / 10)
+      try:
+        try:
+          state = json.loads(state_path.read_text(encoding='utf-8'))
+        except (FileNotFoundError, json.JSONDecodeError):
+          state = {}
+        result = fn(state)
+        tmp_path = state_path.with_suffix(f'.{uuid.uuid4().hex}.tmp')
+        tmp_path.write_text(json.dumps(state), encoding='utf-8')
+        os.replace(tmp_path, state_path)
+        return result
+      finally:
+        lock_path.unlink(missing_ok=True)
+
+
+class RedisRateLimiterStorage:
+  """Keeps state of rate limiters in Redis shared between processes."""
+
+  def __init__(
+    self,
+    location: str | None = None,
+    redis_client: redis.Redis | None = None,
+  ) -> None:
+    if not redis_client:
+      import redis
+
+      redis_client = redis.Redis.from_url(location)
+    self.r = redis_client
+
+  def update(self, key: str, fn: Callable[[dict[str, Any]], T]) -> T:
+    """Atomically modifies state of a rate limiter.
+
+    Args:
+      key: Identifier of a rate limiter.
+      fn: Function that modifies state in place.
+
+    Returns:
+      Result of a function.
+    """
+    import redis
+
+    redis_key = f'garf:rate_limit:{key}'
+    with self.r.pipeline() as pipe:
+      while True:
+        try:
+          pipe.watch(redis_key)
+          data = pipe.get(redis_key)
+          state = json.loads(data) if data else {}
+          result = fn(state)
+          pipe.multi()
+          pipe.set(redis_key, json.dumps(state), ex=2 * 24 * 3600)
+          pipe.execute()
+          return result
+        except redis.WatchError:
+          continue
+
+
+RateLimiterStorage = Union[
+  MemoryRateLimiterStorage, FileRateLimiterStorage, RedisRateLimiterStorage
+]
+
+
+def create_storage(location: str | None = None) -> RateLimiterStorage:
+  """Creates storage for rate limiters state based on its location.
+
+  Args:
+    location: Folder or Redis URL; state is kept in memory if omitted.
+
+  Returns:
+    Storage for rate limiter state.
+  """
+  if not location:
+    return MemoryRateLimiterStorage()
+  if str(location).startswith('redis'):
+    return RedisRateLimiterStorage(location)
+  return FileRateLimiterStorage(location)
+
+
+class RateLimiter:
+  """Paces requests to an API with token bucket, concurrency and quota limits.
+
+  Attributes:
+    name: Identifier of the limiter, usually fetcher alias.
+    rate_limit: Limits to enforce.
+    storage: Place where state of the limiter is stored.
+  """
+
+  def __init__(
+    self,
+    name: str,
+    rate_limit: RateLimit,
+    storage: RateLimiterStorage | None = None,
+  ) -> None:
+    """Initializes RateLimiter.
+
+    Args:
+      name: Identifier of the limiter, usually fetcher alias.
+      rate_limit: Limits to enforce.
+      storage: Place where state of the limiter is stored.
+    """
+    self.name = name
+    self.rate_limit = rate_limit
+    self.storage = storage or MemoryRateLimiterStorage()
+
+  @contextlib.contextmanager
+  def acquire(self) -> Iterator[None]:
+    """Blocks until request can be sent and holds concurrency slot.
+
+    Raises:
+      RateLimitExceededError: When daily quota is exhausted.
+    """
+    start_time = time.monotonic()
+    slot = self._acquire_slot() if self.rate_limit.max_concurrency else None
+    try:
+      if self.rate_limit.daily_quota:
+        self._consume_quota()
+      if self.rate_limit.requests_per_second:
+        self._acquire_token()
+      if (waited := time.monotonic() - start_time) > _POLL_INTERVAL:
+        logger.debug('Request to %s was delayed by %.2fs', self.name, waited)
+      telemetry.rate_limit_wait_histogram.record(
+        waited, {'garf.rate_limiter': self.name}
+      )
+      yield
+    finally:
+      if slot:
+        self.storage.update(self.name, lambda state: _release(state, slot))
+
+  def _acquire_slot(self) -> str:
+    slot = uuid.uuid4().hex
+    max_concurrency = self.rate_limit.max_concurrency
+    slot_timeout = self.rate_limit.slot_timeout
+
+    def occupy(state: dict[str, Any]) -> bool:
+      now = time.time()
+      slots = {
+        key: expires_at
+        for key, expires_at in state.get('slots', {}).items()
+        if expires_at > now
+      }
+      acquired = len(slots) < max_concurrency
+      if acquired:
+        slots[slot] = now + slot_timeout
+      state['slots'] = slots
+      return acquired
+
+    while not self.storage.update(self.name, occupy):
+      time.sleep(_POLL_INTERVAL)
+    return slot
+
+  def _acquire_token(self) -> None:
+    rate = self.rate_limit.requests_per_second
+    burst = self.rate_limit.burst or max(int(rate), 1)
+
+    def take(state: dict[str, Any]) -> float:
+      now = time.time()
+      tokens = state.get('tokens', burst)
+      elapsed = max(now - state.get('updated_at', now), 0)
+      tokens = min(tokens + elapsed * rate, burst)
+      state['updated_at'] = now
+      if tokens >= 1:
+        state['tokens'] = tokens - 1
+        return 0
+      state['tokens'] = tokens
+      return (1 - tokens) / rate
+
+    while wait := self.storage.update(self.name, take):
+      time.sleep(wait)
+
+  def _consume_quota(self) -> None:
+    daily_quota = self.rate_limit.daily_quota
+    cost = self.rate_limit.quota_cost
+
+    def consume(state: dict[str, Any]) -> bool:
+      today = datetime.datetime.now(datetime.timezone.utc).date().isoformat()
+      if state.get('quota_day') != today:
+        state['quota_day'] = today
+        state['quota_used'] = 0
+      if state['quota_used'] + cost > daily_quota:
+        return False
+      state['quota_used'] += cost
+      return True
+
+    if not self.storage.update(self.name, consume):
+      raise RateLimitExceededError(
+        f'Daily quota of {daily_quota} units for {self.name} is exhausted'
+      )
+
+
+def _release(state: dict[str, Any], slot: str) -> None:
+  state.get('slots', {}).pop(slot, None)
+
+
+_RATE_LIMITERS: dict[str, RateLimiter | None] = {}
+_RATE_LIMITERS_LOCK = threading.Lock()
+
+
+def set_rate_limit(
+  alias: str,
+  rate_limit: RateLimit | dict[str, Any] | None,
+  location: str | None = DEFAULT_RATE_LIMITER_LOCATION,
+) -> RateLimiter | None:
+  """Registers rate limiter shared by all API clients of a fetcher.
+
+  Args:
+    alias: Fetcher alias.
+    rate_limit: Limits to enforce, None to remove existing limiter.
+    location: Folder or Redis URL to store limiter state in.
+
+  Returns:
+    Registered rate limiter.
+  """
+  if isinstance(rate_limit, dict):
+    rate_limit = RateLimit(**rate_limit)
+  limiter = (
+    RateLimiter(alias, rate_limit, create_storage(location))
+    if rate_limit
+    else None
+  )
+  with _RATE_LIMITERS_LOCK:
+    _RATE_LIMITERS[alias] = limiter
+  return limiter
+
+
+def get_rate_limiter(alias: str | None) -> RateLimiter | None:
+  """Returns rate limiter registered for a fetcher alias.
+
+  Limiters not registered via `set_rate_limit` are created from
+  `GARF_RATE_LIMITS` environment variable.
+
+  Args:
+    alias: Fetcher alias.
+
+  Returns:
+    Rate limiter if any limits are defined for the alias.
+  """
+  if not alias:
+    return None
+  with _RATE_LIMITERS_LOCK:
+    if alias in _RATE_LIMITERS:
+      return _RATE_LIMITERS[alias]
+  rate_limit = _load_rate_limits().get(alias)
+  return set_rate_limit(alias, rate_limit)
+
+
+def clear_rate_limiters() -> None:
+  """Removes all registered rate limiters."""
+  with _RATE_LIMITERS_LOCK:
+    _RATE_LIMITERS.clear()
+
+
+def _load_rate_limits() -> dict[str, dict[str, Any]]:
+  if not (rate_limits := os.getenv('GARF_RATE_LIMITS')):
+    return {}
+  try:
+    return json.loads(rate_limits)
+  except json.JSONDecodeError as e:
+    raise exceptions.GarfError(
+      f'GARF_RATE_LIMITS is not a valid JSON: {rate_limits}'
+    ) from e
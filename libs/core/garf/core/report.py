@@ -18,10 +18,15 @@ Module exposes two classes:
       for iteration, slicing and converting to/from common structures.
     * GarfRow - helper class for dealing with iteration over each response
       row in GarfReport.
+
+GarfReport can be backed either by nested lists or by an Apache Arrow table
+(see `GarfReport.from_arrow`). In the latter case row-major `results` are built
+only when they are accessed, conversions to pandas / polars are zero-copy.
 """
 
 from __future__ import annotations
 
+import contextlib
 import itertools
 import json
 import warnings
@@ -41,6 +46,7 @@ class GarfReport:
       results_placeholder: Optional placeholder values for missing results.
       query_specification: Specification used to get data from API.
       auto_convert_to_scalars: Whether to simplify slicing operations.
+      is_columnar: Whether report data is stored as an Arrow table.
   """
 
   def __init__(
@@ -61,8 +67,9 @@ class GarfReport:
       query_specification: Specification used to get data from Ads API.
       auto_convert_to_scalars: Whether to simplify slicing operations.
     """
-    self.results = results or []
-    self.column_names = column_names or []
+    self._table = None
+    self._results = results or []
+    self._column_names = column_names or []
     self._multi_column_report = len(column_names) > 1 if column_names else False
     if results_placeholder:
       self.results_placeholder = list(results_placeholder)
@@ -71,6 +78,54 @@ class GarfReport:
     self.query_specification = query_specification
     self.auto_convert_to_scalars = auto_convert_to_scalars
 
+  @property
+  def results(self) -> list[list[api_clients.ApiRowElement]]:
+    """Data of the report in a form of nested list.
+
+    For Arrow backed reports rows are materialized on the first access; since
+    rows can be modified in place afterwards the report stops using the table.
+    """
+    self.materialize()
+    return self._results
+
+  @results.setter
+  def results(
+    self, results: Sequence[Sequence[api_clients.ApiRowElement]] | None
+  ) -> None:
+    self._table = None
+    self._results = results or []
+
+  @property
+  def column_names(self) -> list[str]:
+    """Names of columns in the report."""
+    return self._column_names
+
+  @column_names.setter
+  def column_names(self, column_names: Sequence[str] | None) -> None:
+    column_names = column_names or []
+    if self._table is not None:
+      if len(column_names) == len(self._table.schema):
+        self._table = self._table.rename_columns(list(column_names))
+      else:
+        self._results = _table_to_rows(self._table)
+        self._table = None
+    self._column_names = column_names
+
+  @property
+  def is_columnar(self) -> bool:
+    """Whether report data is stored as an Arrow table."""
+    return self._table is not None
+
+  def materialize(self) -> None:
+    """Converts Arrow table of the report to rows.
+
+    Useful before sharing the report between threads, since otherwise each of
+    them can convert the table on the first access to `results`.
+    """
+    if self._table is not None:
+      self._results = _table_to_rows(self._table)
+      self._table = None
+
   def disable_scalar_conversions(self):
     """Disables auto conversions of scalars of reports slices.
 
@@ -121,12 +176,19 @@ class GarfReport:
         return self.results
       return self.to_list(row_type='scalar')
     if row_type == 'dict':
+      if self._table is not None:
+        return self._table.to_pylist()
       results: list[dict] = []
       for row in iter(self):
         results.append(row.to_dict())
       return results
     if row_type == 'scalar':
-      results = list(itertools.chain.from_iterable(self.results))
+      if self._table is not None:
+        results = list(
+          itertools.chain.from_iterable(_table_to_rows(self._table))
+        )
+      else:
+        results = list(itertools.chain.from_iterable(self.results))
       if distinct:
         results = list(set(results))
       return results
@@ -162,14 +224,14 @@ class GarfReport:
     else:
       output = {}
     key_index = self.column_names.index(key_column)
-    if not (key_generator := list(zip(*self.results))):
+    columns = self._get_columns()
+    if not columns or not (key_generator := columns[key_index]):
       return {key_column: None}
-    key_generator = key_generator[key_index]
     if value_column:
       value_index = self.column_names.index(value_column)
-      value_generator = list(zip(*self.results))[value_index]
+      value_generator = columns[value_index]
     else:
-      value_generator = self.results
+      value_generator = zip(*columns)
     for key, value in zip(key_generator, value_generator):
       if not value_column:
         value = dict(zip(self.column_names, value))
@@ -202,6 +264,8 @@ class GarfReport:
         'Please install garf-io with Polars support '
         '- `pip install garf-io[polars]`'
       ) from e
+    if self._table is not None:
+      return pl.from_arrow(self._table)
     return pl.DataFrame(
       data=self.results, schema=self.column_names, orient='row'
     )
@@ -222,8 +286,27 @@ class GarfReport:
         'Please install garf-io with Pandas support '
         '- `pip install garf-io[pandas]`'
       ) from e
+    if self._table is not None:
+      return self._table.to_pandas()
     return pd.DataFrame(data=self.results, columns=self.column_names)
 
+  def to_arrow(self) -> 'pa.Table':
+    """Converts report to Arrow table.
+
+    Returns:
+        Table from report results and column_names.
+
+    Raises:
+        ImportError: if pyarrow is not installed.
+    """
+    pa = _import_pyarrow()
+    if self._table is not None:
+      return self._table
+    return pa.Table.from_arrays(
+      [pa.array(column) for column in self._get_columns()],
+      names=list(self.column_names),
+    )
+
   def to_jsonl(self) -> str:
     """Converts report to JSON Lines."""
     return self.to_json(output='jsonl')
@@ -265,8 +348,18 @@ class GarfReport:
       )
     return self.results[column_index][row_index]
 
+  def _get_columns(self) -> list[list[api_clients.ApiRowElement]]:
+    """Returns report data as a list of columns."""
+    if self._table is not None:
+      return [column.to_pylist() for column in self._table.columns]
+    if not any(self._results):
+      return [[] for _ in self.column_names]
+    return [list(column) for column in zip(*self._results)]
+
   def __len__(self):
     """Returns number of rows in the report."""
+    if self._table is not None:
+      return self._table.num_rows
     return len(self.results)
 
   def __iter__(self) -> Generator[GarfRow, None, None] | None:
@@ -285,6 +378,8 @@ class GarfReport:
 
   def __bool__(self):
     """Checks whether report results is not empty."""
+    if self._table is not None:
+      return self._table.num_rows > 0
     return bool(self.results)
 
   def __str__(self):
@@ -367,6 +462,8 @@ class GarfReport:
       indices = []
       for k in key:
         indices.append(self.column_names.index(k))
+      if self._table is not None:
+        return GarfReport.from_arrow(self._table.select(indices))
       results = []
       for row in self.results:
         rows = []
@@ -420,6 +517,19 @@ class GarfReport:
       return other
     if self.column_names != other.column_names:
       raise GarfReportError('column_names should be the same in GarfReport')
+    if self._table is not None and other._table is not None:
+      pa = _import_pyarrow()
+      with contextlib.suppress(pa.ArrowInvalid):
+        combined_report = GarfReport.from_arrow(
+          pa.concat_tables([self._table, other._table])
+        )
+        combined_report.results_placeholder = (
+          self.results_placeholder or other.results_placeholder
+        )
+        combined_report.query_specification = (
+          self.query_specification or other.query_specification
+        )
+        return combined_report
     return GarfReport(
       results=self.results + other.results,
       column_names=self.column_names,
@@ -427,6 +537,85 @@ class GarfReport:
       query_specification=self.query_specification or other.query_specification,
     )
 
+  @classmethod
+  def concat(cls, reports: Sequence[GarfReport]) -> GarfReport:
+    """Combines multiple reports into one in a single pass.
+
+    Unlike summing reports one by one, data of each report is copied only
+    once; Arrow backed reports are combined without materializing rows.
+
+    Args:
+        reports: Reports to combine.
+
+    Return:
+        New GarfReport with combined data.
+
+    Raises:
+        GarfReportError:
+            When columns are different or any element is not GarfReport.
+    """
+    reports = list(reports)
+    if not all(isinstance(r, cls) for r in reports):
+      raise GarfReportError('Concat operation is supported only for GarfReport')
+    if not reports:
+      return cls()
+    non_empty_reports = [r for r in reports if r]
+    if not non_empty_reports:
+      return reports[0]
+    if len(non_empty_reports) == 1:
+      return non_empty_reports[0]
+    column_names = non_empty_reports[0].column_names
+    if any(r.column_names != column_names for r in non_empty_reports):
+      raise GarfReportError('column_names should be the same in GarfReport')
+    results_placeholder = next(
+      (r.results_placeholder for r in reports if r.results_placeholder), None
+    )
+    query_specification = next(
+      (r.query_specification for r in reports if r.query_specification), None
+    )
+    if all(r._table is not None for r in non_empty_reports):
+      pa = _import_pyarrow()
+      with contextlib.suppress(pa.ArrowInvalid):
+        combined_report = cls.from_arrow(
+          pa.concat_tables([r._table for r in non_empty_reports]),
+          query_specification=query_specification,
+        )
+        combined_report.results_placeholder = results_placeholder or []
+        return combined_report
+    results = []
+    for r in non_empty_reports:
+      results.extend(r.results)
+    return cls(
+      results=results,
+      column_names=column_names,
+      results_placeholder=results_placeholder,
+      query_specification=query_specification,
+    )
+
+  @classmethod
+  def from_arrow(
+    cls,
+    table: 'pa.Table',
+    query_specification: query_editor.BaseQueryElements | None = None,
+  ) -> GarfReport:
+    """Builds GarfReport backed by Arrow table.
+
+    Data stays in the table until report rows are accessed.
+
+    Args:
+        table: Arrow table to build report from.
+        query_specification: Specification used to get data from API.
+
+    Returns:
+        Report build from table data and columns.
+    """
+    garf_report = cls(
+      column_names=list(table.column_names),
+      query_specification=query_specification,
+    )
+    garf_report._table = table
+    return garf_report
+
   @classmethod
   def from_polars(cls, df: 'pl.DataFrame') -> GarfReport:
     """Builds GarfReport from polars dataframe.
@@ -447,6 +636,8 @@ class GarfReport:
         'Please install garf-core with Polars support '
         '- `pip install garf-core[polars]`'
       ) from e
+    with contextlib.suppress(ImportError):
+      return cls.from_arrow(df.to_arrow())
     return cls(
       results=df.to_numpy().tolist(), column_names=list(df.schema.keys())
     )
@@ -656,3 +847,20 @@ class GarfRow:
 
 class GarfReportError(exceptions.GarfError):
   """Base exception for Garf reports."""
+
+
+def _import_pyarrow():
+  try:
+    import pyarrow as pa
+  except ImportError as e:
+    raise ImportError(
+      'Please install garf-core with Arrow support '
+      '- `pip install garf-core[arrow]`'
+    ) from e
+  return pa
+
+
+def _table_to_rows(table: 'pa.Table') -> list[list[api_clients.ApiRowElement]]:
+  """Converts Arrow table to a list of rows."""
+  columns = [column.to_pylist() for column in table.columns]
+  return [list(row) for row in zip(*columns)]
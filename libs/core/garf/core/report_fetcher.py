@@ -24,6 +24,7 @@ from __future__ import annotations
 import asyncio
 import logging
 import pathlib
+from collections.abc import Iterator
 from typing import Any, Callable
 
 from garf.core import (
@@ -32,6 +33,7 @@ from garf.core import (
   exceptions,
   parsers,
   query_editor,
+  rate_limiter,
   report,
 )
 from garf.core.telemetry import tracer
@@ -109,6 +111,10 @@ class ApiReportFetcher:
       postprocessors: Functions to execute after fetching the query.
     """
     self.api_client = api_client
+    if getattr(api_client, 'rate_limiter', None) is None and (
+      limiter := rate_limiter.get_rate_limiter(getattr(self, 'alias', None))
+    ):
+      api_client.rate_limiter = limiter
     self.parser = parser
     self.query_specification_builder = query_specification_builder
     self.query_args = kwargs
@@ -177,6 +183,160 @@ class ApiReportFetcher:
     span = trace.get_current_span()
     if args is None:
       args = query_editor.GarfQueryParameters()
+    query_specification, query = self._generate_query(
+      query_specification, args, title
+    )
+    if query.is_builtin_query:
+      return self._fetch_builtin_query(query_specification, query, **kwargs)
+
+    if not self.enable_cache:
+      return self._fetch_report(query, **kwargs)
+    if (cached_report := self._load_cached_report(query, args, kwargs)) is None:
+      logger.info('Cached version not found, generating')
+      # Concurrent fetches of the same query wait for the first one to
+      # populate cache instead of calling API simultaneously.
+      with self.cache.lock(query, args, kwargs):
+        cached_report = self._load_cached_report(query, args, kwargs)
+        if cached_report is None:
+          if cache_size := self.cache.size:
+            cache_size_meter.set(
+              cache_size, {'cache.location': str(self.cache.location)}
+            )
+          fetched_report = self._fetch_report(query, **kwargs)
+          self.cache.save(fetched_report, query, args, kwargs)
+          return fetched_report
+    logger.warning('Cached version of report is loaded')
+    span.set_attribute('is_cached_report', True)
+    return cached_report
+
+  def fetch_stream(
+    self,
+    query_specification: str | query_editor.QuerySpecification,
+    args: query_editor.GarfQueryParameters | None = None,
+    title: str | None = None,
+    **kwargs: str,
+  ) -> Iterator[report.GarfReport]:
+    """Fetches data from API based on query_specification chunk by chunk.
+
+    Each page returned by API client is parsed and yielded as soon as it
+    arrives so the whole response is never kept in memory.
+    When cache is enabled cached report is yielded as a single chunk;
+    streamed reports are not saved to cache.
+
+    Args:
+      query_specification: Query text that will be passed to API
+        alongside column_names, customizers and virtual columns.
+      args: Arguments that need to be passed to the query.
+      title: Optional title of the query.
+
+    Yields:
+      GarfReport for each page of API response.
+    """
+    # Span is made current only while the fetcher is working, not while
+    # consumer processes a yielded chunk; it ends when generator is closed.
+    span = tracer.start_span('fetch_stream')
+    try:
+      with trace.use_span(span):
+        chunk = None
+        if args is None:
+          args = query_editor.GarfQueryParameters()
+        query_specification, query = self._generate_query(
+          query_specification, args, title
+        )
+        if query.is_builtin_query:
+          chunk = self._fetch_builtin_query(
+            query_specification, query, **kwargs
+          )
+        elif self.enable_cache:
+          try:
+            chunk = self.cache.load(query, args, kwargs)
+            logger.warning('Cached version of report is loaded')
+            span.set_attribute('is_cached_report', True)
+          except cache.GarfCacheFileNotFoundError:
+            logger.info('Cached version not found, generating')
+      if chunk is not None:
+        yield chunk
+        return
+
+      column_names = [c for c in query.column_names if c != '_']
+      parser = self.parser(query)
+      results_placeholder = []
+      num_chunks = 0
+      responses = self.api_client.call_api_stream(query, **kwargs)
+      while True:
+        with trace.use_span(span):
+          if (response := next(responses, None)) is None:
+            break
+          if not response:
+            results_placeholder = (
+              results_placeholder or response.results_placeholder
+            )
+            continue
+          num_chunks += 1
+          chunk = report.GarfReport(
+            results=parser.parse_response(response),
+            column_names=column_names,
+            query_specification=query,
+          )
+        yield chunk
+      span.set_attribute('num_chunks', num_chunks)
+      if not num_chunks:
+        span.set_attribute('is_placeholder_report', True)
+        with trace.use_span(span):
+          chunk = report.GarfReport(
+            query_specification=query,
+            results_placeholder=parser.parse_response(
+              api_clients.GarfApiResponse(results=results_placeholder)
+            ),
+            column_names=column_names,
+          )
+        yield chunk
+    finally:
+      span.end()
+
+  def _load_cached_report(
+    self,
+    query: query_editor.BaseQueryElements,
+    args: query_editor.GarfQueryParameters,
+    kwargs: dict[str, str],
+  ) -> report.GarfReport | None:
+    """Loads report from cache if it's available."""
+    try:
+      return self.cache.load(query, args, kwargs)
+    except cache.GarfCacheFileNotFoundError:
+      return None
+
+  def _fetch_report(
+    self, query: query_editor.BaseQueryElements, **kwargs: str
+  ) -> report.GarfReport:
+    """Fetches data from API and parses it into report."""
+    span = trace.get_current_span()
+    response = self.api_client.call_api(query, **kwargs)
+    column_names = [c for c in query.column_names if c != '_']
+    if not response:
+      placeholder_parsed_response = self.parser(query).parse_response(
+        api_clients.GarfApiResponse(results=response.results_placeholder)
+      )
+      span.set_attribute('is_placeholder_report', True)
+      return report.GarfReport(
+        query_specification=query,
+        results_placeholder=placeholder_parsed_response,
+        column_names=column_names,
+      )
+    return report.GarfReport(
+      results=self.parser(query).parse_response(response),
+      column_names=column_names,
+      query_specification=query,
+    )
+
+  def _generate_query(
+    self,
+    query_specification: str | query_editor.QuerySpecification,
+    args: query_editor.GarfQueryParameters,
+    title: str | None = None,
+  ) -> tuple[query_editor.QuerySpecification, query_editor.BaseQueryElements]:
+    """Builds query specification and parses it into query elements."""
+    span = trace.get_current_span()
     if not isinstance(query_specification, query_editor.QuerySpecification):
       query_specification = self.query_specification_builder(
         text=str(query_specification),
@@ -188,53 +348,23 @@ class ApiReportFetcher:
     if query.title:
       span.set_attribute('query.title', query.title)
       span.set_attribute('query.text', query.text)
-    if query.is_builtin_query:
-      span.set_attribute('query.is_builtin', True)
-      if not (builtin_report := self.builtin_queries.get(query.title)):
-        raise query_editor.GarfBuiltInQueryError(
-          f'Cannot find the built-in query "{query.title}"'
-        )
-      runtime_parameters = {**query_specification.macros, **kwargs}
-      rep = builtin_report(self, **runtime_parameters)
-      if columns := query.column_names:
-        rep.column_names = columns
-      return rep
-
-    if self.enable_cache:
-      try:
-        cached_report = self.cache.load(query, args, kwargs)
-        logger.warning('Cached version of report is loaded')
-        span.set_attribute('is_cached_report', True)
-        return cached_report
-      except cache.GarfCacheFileNotFoundError:
-        logger.info('Cached version not found, generating')
-
-      if cache_size := self.cache.size:
-        cache_size_meter.set(
-          cache_size, {'cache.location': str(self.cache.location)}
-        )
+    return query_specification, query
 
-    response = self.api_client.call_api(query, **kwargs)
-    if not response:
-      placeholder_parsed_response = self.parser(query).parse_response(
-        api_clients.GarfApiResponse(results=response.results_placeholder)
-      )
-      placeholder_report = report.GarfReport(
-        query_specification=query,
-        results_placeholder=placeholder_parsed_response,
-        column_names=[c for c in query.column_names if c != '_'],
+  def _fetch_builtin_query(
+    self,
+    query_specification: query_editor.QuerySpecification,
+    query: query_editor.BaseQueryElements,
+    **kwargs: str,
+  ) -> report.GarfReport:
+    """Generates report from built-in query."""
+    span = trace.get_current_span()
+    span.set_attribute('query.is_builtin', True)
+    if not (builtin_report := self.builtin_queries.get(query.title)):
+      raise query_editor.GarfBuiltInQueryError(
+        f'Cannot find the built-in query "{query.title}"'
       )
-      span.set_attribute('is_placeholder_report', True)
-      if self.enable_cache:
-        self.cache.save(placeholder_report, query, args, kwargs)
-      return placeholder_report
-
-    parsed_response = self.parser(query).parse_response(response)
-    fetched_report = report.GarfReport(
-      results=parsed_response,
-      column_names=[c for c in query.column_names if c != '_'],
-      query_specification=query,
-    )
-    if self.enable_cache:
-      self.cache.save(fetched_report, query, args, kwargs)
-    return fetched_report
+    runtime_parameters = {**query_specification.macros, **kwargs}
+    rep = builtin_report(self, **runtime_parameters)
+    if columns := query.column_names:
+      rep.column_names = columns
+    return rep
@@ -32,3 +32,9 @@ api_counter = meter.create_counter(
 cache_size_meter = meter.create_gauge(
   'garf_cache_size_bytes', unit='By', description='Size of garf cache in bytes'
 )
+
+rate_limit_wait_histogram = meter.create_histogram(
+  'garf_rate_limit_wait_seconds',
+  unit='s',
+  description='Time requests spent waiting for rate limiter',
+)
@@ -13,12 +13,16 @@
 # limitations under the License.
 
 import csv
+import http.server
 import json
 import pathlib
+import threading
 import time
+import urllib.parse
 
 import pytest
 from garf.core import api_clients, query_editor
+from opentelemetry import trace
 
 
 class TestFakeApiClient:
@@ -70,6 +74,41 @@ class TestFakeApiClient:
     ):
       api_client.get_response()
 
+  def test_get_response_stream_respects_page_size_option(self):
+    data = [
+      {'field1': 1, 'field2': 2},
+      {'field1': 10, 'field2': 20},
+      {'field1': 100, 'field2': 200},
+    ]
+    api_client = api_clients.FakeApiClient(
+      results=data, options=api_clients.FakeApiClientOptions(page_size=2)
+    )
+    pages = [page.results for page in api_client.get_response_stream()]
+    assert pages == [data[:2], data[2:]]
+
+  def test_call_api_stream_sets_attributes_on_own_span(self, mocker):
+    span = mocker.MagicMock()
+    start_span = api_clients.tracer.start_span
+    mocker.patch.object(
+      api_clients.tracer,
+      'start_span',
+      side_effect=lambda name, *args, **kwargs: (
+        span if name == 'call_api_stream' else start_span(name, *args, **kwargs)
+      ),
+    )
+    data = [{'field1': 1}, {'field1': 10}, {'field1': 100}]
+    api_client = api_clients.FakeApiClient(
+      results=data, options=api_clients.FakeApiClientOptions(page_size=2)
+    )
+
+    stream = api_client.call_api_stream(request=None)
+    next(stream)
+    assert trace.get_current_span() is not span
+    list(stream)
+
+    span.set_attribute.assert_called_once_with('num_rows_api_response', 3)
+    span.end.assert_called_once()
+
   def test_from_csv_returns_correct_results(self, tmp_path):
     data = [
       {'field1': 1, 'field2': 2},
@@ -185,3 +224,205 @@ class TestValidateEndpointUrl:
     client = api_clients.RestApiClient(endpoint='https://api.restful-api.dev')
 
     assert client.endpoint == 'https://api.restful-api.dev'
+
+
+@pytest.fixture
+def rest_server():
+  """Serves JSON responses, failing first `failures` requests with 503."""
+
+  class Handler(http.server.BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+
+    def do_GET(self):
+      server.requests.append(self.client_address)
+      query = urllib.parse.parse_qs(urllib.parse.urlparse(self.path).query)
+      link = None
+      if server.failures:
+        server.failures -= 1
+        status, body = 503, b'{}'
+      elif server.items is None:
+        status, body = 200, json.dumps({'path': self.path}).encode()
+      elif 'offset' in query:
+        offset, limit = int(query['offset'][0]), int(query['limit'][0])
+        status = 200
+        body = json.dumps(server.items[offset : offset + limit]).encode()
+      else:
+        page = int(query.get('page', [0])[0])
+        status = 200
+        body = json.dumps(server.items[page * 2 : page * 2 + 2]).encode()
+        if (page + 1) * 2 < len(server.items):
+          port = server.server_address[1]
+          next_url = f'http://127.0.0.1:{port}/resource?page={page + 1}'
+          link = f'<{next_url}>; rel="next"'
+      self.send_response(status)
+      if link:
+        self.send_header('Link', link)
+      self.send_header('Content-Type', 'application/json')
+      self.send_header('Content-Length', str(len(body)))
+      self.end_headers()
+      self.wfile.write(body)
+
+    def log_message(self, *args):
+      pass
+
+  server = http.server.ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+  server.requests = []
+  server.failures = 0
+  server.items = None
+  thread = threading.Thread(target=server.serve_forever, daemon=True)
+  thread.start()
+  yield server
+  server.shutdown()
+  server.server_close()
+
+
+class TestRestApiClient:
+  def _client(self, server, **kwargs):
+    return api_clients.RestApiClient(
+      endpoint=f'http://127.0.0.1:{server.server_address[1]}',
+      allow_unsafe_endpoint=True,
+      **kwargs,
+    )
+
+  def _request(self):
+    return query_editor.QuerySpecification(
+      text='SELECT field FROM resource'
+    ).generate()
+
+  def test_get_response_reuses_connection(self, rest_server):
+    client = self._client(rest_server)
+
+    for _ in range(3):
+      response = client.get_response(self._request())
+
+    assert response.results == [{'path': '/resource'}]
+    assert len(rest_server.requests) == 3
+    assert len(set(rest_server.requests)) == 1
+
+  def test_get_response_retries_failed_requests(self, rest_server):
+    rest_server.failures = 2
+    client = self._client(rest_server, backoff_factor=0)
+
+    response = client.get_response(self._request())
+
+    assert response.results == [{'path': '/resource'}]
+    assert len(rest_server.requests) == 3
+
+  def test_get_response_raises_error_when_retries_exhausted(self, rest_server):
+    rest_server.failures = 5
+    client = self._client(rest_server, max_retries=1, backoff_factor=0)
+
+    with pytest.raises(api_clients.GarfApiError):
+      client.get_response(self._request())
+    assert len(rest_server.requests) == 2
+
+  def test_get_response_fetches_all_pages_via_link_header(self, rest_server):
+    rest_server.items = [{'id': i} for i in range(5)]
+    client = self._client(
+      rest_server, paginator=api_clients.LinkHeaderPaginator()
+    )
+
+    response = client.get_response(self._request())
+
+    assert response.results == rest_server.items
+    assert len(rest_server.requests) == 3
+
+  def test_get_response_stream_yields_each_page(self, rest_server):
+    rest_server.items = [{'id': i} for i in range(5)]
+    client = self._client(
+      rest_server, paginator=api_clients.OffsetPaginator(limit=2)
+    )
+
+    responses = list(client.get_response_stream(self._request()))
+
+    assert [r.results for r in responses] == [
+      [{'id': 0}, {'id': 1}],
+      [{'id': 2}, {'id': 3}],
+      [{'id': 4}],
+    ]
+
+
+class TestPaginators:
+  def test_page_token_paginator_follows_next_page_token(self):
+    pages = {
+      None: {'items': [1, 2], 'nextPageToken': 'a'},
+      'a': {'items': [3], 'nextPageToken': 'b'},
+      'b': {'items': [4]},
+    }
+    paginator = api_clients.PageTokenPaginator(items='items')
+
+    results = [
+      item
+      for page in paginator.pages(lambda params: pages[params.get('pageToken')])
+      for item in paginator.get_items(page)
+    ]
+
+    assert results == [1, 2, 3, 4]
+
+  def test_cursor_paginator_reads_nested_cursor(self):
+    pages = {
+      None: {'data': [1], 'meta': {'next': 'x'}},
+      'x': {'data': [2], 'meta': {'next': None}},
+    }
+    paginator = api_clients.CursorPaginator(
+      cursor_param='after', next_cursor='meta.next', items='data'
+    )
+
+    results = [
+      paginator.get_items(page)
+      for page in paginator.pages(lambda params: pages[params.get('after')])
+    ]
+
+    assert results == [[1], [2]]
+
+  def test_page_token_paginator_respects_max_pages(self):
+    paginator = api_clients.PageTokenPaginator(max_pages=3)
+
+    pages = list(paginator.pages(lambda params: {'nextPageToken': 'next'}))
+
+    assert len(pages) == 3
+
+  def test_offset_paginator_stops_on_incomplete_page(self):
+    items = list(range(7))
+    requested_offsets = []
+
+    def fetch_page(params):
+      requested_offsets.append(params['offset'])
+      return items[params['offset'] : params['offset'] + params['limit']]
+
+    paginator = api_clients.OffsetPaginator(limit=3)
+
+    pages = list(paginator.pages(fetch_page))
+
+    assert pages == [[0, 1, 2], [3, 4, 5], [6]]
+    assert requested_offsets == [0, 3, 6]
+
+  def test_offset_paginator_fetches_pages_in_parallel_when_total_known(self):
+    items = list(range(10))
+    in_flight = 0
+    max_in_flight = 0
+    lock = threading.Lock()
+
+    def fetch_page(params):
+      nonlocal in_flight, max_in_flight
+      with lock:
+        in_flight += 1
+        max_in_flight = max(max_in_flight, in_flight)
+      time.sleep(0.05)
+      with lock:
+        in_flight -= 1
+      offset, limit = params['offset'], params['limit']
+      return {'rows': items[offset : offset + limit], 'total': len(items)}
+
+    paginator = api_clients.OffsetPaginator(
+      limit=2, items='rows', total='total', max_workers=4
+    )
+
+    results = [
+      item
+      for page in paginator.pages(fetch_page)
+      for item in paginator.get_items(page)
+    ]
+
+    assert results == items
+    assert max_in_flight > 1
@@ -62,3 +62,199 @@ class TestGarfCache:
     loaded_report = test_cache.load(query)
 
     assert loaded_report == test_report
+
+  def test_load_returns_report_from_memory_without_reading_file(self, tmp_path):
+    test_cache = cache.GarfCache(location=str(tmp_path))
+    test_report = report.GarfReport(results=[[1]], column_names=['test'])
+    query = query_editor.QuerySpecification(
+      text='SELECT test FROM test'
+    ).generate()
+
+    test_cache.save(test_report, query)
+    for cached_file in tmp_path.iterdir():
+      cached_file.unlink()
+    loaded_report = test_cache.load(query)
+
+    assert loaded_report == test_report
+
+
+class TestMemoryCache:
+  @pytest.fixture
+  def memory_cache(self):
+    return cache.MemoryCache(max_entries=2, max_bytes=1024 * 1024)
+
+  def test_get_returns_copy_of_stored_report(self, memory_cache):
+    test_report = report.GarfReport(results=[[[1, 2]]], column_names=['test'])
+    memory_cache.put('key', test_report, expires_at=float('inf'))
+
+    loaded_report = memory_cache.get('key')
+    loaded_report.results[0][0].append(3)
+
+    assert memory_cache.get('key') == test_report
+
+  def test_get_returns_none_for_expired_report(self, memory_cache):
+    test_report = report.GarfReport(results=[[1]], column_names=['test'])
+    memory_cache.put('key', test_report, expires_at=0)
+
+    assert memory_cache.get('key') is None
+    assert memory_cache.stats.entries == 0
+
+  def test_put_evicts_least_recently_used_report(self, memory_cache):
+    test_report = report.GarfReport(results=[[1]], column_names=['test'])
+    for key in ('first', 'second'):
+      memory_cache.put(key, test_report, expires_at=float('inf'))
+    memory_cache.get('first')
+    memory_cache.put('third', test_report, expires_at=float('inf'))
+
+    assert memory_cache.get('second') is None
+    assert memory_cache.get('first') == test_report
+    assert memory_cache.stats == cache.MemoryCacheStats(
+      hits=2,
+      misses=1,
+      evictions=1,
+      entries=2,
+      size=memory_cache.stats.size,
+    )
+
+  def test_put_skips_reports_larger_than_max_bytes(self):
+    memory_cache = cache.MemoryCache(max_entries=2, max_bytes=10)
+    test_report = report.GarfReport(results=[[1]], column_names=['test'])
+    memory_cache.put('key', test_report, expires_at=float('inf'))
+
+    assert memory_cache.stats.entries == 0
+
+
+class TestCacheSerialization:
+  @pytest.fixture
+  def query(self):
+    return query_editor.QuerySpecification(
+      text='SELECT test FROM test'
+    ).generate()
+
+  @pytest.mark.parametrize('compression', ['zstd', 'lz4', None])
+  def test_file_cache_saves_report_in_arrow_format(
+    self, tmp_path, query, compression
+  ):
+    test_cache = cache.GarfCache(
+      location=str(tmp_path),
+      enable_memory_cache=False,
+      serialization='arrow',
+      compression=compression,
+    )
+    test_report = report.GarfReport(
+      results=[[1, 'a', [1, 2]], [2, None, []]],
+      column_names=['id', 'name', 'values'],
+    )
+
+    test_cache.save(test_report, query)
+    loaded_report = test_cache.load(query)
+
+    assert [path.suffix for path in tmp_path.iterdir()] == ['.arrow']
+    assert loaded_report == test_report
+
+  def test_file_cache_saves_report_with_dict_values_in_json_format(
+    self, tmp_path, query
+  ):
+    test_cache = cache.GarfCache(
+      location=str(tmp_path), enable_memory_cache=False, serialization='arrow'
+    )
+    test_report = report.GarfReport(
+      results=[[{'a': 1}], [{'b': 2}]], column_names=['test']
+    )
+
+    test_cache.save(test_report, query)
+    loaded_report = test_cache.load(query)
+
+    assert [path.suffix for path in tmp_path.iterdir()] == ['.json']
+    assert loaded_report == test_report
+
+  @pytest.mark.parametrize(
+    'results',
+    [
+      [[2**64], [1]],
+      [[1], [2.5]],
+    ],
+    ids=['int_overflow', 'mixed_int_and_float'],
+  )
+  def test_file_cache_saves_report_changed_by_arrow_in_json_format(
+    self, tmp_path, query, results
+  ):
+    test_cache = cache.GarfCache(
+      location=str(tmp_path), enable_memory_cache=False, serialization='arrow'
+    )
+    test_report = report.GarfReport(results=results, column_names=['test'])
+
+    test_cache.save(test_report, query)
+    loaded_report = test_cache.load(query)
+
+    assert [path.suffix for path in tmp_path.iterdir()] == ['.json']
+    assert [[type(value) for value in row] for row in loaded_report] == [
+      [type(value) for value in row] for row in results
+    ]
+    assert loaded_report.results == results
+
+  def test_file_cache_loads_report_saved_in_json_format(self, tmp_path, query):
+    test_report = report.GarfReport(results=[[1]], column_names=['test'])
+    cache.GarfCache(
+      location=str(tmp_path), enable_memory_cache=False, serialization='json'
+    ).save(test_report, query)
+
+    loaded_report = cache.GarfCache(
+      location=str(tmp_path), enable_memory_cache=False, serialization='arrow'
+    ).load(query)
+
+    assert loaded_report == test_report
+
+  def test_redis_cache_saves_report_in_arrow_format(self, query):
+    redis_client = fakeredis.FakeRedis(fakeredis.FakeServer())
+    test_cache = cache.GarfCache(
+      cache_provider=cache.RedisGarfCache(
+        redis_client=redis_client, serialization='arrow'
+      ),
+      enable_memory_cache=False,
+    )
+    test_report = report.GarfReport(results=[[1]], column_names=['test'])
+
+    test_cache.save(test_report, query)
+    loaded_report = test_cache.load(query)
+
+    assert loaded_report.is_columnar
+    assert loaded_report == test_report
+
+
+class TestCacheLock:
+  @pytest.fixture
+  def query(self):
+    return query_editor.QuerySpecification(
+      text='SELECT test FROM test'
+    ).generate()
+
+  def test_lock_removes_lock_file_on_exit(self, tmp_path, query):
+    test_cache = cache.GarfCache(location=str(tmp_path))
+
+    with test_cache.lock(query):
+      assert [path.suffix for path in tmp_path.iterdir()] == ['.lock']
+
+    assert not list(tmp_path.iterdir())
+
+  def test_lock_removes_abandoned_lock_file(self, tmp_path, query):
+    test_cache = cache.GarfCache(location=str(tmp_path))
+    with test_cache.lock(query):
+      lock_path = next(tmp_path.iterdir())
+      lock_path.rename(tmp_path / 'held.lock')
+    (tmp_path / 'held.lock').rename(lock_path)
+
+    with test_cache.lock(query, timeout=1):
+      pass
+
+    assert not lock_path.exists()
+
+  def test_lock_holds_redis_lock_key(self, mock_redis, query):
+    test_cache = cache.GarfCache(
+      cache_provider=cache.RedisGarfCache(redis_client=mock_redis)
+    )
+
+    with test_cache.lock(query):
+      assert len(mock_redis.keys('*:lock')) == 1
+
+    assert not mock_redis.keys('*:lock')
@@ -0,0 +1,156 @@
+# Copyright 2026 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import asyncio
+import time
+
+import pytest
+from garf.core import concurrency
+
+
+class HttpError(Exception):
+  def __init__(self, status_code):
+    super().__init__(f'HTTP {status_code}')
+    self.status_code = status_code
+
+
+class StatusCode:
+  def __init__(self, name):
+    self.name = name
+
+
+class GrpcError(Exception):
+  def __init__(self, name):
+    super().__init__(name)
+    self._code = StatusCode(name)
+
+  def code(self):
+    return self._code
+
+
+@pytest.mark.parametrize(
+  ('error', 'expected'),
+  [
+    (HttpError(429), True),
+    (HttpError(503), True),
+    (HttpError(404), False),
+    (GrpcError('RESOURCE_EXHAUSTED'), True),
+    (GrpcError('INVALID_ARGUMENT'), False),
+    (ValueError('unrelated'), False),
+  ],
+)
+def test_is_overload_error_identifies_quota_and_server_errors(error, expected):
+  assert concurrency.is_overload_error(error) == expected
+
+
+def test_is_overload_error_checks_error_cause():
+  try:
+    try:
+      raise HttpError(429)
+    except HttpError as e:
+      raise RuntimeError('Failed to fetch') from e
+  except RuntimeError as e:
+    error = e
+
+  assert concurrency.is_overload_error(error)
+
+
+class TestAdaptiveLimiter:
+  def test_run_never_exceeds_limit(self):
+    limiter = concurrency.AdaptiveLimiter(initial_limit=2, max_limit=2)
+    in_flight = 0
+    max_in_flight = 0
+
+    async def task():
+      nonlocal in_flight, max_in_flight
+      in_flight += 1
+      max_in_flight = max(max_in_flight, in_flight)
+      await asyncio.sleep(0.01)
+      in_flight -= 1
+      return 1
+
+    async def run():
+      return await asyncio.gather(*(limiter.run(task()) for _ in range(10)))
+
+    results = asyncio.run(run())
+
+    assert results == [1] * 10
+    assert max_in_flight == 2
+
+  def test_on_success_increases_limit_additively(self):
+    limiter = concurrency.AdaptiveLimiter(initial_limit=2, max_limit=10)
+
+    for _ in range(6):
+      limiter.on_success(latency=0.1)
+
+    assert limiter.limit == 4
+
+  def test_on_success_does_not_exceed_max_limit(self):
+    limiter = concurrency.AdaptiveLimiter(initial_limit=2, max_limit=3)
+
+    for _ in range(100):
+      limiter.on_success(latency=0.1)
+
+    assert limiter.limit == 3
+
+  def test_on_success_grows_up_to_four_times_initial_limit_by_default(self):
+    limiter = concurrency.AdaptiveLimiter(initial_limit=2)
+
+    for _ in range(100):
+      limiter.on_success(latency=0.1)
+
+    assert limiter.limit == 8
+
+  def test_on_success_ignores_slow_tasks(self):
+    limiter = concurrency.AdaptiveLimiter(initial_limit=2, latency_tolerance=2)
+    limiter.on_success(latency=0.1)
+    limit = limiter._limit
+
+    limiter.on_success(latency=1)
+
+    assert limiter._limit == limit
+
+  def test_on_error_decreases_limit_once_per_burst(self):
+    limiter = concurrency.AdaptiveLimiter(initial_limit=8)
+    start_time = time.monotonic()
+
+    for _ in range(3):
+      limiter.on_error(HttpError(429), start_time)
+
+    assert limiter.limit == 4
+
+  def test_on_error_does_not_go_below_min_limit(self):
+    limiter = concurrency.AdaptiveLimiter(initial_limit=2, min_limit=1)
+
+    for _ in range(3):
+      limiter.on_error(HttpError(429), time.monotonic())
+
+    assert limiter.limit == 1
+
+  def test_on_error_ignores_non_overload_errors(self):
+    limiter = concurrency.AdaptiveLimiter(initial_limit=8)
+
+    limiter.on_error(ValueError('bad query'), time.monotonic())
+
+    assert limiter.limit == 8
+
+  def test_run_reraises_task_error(self):
+    limiter = concurrency.AdaptiveLimiter(initial_limit=4)
+
+    async def task():
+      raise HttpError(503)
+
+    with pytest.raises(HttpError):
+      asyncio.run(limiter.run(task()))
+    assert limiter.limit == 2
@@ -206,6 +206,32 @@ class TestDictParser:
 
     assert parsed_row == expected_row
 
+  def test_parse_row_returns_nested_elements(self):
+    test_specification = query_editor.QuerySpecification(
+      'SELECT column.nested.element AS element, column.nested AS nested '
+      'FROM test'
+    ).generate()
+    test_parser = parsers.DictParser(test_specification)
+
+    parsed_row = test_parser.parse_row({'column': {'nested': {'element': 1}}})
+
+    assert parsed_row == [1, {'element': 1}]
+
+  def test_parsing_plan_is_compiled_once(self, test_parser):
+    assert test_parser.parsing_plan is test_parser.parsing_plan
+    assert len(test_parser.parsing_plan) == 1
+
+  def test_parsing_plan_respects_overridden_parse_row_element(self):
+    class UpperCaseDictParser(parsers.DictParser):
+      def parse_row_element(self, row, key):
+        return str(super().parse_row_element(row, key)).upper()
+
+    test_parser = UpperCaseDictParser(test_specification)
+
+    parsed_row = test_parser.parse_row({'test_column_1': 'value'})
+
+    assert parsed_row == ['VALUE']
+
 
 class TestNumericDictParser:
   @pytest.fixture
@@ -315,7 +341,59 @@ class TestVirtualColumnValidation:
     ).generate()
     parser = parsers.DictParser(spec)
     test_response = api_clients.GarfApiResponse(
-      results=[{'metrics.clicks': 'injected_name', 'metrics.impressions': 50000}]
+      results=[
+        {'metrics.clicks': 'injected_name', 'metrics.impressions': 50000}
+      ]
+    )
+    parsed = parser.parse_response(test_response)
+    assert parsed == [[None]]
+
+  def test_virtual_column_returns_zero_on_division_by_zero(self):
+    spec = query_editor.QuerySpecification(
+      'SELECT metrics.clicks / metrics.impressions AS ctr FROM test'
+    ).generate()
+    parser = parsers.DictParser(spec)
+    test_response = api_clients.GarfApiResponse(
+      results=[{'metrics.clicks': 1000, 'metrics.impressions': 0}]
     )
     parsed = parser.parse_response(test_response)
-    assert parsed == [[None]]
\ No newline at end of file
+    assert parsed == [[0]]
+
+  def test_virtual_column_supports_negative_values(self):
+    spec = query_editor.QuerySpecification(
+      'SELECT metrics.cost_micros / 1e6 AS cost FROM test'
+    ).generate()
+    parser = parsers.DictParser(spec)
+    test_response = api_clients.GarfApiResponse(
+      results=[{'metrics.cost_micros': -1_000_000}]
+    )
+    parsed = parser.parse_response(test_response)
+    assert parsed == [[-1.0]]
+
+  def test_virtual_column_concatenates_strings(self):
+    spec = query_editor.QuerySpecification(
+      "SELECT 'https://example.com/' + resource.id AS url FROM test"
+    ).generate()
+    parser = parsers.DictParser(spec)
+    test_response = api_clients.GarfApiResponse(results=[{'resource.id': 1}])
+    parsed = parser.parse_response(test_response)
+    assert parsed == [['https://example.com/1']]
+
+  def test_virtual_column_expression_is_compiled_once(self):
+    spec = query_editor.QuerySpecification(
+      'SELECT metrics.clicks / metrics.impressions AS ctr FROM test'
+    ).generate()
+    virtual_column = spec.virtual_columns['ctr']
+    expression = parsers.VirtualColumnExpression.from_virtual_column(
+      virtual_column
+    )
+    assert expression is parsers.VirtualColumnExpression.from_virtual_column(
+      virtual_column
+    )
+    assert expression.evaluate([1, 4]) == 0.25
+
+  def test_virtual_column_expression_rejects_function_calls(self):
+    expression = parsers.VirtualColumnExpression(
+      ['metrics.clicks'], '__import__("os").getcwd() + {metrics_clicks}'
+    )
+    assert expression.evaluate([1]) is None
@@ -342,6 +342,78 @@ class TestQuerySpecification:
       ),
     }
 
+  def test_generate_returns_independent_copies_of_memoized_query(self):
+    query = 'SELECT campaign.id AS campaign_id FROM campaign'
+    first = query_editor.QuerySpecification(text=query, title='test').generate()
+    first.fields.append('campaign.name')
+    second = query_editor.QuerySpecification(
+      text=query, title='test'
+    ).generate()
+
+    assert second is not first
+    assert second.fields == ['campaign.id']
+
+  def test_generate_memoizes_query_per_parameters(self):
+    query = 'SELECT campaign.id AS campaign_id FROM {resource}'
+    first = query_editor.QuerySpecification(
+      text=query,
+      title='test',
+      args=query_editor.GarfQueryParameters(macro={'resource': 'campaign'}),
+    ).generate()
+    second = query_editor.QuerySpecification(
+      text=query,
+      title='test',
+      args=query_editor.GarfQueryParameters(macro={'resource': 'ad_group'}),
+    ).generate()
+
+    assert first.resource_name == 'campaign'
+    assert second.resource_name == 'ad_group'
+
+  def test_generate_skips_parsing_for_memoized_query(self, monkeypatch):
+    query_editor.clear_query_cache()
+    query = 'SELECT campaign.id AS campaign_id FROM campaign'
+    query_editor.QuerySpecification(text=query, title='test').generate()
+
+    def fail_parsing(self):
+      raise AssertionError('Memoized query should not be parsed again')
+
+    monkeypatch.setattr(
+      query_editor.QuerySpecification, 'extract_fields', fail_parsing
+    )
+    test_query_spec = query_editor.QuerySpecification(
+      text=query, title='test'
+    ).generate()
+
+    assert test_query_spec.fields == ['campaign.id']
+
+  def test_generate_restores_state_of_memoized_query(self, monkeypatch):
+    query_editor.clear_query_cache()
+
+    class QuerySpecificationWithState(query_editor.QuerySpecification):
+      def extract_fields(self):
+        self.num_extractions = getattr(self, 'num_extractions', 0) + 1
+        return super().extract_fields()
+
+    query = 'SELECT campaign.id AS campaign_id FROM campaign'
+    QuerySpecificationWithState(text=query).generate()
+    monkeypatch.setattr(
+      QuerySpecificationWithState,
+      '_generate',
+      lambda self: pytest.fail('Memoized query should not be parsed again'),
+    )
+
+    test_query_spec = QuerySpecificationWithState(text=query)
+    test_query_spec.generate()
+
+    assert test_query_spec.num_extractions == 1
+
+  def test_generate_does_not_memoize_query_with_included_templates(self):
+    query = "{% include 'fields.sql' %} FROM campaign"
+
+    test_query_spec = query_editor.QuerySpecification(text=query)
+
+    assert test_query_spec._cache_key is None
+
 
 def test_convert_date_returns_correct_datestring():
   current_date = datetime.datetime.today()
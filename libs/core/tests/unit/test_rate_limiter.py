@@ -0,0 +1,190 @@
+# Copyright 2026 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import contextlib
+import json
+import threading
+import time
+from concurrent import futures
+
+import fakeredis
+import pytest
+from garf.core import api_clients, rate_limiter, report_fetcher
+
+
+@pytest.fixture(autouse=True)
+def clear_rate_limiters():
+  rate_limiter.clear_rate_limiters()
+  yield
+  rate_limiter.clear_rate_limiters()
+
+
+def _create_storage(storage_type, tmp_path):
+  if storage_type == 'file':
+    return rate_limiter.FileRateLimiterStorage(tmp_path)
+  if storage_type == 'redis':
+    return rate_limiter.RedisRateLimiterStorage(
+      redis_client=fakeredis.FakeRedis(fakeredis.FakeServer())
+    )
+  return rate_limiter.MemoryRateLimiterStorage()
+
+
+class TestRateLimiter:
+  @pytest.mark.parametrize('storage_type', ['memory', 'file', 'redis'])
+  def test_acquire_paces_requests(self, tmp_path, storage_type):
+    limiter = rate_limiter.RateLimiter(
+      'test',
+      rate_limiter.RateLimit(requests_per_second=20, burst=1),
+      _create_storage(storage_type, tmp_path),
+    )
+
+    start_time = time.perf_counter()
+    for _ in range(5):
+      with limiter.acquire():
+        pass
+
+    assert time.perf_counter() - start_time >= 0.19
+
+  def test_acquire_allows_burst(self):
+    limiter = rate_limiter.RateLimiter(
+      'test', rate_limiter.RateLimit(requests_per_second=1, burst=5)
+    )
+
+    start_time = time.perf_counter()
+    for _ in range(5):
+      with limiter.acquire():
+        pass
+
+    assert time.perf_counter() - start_time < 0.5
+
+  def test_acquire_limits_concurrent_requests(self):
+    limiter = rate_limiter.RateLimiter(
+      'test', rate_limiter.RateLimit(max_concurrency=2)
+    )
+    in_flight = 0
+    max_in_flight = 0
+    lock = threading.Lock()
+
+    def request():
+      nonlocal in_flight, max_in_flight
+      with limiter.acquire():
+        with lock:
+          in_flight += 1
+          max_in_flight = max(max_in_flight, in_flight)
+        time.sleep(0.05)
+        with lock:
+          in_flight -= 1
+
+    with futures.ThreadPoolExecutor(max_workers=6) as executor:
+      list(executor.map(lambda _: request(), range(6)))
+
+    assert max_in_flight == 2
+
+  def test_acquire_raises_error_when_daily_quota_is_exhausted(self):
+    limiter = rate_limiter.RateLimiter(
+      'test', rate_limiter.RateLimit(daily_quota=250, quota_cost=100)
+    )
+    for _ in range(2):
+      with limiter.acquire():
+        pass
+
+    with pytest.raises(rate_limiter.RateLimitExceededError):
+      with limiter.acquire():
+        pass
+
+  def test_file_storage_shares_quota_between_limiters(self, tmp_path):
+    rate_limit = rate_limiter.RateLimit(daily_quota=1)
+    first_limiter = rate_limiter.RateLimiter(
+      'test', rate_limit, rate_limiter.FileRateLimiterStorage(tmp_path)
+    )
+    second_limiter = rate_limiter.RateLimiter(
+      'test', rate_limit, rate_limiter.FileRateLimiterStorage(tmp_path)
+    )
+    with first_limiter.acquire():
+      pass
+
+    with pytest.raises(rate_limiter.RateLimitExceededError):
+      with second_limiter.acquire():
+        pass
+
+
+class TestGetRateLimiter:
+  def test_returns_none_for_alias_without_limits(self, monkeypatch):
+    monkeypatch.delenv('GARF_RATE_LIMITS', raising=False)
+
+    assert rate_limiter.get_rate_limiter('fake') is None
+
+  def test_creates_limiter_from_environment(self, monkeypatch):
+    monkeypatch.setenv(
+      'GARF_RATE_LIMITS', json.dumps({'fake': {'requests_per_second': 5}})
+    )
+
+    limiter = rate_limiter.get_rate_limiter('fake')
+
+    assert limiter.rate_limit.requests_per_second == 5
+    assert rate_limiter.get_rate_limiter('fake') is limiter
+
+  def test_returns_limiter_registered_via_set_rate_limit(self):
+    limiter = rate_limiter.set_rate_limit('fake', {'max_concurrency': 2})
+
+    assert rate_limiter.get_rate_limiter('fake') is limiter
+
+
+class TestCallApi:
+  def test_call_api_waits_for_rate_limiter(self):
+    api_client = api_clients.FakeApiClient(results=[{'field': 1}])
+    api_client.rate_limiter = rate_limiter.RateLimiter(
+      'fake', rate_limiter.RateLimit(requests_per_second=20, burst=1)
+    )
+
+    start_time = time.perf_counter()
+    for _ in range(5):
+      api_client.call_api(request=None)
+
+    assert time.perf_counter() - start_time >= 0.19
+
+  def test_call_api_stream_acquires_rate_limiter_for_each_page(self):
+    events = []
+
+    class RecordingRateLimiter:
+      @contextlib.contextmanager
+      def acquire(self):
+        events.append('acquire')
+        yield
+        events.append('release')
+
+    api_client = api_clients.FakeApiClient(
+      results=[{'field': 1}, {'field': 2}],
+      options=api_clients.FakeApiClientOptions(page_size=1),
+    )
+    api_client.rate_limiter = RecordingRateLimiter()
+
+    stream = api_client.call_api_stream(request=None)
+    next(stream)
+    assert events == ['acquire', 'release']
+    next(stream)
+    assert events == ['acquire', 'release', 'acquire', 'release']
+
+  def test_fetcher_shares_limiter_by_alias(self):
+    limiter = rate_limiter.set_rate_limit('rest', {'requests_per_second': 5})
+
+    class RestApiReportFetcher(report_fetcher.ApiReportFetcher):
+      alias = 'rest'
+
+    fetchers = [
+      RestApiReportFetcher(api_clients.FakeApiClient(results=[{'field': 1}]))
+      for _ in range(2)
+    ]
+
+    assert all(f.api_client.rate_limiter is limiter for f in fetchers)
@@ -14,10 +14,12 @@
 from __future__ import annotations
 
 import json
+import math
 from collections import abc
 
 import pandas as pd
 import polars as pl
+import pyarrow as pa
 import pytest
 from garf.core import report
 
@@ -172,6 +174,57 @@ class TestGarfReport:
       with pytest.raises(report.GarfReportError):
         multi_column_report + single_element_report
 
+  class TestGarfReportConcat:
+    def test_concat_combines_reports_in_order(self):
+      reports = [
+        report.GarfReport(results=[[i]], column_names=['campaign_id'])
+        for i in range(3)
+      ]
+
+      combined_report = report.GarfReport.concat(reports)
+
+      assert combined_report.results == [[0], [1], [2]]
+      assert combined_report.column_names == ['campaign_id']
+
+    def test_concat_skips_empty_reports(
+      self, multi_column_report, empty_report
+    ):
+      combined_report = report.GarfReport.concat(
+        [empty_report, multi_column_report, empty_report, multi_column_report]
+      )
+
+      assert combined_report == multi_column_report + multi_column_report
+
+    def test_concat_keeps_results_placeholder(self, multi_column_report):
+      placeholder_report = report.GarfReport(
+        column_names=['campaign_id', 'ad_group_id'],
+        results_placeholder=[[0, 0]],
+      )
+
+      combined_report = report.GarfReport.concat(
+        [placeholder_report, multi_column_report, multi_column_report]
+      )
+
+      assert len(combined_report) == 6
+      assert combined_report.results_placeholder == [[0, 0]]
+
+    def test_concat_empty_sequence_returns_empty_report(self):
+      assert not report.GarfReport.concat([])
+
+    def test_concat_reports_with_different_columns_raises_exception(
+      self, multi_column_report, single_element_report
+    ):
+      with pytest.raises(report.GarfReportError):
+        report.GarfReport.concat([multi_column_report, single_element_report])
+
+    def test_concat_arrow_reports_keeps_arrow_table(self):
+      arrow_report = report.GarfReport.from_arrow(pa.table({'one': [1, 2]}))
+
+      combined_report = report.GarfReport.concat([arrow_report] * 3)
+
+      assert combined_report.is_columnar
+      assert len(combined_report) == 6
+
   class TestGarfReportSlicing:
     def test_slicing_empty_garf_report_returns_empty_list(
       self,
@@ -712,6 +765,94 @@ class TestGarfReport:
       )
       assert new_multi_column_report == multi_column_report
 
+  class TestGarfReportArrowBackend:
+    @pytest.fixture
+    def arrow_report(self):
+      return report.GarfReport.from_arrow(
+        pa.table({'campaign_id': [1, 2, 3], 'ad_group_id': [2, 3, 4]})
+      )
+
+    def test_from_arrow_does_not_materialize_rows(self, arrow_report):
+      assert arrow_report.is_columnar
+      assert len(arrow_report) == 3
+      assert arrow_report.column_names == ['campaign_id', 'ad_group_id']
+      assert arrow_report.is_columnar
+
+    def test_accessing_results_materializes_rows(self, arrow_report):
+      assert arrow_report.results == [[1, 2], [2, 3], [3, 4]]
+      assert not arrow_report.is_columnar
+
+    def test_materialize_converts_table_to_rows(self, arrow_report):
+      arrow_report.materialize()
+
+      assert not arrow_report.is_columnar
+      assert arrow_report.results == [[1, 2], [2, 3], [3, 4]]
+
+    def test_arrow_report_equals_list_report(
+      self, arrow_report, multi_column_report
+    ):
+      assert arrow_report == multi_column_report
+
+    def test_to_arrow_returns_table(self, multi_column_report):
+      expected = pa.table({'campaign_id': [1, 2, 3], 'ad_group_id': [2, 3, 4]})
+      assert multi_column_report.to_arrow().equals(expected)
+
+    def test_to_arrow_from_empty_report_returns_empty_table(self):
+      empty_report = report.GarfReport(results=[[]], column_names=['one'])
+      assert empty_report.to_arrow().num_rows == 0
+
+    def test_to_pandas_uses_arrow_table(self, arrow_report):
+      expected = pd.DataFrame(
+        data=[[1, 2], [2, 3], [3, 4]], columns=['campaign_id', 'ad_group_id']
+      )
+      assert arrow_report.to_pandas().equals(expected)
+      assert arrow_report.is_columnar
+
+    def test_to_polars_uses_arrow_table(self, arrow_report):
+      expected = pl.DataFrame(
+        data=[[1, 2], [2, 3], [3, 4]],
+        schema=['campaign_id', 'ad_group_id'],
+        orient='row',
+      )
+      assert arrow_report.to_polars().equals(expected)
+
+    def test_to_dict_from_arrow_report(self, arrow_report):
+      assert arrow_report.to_dict(
+        key_column='campaign_id',
+        value_column='ad_group_id',
+        value_column_output='scalar',
+      ) == {1: 2, 2: 3, 3: 4}
+
+    def test_to_list_dict_from_arrow_report(self, arrow_report):
+      assert arrow_report.to_list(row_type='dict') == [
+        {'campaign_id': 1, 'ad_group_id': 2},
+        {'campaign_id': 2, 'ad_group_id': 3},
+        {'campaign_id': 3, 'ad_group_id': 4},
+      ]
+
+    def test_columns_slice_keeps_arrow_table(self, arrow_report):
+      sliced_report = arrow_report[['ad_group_id']]
+      assert sliced_report.is_columnar
+      assert sliced_report.column_names == ['ad_group_id']
+
+    def test_add_two_arrow_reports_keeps_arrow_table(self, arrow_report):
+      combined_report = arrow_report + arrow_report
+      assert combined_report.is_columnar
+      assert len(combined_report) == 6
+
+    def test_renaming_columns_renames_arrow_table(self, arrow_report):
+      arrow_report.column_names = ['one', 'two']
+      assert arrow_report.to_arrow().column_names == ['one', 'two']
+
+    def test_from_pandas_keeps_pandas_values(self):
+      timestamp = pd.Timestamp('2026-01-01')
+      df = pd.DataFrame(data=[[float('nan'), timestamp]], columns=[1, 'two'])
+      report_from_df = report.GarfReport.from_pandas(df)
+      value, date = report_from_df.results[0]
+      assert math.isnan(value)
+      assert isinstance(date, pd.Timestamp)
+      assert report_from_df.column_names == [1, 'two']
+
 
 class TestGarfRow:
   @pytest.fixture
@@ -13,6 +13,7 @@
 # limitations under the License.
 
 
+import concurrent.futures
 import datetime
 import logging
 
@@ -23,6 +24,7 @@ from garf.core import (
   report,
   report_fetcher,
 )
+from opentelemetry import trace
 
 
 class TestApiReportFetcher:
@@ -95,6 +97,37 @@ class TestApiReportFetcher:
       assert 'Cached version of report is loaded' in caplog.text
       assert test_report == expected_report
 
+  def test_fetch_calls_api_once_for_concurrent_cached_fetches(self, tmp_path):
+    class CountingApiClient(api_clients.FakeApiClient):
+      num_calls = 0
+
+      def get_response(self, request=None, **kwargs):
+        CountingApiClient.num_calls += 1
+        return super().get_response(request, **kwargs)
+
+    test_api_client = CountingApiClient(
+      results=[{'column': 1}],
+      options=api_clients.FakeApiClientOptions(delay_seconds=0.2),
+    )
+    test_fetcher = report_fetcher.ApiReportFetcher(
+      api_client=test_api_client,
+      enable_cache=True,
+      cache_path=tmp_path,
+    )
+
+    with concurrent.futures.ThreadPoolExecutor(max_workers=4) as executor:
+      reports = list(
+        executor.map(
+          lambda _: test_fetcher.fetch('SELECT column FROM test'), range(4)
+        )
+      )
+
+    assert CountingApiClient.num_calls == 1
+    assert all(
+      test_report == report.GarfReport(results=[[1]], column_names=['column'])
+      for test_report in reports
+    )
+
   @pytest.mark.parametrize(
     ('select', 'expect'),
     [
@@ -192,3 +225,73 @@ class TestApiReportFetcher:
       expected_report.results_placeholder,
       expected_report.column_names,
     )
+
+  def test_fetch_stream_yields_report_for_each_page(self):
+    test_api_client = api_clients.FakeApiClient(
+      results=[
+        {'column': {'name': 1}, 'other_column': 2},
+        {'column': {'name': 2}, 'other_column': 2},
+        {'column': {'name': 3}, 'other_column': 2},
+      ],
+      options=api_clients.FakeApiClientOptions(page_size=2),
+    )
+    test_fetcher = report_fetcher.ApiReportFetcher(
+      api_client=test_api_client, parser=parsers.DictParser
+    )
+    query = 'SELECT column.name, other_column FROM test'
+
+    test_reports = list(test_fetcher.fetch_stream(query))
+
+    column_names = ['column_name', 'other_column']
+    expected_reports = [
+      report.GarfReport(results=[[1, 2], [2, 2]], column_names=column_names),
+      report.GarfReport(results=[[3, 2]], column_names=column_names),
+    ]
+    assert test_reports == expected_reports
+
+  def test_fetch_stream_does_not_leak_span_to_consumer(self, mocker):
+    span = mocker.MagicMock()
+    start_span = report_fetcher.tracer.start_span
+    mocker.patch.object(
+      report_fetcher.tracer,
+      'start_span',
+      side_effect=lambda name, *args, **kwargs: (
+        span if name == 'fetch_stream' else start_span(name, *args, **kwargs)
+      ),
+    )
+    test_api_client = api_clients.FakeApiClient(
+      results=[
+        {'column': {'name': 1}, 'other_column': 2},
+        {'column': {'name': 2}, 'other_column': 2},
+      ],
+      options=api_clients.FakeApiClientOptions(page_size=1),
+    )
+    test_fetcher = report_fetcher.ApiReportFetcher(
+      api_client=test_api_client, parser=parsers.DictParser
+    )
+    query = 'SELECT column.name, other_column FROM test'
+
+    stream = test_fetcher.fetch_stream(query)
+    next(stream)
+
+    assert trace.get_current_span() is not span
+    stream.close()
+    span.end.assert_called_once()
+
+  def test_fetch_stream_yields_results_placeholder_when_missing_results(self):
+    test_api_client = api_clients.FakeApiClient(
+      results=[],
+      results_placeholder=[
+        {'column': {'name': 1}, 'other_column': 2},
+      ],
+    )
+    test_fetcher = report_fetcher.ApiReportFetcher(
+      api_client=test_api_client, parser=parsers.DictParser
+    )
+    query = 'SELECT column.name, other_column FROM test'
+
+    test_reports = list(test_fetcher.fetch_stream(query))
+
+    assert len(test_reports) == 1
+    assert not test_reports[0]
+    assert test_reports[0].results_placeholder == [[1, 2]]
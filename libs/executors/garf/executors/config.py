@@ -22,7 +22,6 @@ import os
 import pathlib
 
 import pydantic
-import smart_open
 import yaml
 from garf.core import query_editor
 from garf.executors import utils
@@ -60,12 +59,16 @@ class Config(pydantic.BaseModel):
   @classmethod
   def from_file(cls, path: str | pathlib.Path | os.PathLike[str]) -> Config:
     """Builds config from local or remote yaml file."""
+    import smart_open
+
     with smart_open.open(path, 'r', encoding='utf-8') as f:
       data = yaml.safe_load(f)
     return Config(**data)
 
   def save(self, path: str | pathlib.Path | os.PathLike[str]) -> str:
     """Saves config to local or remote yaml file."""
+    import smart_open
+
     with smart_open.open(path, 'w', encoding='utf-8') as f:
       yaml.dump(self.model_dump(exclude_none=True), f, encoding='utf-8')
     return f'Config is saved to {str(path)}'
@@ -75,6 +75,9 @@ def main():
   parser.add_argument(
     '--parallel-threshold', dest='parallel_threshold', default=10, type=int
   )
+  parser.add_argument(
+    '--max-parallel', dest='max_parallel', default=None, type=int
+  )
   parser.add_argument(
     '--enable-cache', dest='enable_cache', action='store_true'
   )
@@ -181,7 +184,9 @@ def main():
   if args.parallel_queries and len(args.query) > 1:
     logger.info('Running queries in parallel')
     batch = {query: reader_client.read(query) for query in args.query}
-    query_executor.execute_batch(batch, context, args.parallel_threshold)
+    query_executor.execute_batch(
+      batch, context, args.parallel_threshold, args.max_parallel
+    )
   else:
     if len(args.query) > 1:
       logger.info('Running queries sequentially')
@@ -21,12 +21,9 @@ import sys
 from typing import Optional
 
 import garf.executors
-import garf.executors.garf_pb2 as pb
-import grpc
-import requests
 import typer
 from garf.core import cache
-from garf.executors import exceptions, garf_pb2_grpc, setup
+from garf.executors import exceptions, setup
 from garf.executors.config import Config
 from garf.executors.entrypoints import utils
 from garf.executors.entrypoints.tracer import (
@@ -36,7 +33,6 @@ from garf.executors.entrypoints.tracer import (
 from garf.executors.telemetry import tracer
 from garf.executors.workflows import workflow, workflow_runner
 from garf.io import reader, writer
-from google.protobuf.json_format import ParseDict
 from opentelemetry import trace
 from opentelemetry.instrumentation.auto_instrumentation import initialize
 from opentelemetry.trace.propagation.tracecontext import (
@@ -143,6 +139,12 @@ ParallelThreshold = Annotated[
     help='Number of parallel queries to run',
   ),
 ]
+MaxParallel = Annotated[
+  Optional[int],
+  typer.Option(
+    help='Max number of parallel queries, 4x parallel threshold by default',
+  ),
+]
 Logger = Annotated[
   utils.LoggerEnum,
   typer.Option(
@@ -202,6 +204,7 @@ def execute(
   ] = 'file',
   output: Output = 'console',
   parallel_threshold: ParallelThreshold = 10,
+  max_parallel: MaxParallel = None,
   loglevel: LogLevel = 'INFO',
   logger: Logger = 'rich',
   log_name: LogName = 'garf',
@@ -323,7 +326,9 @@ def execute(
     )
     if parallel_queries and len(batch) > 1:
       garf_logger.info('Running queries in parallel')
-      query_executor.execute_batch(batch, context, parallel_threshold)
+      query_executor.execute_batch(
+        batch, context, parallel_threshold, max_parallel
+      )
     else:
       if len(batch) > 1:
         garf_logger.info('Running queries sequentially')
@@ -469,6 +474,10 @@ def version() -> str:
 def _send_grpc(
   context, parallel_queries, batch, server_url, source, enable_cache, simulate
 ):
+  import garf.executors.garf_pb2 as pb
+  import grpc
+  from garf.executors import garf_pb2_grpc
+
   channel = grpc.insecure_channel(server_url)
   stub = garf_pb2_grpc.GarfServiceStub(channel)
   rest_context = context.model_dump()
@@ -509,6 +518,8 @@ def _send_grpc(
 def _send_http(
   context, parallel_queries, batch, server_url, source, enable_cache, simulate
 ):
+  import requests
+
   rest_context = context.model_dump()
   if rest_context.get('writer') == ['console']:
     del rest_context['writer']
@@ -556,6 +567,11 @@ def _send_http(
 
 
 def _run_worklow_grpc(server_url, workflow_data):
+  import garf.executors.garf_pb2 as pb
+  import grpc
+  from garf.executors import garf_pb2_grpc
+  from google.protobuf.json_format import ParseDict
+
   workflow_data.compile()
 
   channel = grpc.insecure_channel(server_url)
@@ -580,6 +596,8 @@ def _run_worklow_grpc(server_url, workflow_data):
 
 
 def _run_worklow_http(server_url, workflow_file):
+  import requests
+
   headers = {}
   TraceContextTextMapPropagator().inject(headers)
   endpoint = f'{server_url}/api/execute:workflow'
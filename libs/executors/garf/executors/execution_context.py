@@ -23,7 +23,6 @@ import pathlib
 from typing import Any
 
 import pydantic
-import smart_open
 import yaml
 from garf.core import query_editor
 from garf.io import writer
@@ -66,12 +65,16 @@ class ExecutionContext(pydantic.BaseModel):
     cls, path: str | pathlib.Path | os.PathLike[str]
   ) -> ExecutionContext:
     """Builds context from local or remote yaml file."""
+    import smart_open
+
     with smart_open.open(path, 'r', encoding='utf-8') as f:
       data = yaml.safe_load(f)
     return ExecutionContext(**data)
 
   def save(self, path: str | pathlib.Path | os.PathLike[str]) -> str:
     """Saves context to local or remote yaml file."""
+    import smart_open
+
     with smart_open.open(path, 'w', encoding='utf-8') as f:
       yaml.dump(self.model_dump(), f, encoding='utf-8')
     return f'ExecutionContext is saved to {str(path)}'
@@ -22,9 +22,16 @@ import inspect
 import logging
 import operator
 import time
+from concurrent import futures
 from typing import Optional
 
-from garf.core import query_editor, report, report_fetcher, simulator
+from garf.core import (
+  concurrency,
+  query_editor,
+  report,
+  report_fetcher,
+  simulator,
+)
 from garf.executors import (
   exceptions,
   execution_context,
@@ -33,10 +40,13 @@ from garf.executors import (
 )
 from garf.executors.telemetry import tracer
 from garf.io.writers import abs_writer
+from opentelemetry import context as otel_context
 from opentelemetry import trace
 
 logger = logging.getLogger(__name__)
 
+_MAX_PARALLEL_WRITERS = 4
+
 
 class Executor:
   """Defines common functionality between executors."""
@@ -143,6 +153,7 @@ class Executor:
     batch: dict[str, str],
     context: execution_context.ExecutionContext,
     parallel_threshold: int = 10,
+    max_parallel: int | None = None,
   ) -> dict[str, str | report.GarfReport]:
     """Executes batch of queries for a common context.
 
@@ -152,13 +163,20 @@ class Executor:
     Args:
       batch: Mapping between query_title and its text.
       context: Execution context.
-      parallel_threshold: Number of queries to execute in parallel.
+      parallel_threshold:
+        Initial number of queries to execute in parallel; adjusted based on
+        API latency and quota errors.
+      max_parallel:
+        Highest number of queries to execute in parallel, 4x
+        `parallel_threshold` by default.
 
     Returns:
       Results of execution.
     """
     span = trace.get_current_span()
     span.set_attribute('executor.parallel_threshold', parallel_threshold)
+    if max_parallel:
+      span.set_attribute('executor.max_parallel', max_parallel)
     span.set_attribute('executor.batch_size', len(batch))
     if self.preprocessors and not self.simulator:
       _handle_processors(processors=self.preprocessors, context=context)
@@ -167,7 +185,10 @@ class Executor:
     if len(batch) > 1:
       results = asyncio.run(
         self._run(
-          batch=batch, context=context, parallel_threshold=parallel_threshold
+          batch=batch,
+          context=context,
+          parallel_threshold=parallel_threshold,
+          max_parallel=max_parallel,
         )
       )
       results = functools.reduce(lambda x, y: x | y, results)
@@ -206,19 +227,21 @@ class Executor:
     batch: dict[str, str],
     context: execution_context.ExecutionContext,
     parallel_threshold: int,
+    max_parallel: int | None = None,
   ):
-    semaphore = asyncio.Semaphore(value=parallel_threshold)
+    limiter = concurrency.AdaptiveLimiter(
+      initial_limit=parallel_threshold, max_limit=max_parallel
+    )
 
-    async def run_with_semaphore(title, fn):
-      async with semaphore:
-        return {title: await fn}
+    async def run_with_limiter(title, fn):
+      return {title: await limiter.run(fn)}
 
     tasks = {
       title: self.aexecute(query=query, title=title, context=context)
       for title, query in batch.items()
     }
     return await asyncio.gather(
-      *(run_with_semaphore(title, task) for title, task in tasks.items())
+      *(run_with_limiter(title, task) for title, task in tasks.items())
     )
 
 
@@ -253,6 +276,23 @@ def write_many(
   results: report.GarfReport,
   title: str,
 ) -> Optional[str]:
+  """Writes report via all writers concurrently.
+
+  Failure of one writer does not stop the others; once all writers are
+  finished the exception of the first failed writer is re-raised.
+  At most `_MAX_PARALLEL_WRITERS` writers run at the same time.
+
+  Args:
+    writer_clients: Writers to write report with.
+    results: Report to write.
+    title: Name of the query.
+
+  Returns:
+    Result of writing by the last writer.
+
+  Raises:
+    Exception: Original exception raised by the first failed writer.
+  """
   span = trace.get_current_span()
   span.set_attributes(
     {
@@ -265,25 +305,67 @@ def write_many(
   )
   if not results:
     span.set_attribute('executor.report.is_placeholder', True)
+  results.materialize()
+
+  write_context = otel_context.get_current()
+
+  def write(
+    writer_client: abs_writer.AbsWriter,
+  ) -> tuple[str | None, Exception | None]:
+    token = otel_context.attach(write_context)
+    try:
+      return _write(writer_client, results, title), None
+    except Exception as e:
+      return None, e
+    finally:
+      otel_context.detach(token)
+
+  if len(writer_clients) > 1 and _MAX_PARALLEL_WRITERS > 1:
+    with futures.ThreadPoolExecutor(
+      max_workers=min(_MAX_PARALLEL_WRITERS, len(writer_clients))
+    ) as executor:
+      outcomes = list(executor.map(write, writer_clients))
+  else:
+    outcomes = [write(writer_client) for writer_client in writer_clients]
 
   writing_results = []
-  for writer_client in writer_clients:
-    start_time = time.perf_counter()
-    logger.debug(
-      'Start writing data for query %s via %s writer',
-      title,
-      type(writer_client),
-    )
-    writing_result = writer_client.write(results, title)
-    duration = time.perf_counter() - start_time
-    telemetry.write_histogram.record(
-      duration, {'writer_class': writer_client.__class__.__name__}
-    )
-    logger.debug(
-      'Finish writing data for query %s via %s writer',
-      title,
-      type(writer_client),
-    )
-    writing_results.append(writing_result)
+  failed_writers = {}
+  for writer_client, (writing_result, error) in zip(writer_clients, outcomes):
+    if error:
+      writer_name = writer_client.__class__.__name__
+      logger.error(
+        'Failed to write data for query %s via %s writer: %s',
+        title,
+        writer_name,
+        error,
+      )
+      telemetry.write_error_counter.add(1, {'writer_class': writer_name})
+      failed_writers[writer_name] = error
+    else:
+      writing_results.append(writing_result)
+  if failed_writers:
+    raise next(iter(failed_writers.values()))
   logger.info('%s executed successfully', title)
   return writing_results[-1] if writing_results else None
+
+
+def _write(
+  writer_client: abs_writer.AbsWriter, results: report.GarfReport, title: str
+) -> str | None:
+  start_time = time.perf_counter()
+  logger.debug(
+    'Start writing data for query %s via %s writer',
+    title,
+    type(writer_client),
+  )
+  writing_result = writer_client.write(results, title)
+  duration = time.perf_counter() - start_time
+  telemetry.write_histogram.record(
+    duration, {'writer_class': writer_client.__class__.__name__}
+  )
+  logger.debug(
+    'Finish writing data for query %s via %s writer',
+    title,
+    type(writer_client),
+  )
+  return writing_result
@@ -12,6 +12,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import functools
 import inspect
 import logging
 import sys
@@ -56,6 +57,13 @@ def get_report_fetcher(source: str) -> type[report_fetcher.ApiReportFetcher]:
   """
   if source not in find_fetchers():
     raise report_fetcher.MissingApiReportFetcherError(source)
+  return _load_report_fetcher(source)
+
+
+@functools.cache
+def _load_report_fetcher(
+  source: str,
+) -> type[report_fetcher.ApiReportFetcher]:
   for fetcher in get_entrypoints('garf'):
     if fetcher.name == source:
       try:
@@ -102,9 +110,14 @@ def get_report_simulator(source: str) -> type[simulator.ApiReportSimulator]:
     GarfApiReportSimulatorError: When simulator cannot be loaded.
     MissingApiReportSimulatorError: When simulator not found.
   """
-  span = trace.get_current_span()
   if source not in find_simulators():
     raise simulator.MissingApiReportSimulatorError(source)
+  return _load_report_simulator(source)
+
+
+@functools.cache
+def _load_report_simulator(source: str) -> type[simulator.ApiReportSimulator]:
+  span = trace.get_current_span()
   for sim in get_entrypoints('garf_simulator'):
     if sim.name == source:
       try:
@@ -158,7 +171,13 @@ def get(fetcher_module, alias):
   )
 
 
+@functools.cache
 def get_entrypoints(group='garf'):
+  """Returns entry points of a group.
+
+  Installed distributions are scanned once per group, use `invalidate_cache`
+  to discover fetchers installed afterwards.
+  """
   if sys.version_info.major == 3 and sys.version_info.minor == 9:
     try:
       fetchers = entry_points()[group]
@@ -166,4 +185,11 @@ def get_entrypoints(group='garf'):
       fetchers = []
   else:
     fetchers = entry_points(group=group)
-  return fetchers
+  return tuple(fetchers)
+
+
+def invalidate_cache() -> None:
+  """Forgets discovered entry points and loaded fetchers and simulators."""
+  get_entrypoints.cache_clear()
+  _load_report_fetcher.cache_clear()
+  _load_report_simulator.cache_clear()
@@ -30,7 +30,7 @@ from opentelemetry import trace
 
 logger = logging.getLogger('garf.executors.setup')
 
-_EXECUTORS_MODULES: dict[str, str] = {
+_EXECUTORS_MODULES: dict[str, dict[str, str]] = {
   'bq': {
     'import_path': 'garf.executors.bq_executor',
     'executor_class': 'BigQueryExecutor',
@@ -55,6 +55,11 @@ _EXECUTORS_MODULES: dict[str, str] = {
 
 
 def available_executors() -> set[str]:
+  """Identifies executors which modules can be imported.
+
+  Executor modules are imported only here, so CLI startup does not load heavy
+  libraries (BigQuery client, pandas, etc.).
+  """
   executors = []
   for k, v in _EXECUTORS_MODULES.items():
     with contextlib.suppress(ImportError):
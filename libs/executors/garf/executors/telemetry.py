@@ -85,6 +85,11 @@ write_histogram = meter.create_histogram(
   unit='s',
   description='Measures report writes duration in seconds',
 )
+write_error_counter = meter.create_counter(
+  'garf_write_errors_total',
+  unit='1',
+  description='Counts number of failed report writes',
+)
 
 executor_active_workflows = meter.create_up_down_counter(
   'garf_workflow_active',
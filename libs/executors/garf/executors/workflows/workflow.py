@@ -23,7 +23,6 @@ from collections import defaultdict
 from typing import Any, Final
 
 import pydantic
-import smart_open
 import yaml
 from garf.core import query_editor
 from garf.executors import config, exceptions, utils
@@ -158,12 +157,14 @@ class ExecutionStep(ExecutionContext):
     queries: Queries to run for a particular fetcher.
     context: Execution context for queries and fetcher.
     parallel_threshold: Max allowed parallelism for the queries in the step.
+    depends_on: Aliases of steps that should be completed before the step.
   """
 
   fetcher: str | None = None
   alias: str | None = pydantic.Field(default=None, pattern=r'^[a-zA-Z0-9_]+$')
   queries: list[Query | QueryPath | QueryDefinition | QueryFolder] | None = None
   parallel_threshold: int | None = None
+  depends_on: list[str] | None = None
 
   @property
   def context(self) -> ExecutionContext:
@@ -261,6 +262,8 @@ class Workflow(pydantic.BaseModel):
     config_file: str | pathlib.Path | os.PathLike[str] | None = None,
   ) -> Workflow:
     """Builds workflow from local or remote yaml file."""
+    import smart_open
+
     with smart_open.open(path, 'r', encoding='utf-8') as f:
       data = yaml.safe_load(f)
     try:
@@ -282,6 +285,8 @@ class Workflow(pydantic.BaseModel):
 
   def save(self, path: str | pathlib.Path | os.PathLike[str]) -> str:
     """Saves workflow to local or remote yaml file."""
+    import smart_open
+
     with smart_open.open(path, 'w', encoding='utf-8') as f:
       yaml.dump(
         self.model_dump(exclude_none=True, exclude={'prefix'}),
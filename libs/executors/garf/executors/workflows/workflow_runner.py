@@ -18,11 +18,13 @@ from __future__ import annotations
 import logging
 import pathlib
 import time
+from concurrent import futures
 
 import yaml
 from garf.executors import exceptions, setup, telemetry
 from garf.executors.telemetry import tracer
 from garf.executors.workflows import workflow
+from opentelemetry import context as otel_context
 from opentelemetry import trace
 
 logger = logging.getLogger(__name__)
@@ -33,10 +35,15 @@ _SCRIPT_PATH = pathlib.Path(__file__).parent
 class WorkflowRunner:
   """Runs garf workflow.
 
+  Steps run one after another unless they specify `depends_on` field;
+  a step with `depends_on` starts as soon as steps listed in it are completed
+  and can run concurrently with other steps.
+
   Attributes:
     workflow: Workflow to execute.
     wf_parent: Optional location of a workflow file.
     parallel_threshold: Max allowed parallelism for the queries in the workflow.
+    max_parallel_steps: Max number of steps running at the same time.
   """
 
   def __init__(
@@ -44,11 +51,13 @@ class WorkflowRunner:
     execution_workflow: workflow.Workflow,
     wf_parent: pathlib.Path | str | None = None,
     parallel_threshold: int = 10,
+    max_parallel_steps: int = 4,
   ) -> None:
     """Initializes WorkflowRunner."""
     self.workflow = execution_workflow
     self.wf_parent = wf_parent
     self.parallel_threshold = parallel_threshold
+    self.max_parallel_steps = max_parallel_steps
 
   @classmethod
   def from_file(
@@ -82,12 +91,13 @@ class WorkflowRunner:
       {
         'workflow.num_steps': len(steps),
         'workflow.fetchers': list(set(steps)),
+        'workflow.max_parallel_steps': self.max_parallel_steps,
       }
     )
     self.workflow.compile()
     skipped_aliases = skipped_aliases or []
     selected_aliases = selected_aliases or []
-    execution_results = {}
+    step_names = {}
     logger.info('Starting Garf Workflow...')
     for i, step in enumerate(self.workflow.steps, 1):
       step_name = f'{i}-{step.fetcher}'
@@ -110,80 +120,141 @@ class WorkflowRunner:
           step.alias,
         )
         continue
-      workflow_step_attributes = {
-        **workflow_attributes,
-        'workflow.step.name': step_name,
-      }
-      with tracer.start_as_current_span(step_name) as step_span:
-        logger.info(
-          'Running step %d, fetcher: %s, alias: %s', i, step.fetcher, step.alias
-        )
-        step_attributes = {
-          'workflow.step.alias': step.alias,
-          'workflow.step.fetcher': step.fetcher,
-        }
-        if step.writer:
-          step_attributes.update({'step.writer': step.writer})
-
-        step_span.set_attributes(step_attributes)
-
-        query_executor = setup.setup_executor(
-          source=step.fetcher,
-          fetcher_parameters=step.fetcher_parameters,
+      step_names[i] = step_name
+    dependencies = {
+      i: dependency & step_names.keys()
+      for i, dependency in _build_dependencies(self.workflow.steps).items()
+      if i in step_names
+    }
+
+    step_results = {}
+    run_context = otel_context.get_current()
+
+    def run_step(i: int) -> dict[str, str]:
+      token = otel_context.attach(run_context)
+      try:
+        return self._run_step(
+          i,
+          step_names[i],
           enable_cache=enable_cache,
           cache_ttl_seconds=cache_ttl_seconds,
           simulate=simulate,
-          writers=step.writer,
-          writer_parameters=step.writer_parameters,
         )
-        if fetcher_version := self.workflow.metadata.required_fetchers.get(
-          step.fetcher
-        ):
-          _validate_fetcher_version(
-            version=fetcher_version,
-            target_version=query_executor.fetcher.version,
-            fetcher_name=step.fetcher,
-          )
+      finally:
+        otel_context.detach(token)
 
-        batch = {}
-        if not (queries := step.queries):
-          logger.error('Please provide one or more queries to run')
-          raise exceptions.GarfExecutorError(
-            'Please provide one or more queries to run'
-          )
-        for query in queries:
-          if isinstance(query, workflow.QueryFolder):
-            for q in query.queries:
-              batch[q.title] = q.text
-          else:
-            batch[query.title] = query.text
-        try:
-          step_start_time = time.perf_counter()
-          step_span.set_attribute('workflow.step.num_queries', len(batch))
-          telemetry.executor_requested_counter.add(
-            len(batch), attributes={'executor.source': step.fetcher}
-          )
-          results = query_executor.execute_batch(
-            batch,
-            step.context,
-            step.parallel_threshold or self.parallel_threshold,
-          )
-          execution_results[step_name] = results
-          telemetry.workflow_step_counter.add(1, workflow_step_attributes)
-          step_duration = time.perf_counter() - step_start_time
-          telemetry.workflow_step_histogram.record(
-            step_duration, workflow_step_attributes
-          )
-        except exceptions.GarfExecutorError as e:
-          telemetry.workflow_step_error_counter.add(1, workflow_step_attributes)
-          telemetry.workflow_error_counter.add(1, workflow_attributes)
-          raise e
+    with futures.ThreadPoolExecutor(
+      max_workers=max(self.max_parallel_steps, 1)
+    ) as executor:
+      running: dict[futures.Future, int] = {}
+      error = None
+      while dependencies or running:
+        if not error:
+          for i in [i for i, deps in dependencies.items() if not deps]:
+            del dependencies[i]
+            running[executor.submit(run_step, i)] = i
+        if not running:
+          break
+        done, _ = futures.wait(running, return_when=futures.FIRST_COMPLETED)
+        for future in done:
+          i = running.pop(future)
+          try:
+            step_results[i] = future.result()
+          except Exception as e:
+            error = error or e
+            continue
+          for deps in dependencies.values():
+            deps.discard(i)
+      if error:
+        telemetry.workflow_error_counter.add(1, workflow_attributes)
+        raise error
+    execution_results = {
+      step_names[i]: step_results[i] for i in sorted(step_results)
+    }
     logger.info('Garf Workflow completed.')
     telemetry.workflow_counter.add(1, workflow_attributes)
     duration = time.perf_counter() - start_time
     telemetry.workflow_histogram.record(duration, workflow_attributes)
     return execution_results
 
+  def _run_step(
+    self,
+    i: int,
+    step_name: str,
+    enable_cache: bool = False,
+    cache_ttl_seconds: int = 3600,
+    simulate: bool = False,
+  ) -> dict[str, str]:
+    """Executes all queries of a single workflow step."""
+    step = self.workflow.steps[i - 1]
+    workflow_step_attributes = {
+      **self.workflow.attributes,
+      'workflow.step.name': step_name,
+    }
+    with tracer.start_as_current_span(step_name) as step_span:
+      logger.info(
+        'Running step %d, fetcher: %s, alias: %s', i, step.fetcher, step.alias
+      )
+      step_attributes = {
+        'workflow.step.alias': step.alias,
+        'workflow.step.fetcher': step.fetcher,
+      }
+      if step.writer:
+        step_attributes.update({'step.writer': step.writer})
+
+      step_span.set_attributes(step_attributes)
+
+      query_executor = setup.setup_executor(
+        source=step.fetcher,
+        fetcher_parameters=step.fetcher_parameters,
+        enable_cache=enable_cache,
+        cache_ttl_seconds=cache_ttl_seconds,
+        simulate=simulate,
+        writers=step.writer,
+        writer_parameters=step.writer_parameters,
+      )
+      if fetcher_version := self.workflow.metadata.required_fetchers.get(
+        step.fetcher
+      ):
+        _validate_fetcher_version(
+          version=fetcher_version,
+          target_version=query_executor.fetcher.version,
+          fetcher_name=step.fetcher,
+        )
+
+      batch = {}
+      if not (queries := step.queries):
+        logger.error('Please provide one or more queries to run')
+        raise exceptions.GarfExecutorError(
+          'Please provide one or more queries to run'
+        )
+      for query in queries:
+        if isinstance(query, workflow.QueryFolder):
+          for q in query.queries:
+            batch[q.title] = q.text
+        else:
+          batch[query.title] = query.text
+      try:
+        step_start_time = time.perf_counter()
+        step_span.set_attribute('workflow.step.num_queries', len(batch))
+        telemetry.executor_requested_counter.add(
+          len(batch), attributes={'executor.source': step.fetcher}
+        )
+        results = query_executor.execute_batch(
+          batch,
+          step.context,
+          step.parallel_threshold or self.parallel_threshold,
+        )
+        telemetry.workflow_step_counter.add(1, workflow_step_attributes)
+        step_duration = time.perf_counter() - step_start_time
+        telemetry.workflow_step_histogram.record(
+          step_duration, workflow_step_attributes
+        )
+        return results
+      except exceptions.GarfExecutorError as e:
+        telemetry.workflow_step_error_counter.add(1, workflow_step_attributes)
+        raise e
+
   def compile(self, path: str | pathlib.Path) -> str:
     """Saves workflow with expanded anchors."""
     self.workflow.compile()
@@ -225,3 +296,35 @@ def _validate_fetcher_version(
       f'by workflow - {version}.'
     )
   return True
+
+
+def _build_dependencies(
+  steps: list[workflow.ExecutionStep],
+) -> dict[int, set[int]]:
+  """Maps each step to the steps it depends on.
+
+  Steps are identified by their position in workflow (starting from 1).
+  Step without `depends_on` depends on all preceding steps.
+
+  Raises:
+    GarfWorkflowError: When step depends on unknown or subsequent step.
+  """
+  aliases = {step.alias: i for i, step in enumerate(steps, 1) if step.alias}
+  dependencies = {}
+  for i, step in enumerate(steps, 1):
+    if step.depends_on is not None:
+      step_dependencies = set()
+      for alias in step.depends_on:
+        if alias not in aliases:
+          raise workflow.GarfWorkflowError(
+            f'Step {i} depends on unknown step "{alias}"'
+          )
+        if aliases[alias] >= i:
+          raise workflow.GarfWorkflowError(
+            f'Step {i} can only depend on preceding steps, got "{alias}"'
+          )
+        step_dependencies.add(aliases[alias])
+    else:
+      step_dependencies = set(range(1, i))
+    dependencies[i] = step_dependencies
+  return dependencies
@@ -0,0 +1,60 @@
+# Copyright 2026 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Guards CLI startup time against eager imports of heavy libraries."""
+
+from __future__ import annotations
+
+import json
+import subprocess
+import sys
+
+import pytest
+
+_HEAVY_MODULES = (
+  'duckdb',
+  'google.cloud.bigquery',
+  'numpy',
+  'pandas',
+  'polars',
+  'pyarrow',
+  'redis',
+  'requests',
+  'smart_open',
+  'sqlalchemy',
+)
+
+
+def _imported_heavy_modules(statement: str) -> list[str]:
+  code = (
+    f'import json, sys; {statement}; '
+    f'print(json.dumps([m for m in {_HEAVY_MODULES!r} if m in sys.modules]))'
+  )
+  result = subprocess.run(
+    [sys.executable, '-c', code],
+    capture_output=True,
+    text=True,
+    check=True,
+  )
+  return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+@pytest.mark.parametrize(
+  'statement',
+  [
+    'import garf.executors.entrypoints.typer_cli',
+    'from garf.executors import setup',
+  ],
+)
+def test_startup_does_not_import_heavy_modules(statement):
+  assert _imported_heavy_modules(statement) == []
@@ -18,7 +18,7 @@ import pathlib
 
 import garf.core
 import pytest
-from garf.core import api_clients, parsers, report_fetcher
+from garf.core import api_clients, concurrency, parsers, report_fetcher
 from garf.core.fetchers import fake as fake_fetcher
 from garf.executors import api_executor, execution_context
 from garf.io.writers import json_writer
@@ -206,3 +206,21 @@ class TestApiQueryExecutor:
     # Verify console output was generated
     output = capsys.readouterr().out
     assert 'showing results' in output and 'test' in output
+
+  def test_execute_batch_uses_max_parallel_as_concurrency_ceiling(
+    self, mocker, executor, tmp_path
+  ):
+    limiter = mocker.spy(concurrency, 'AdaptiveLimiter')
+    context = execution_context.ExecutionContext(
+      writer='json',
+      writer_parameters={'destination_folder': str(tmp_path)},
+    )
+
+    executor.execute_batch(
+      batch={'first': _TEST_QUERY, 'second': _TEST_QUERY},
+      context=context,
+      parallel_threshold=2,
+      max_parallel=6,
+    )
+
+    limiter.assert_called_once_with(initial_limit=2, max_limit=6)
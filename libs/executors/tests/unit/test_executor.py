@@ -0,0 +1,87 @@
+# Copyright 2026 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+from __future__ import annotations
+
+import time
+
+import pytest
+from garf.core import report
+from garf.executors import executor
+from garf.io.writers import abs_writer
+
+
+class SlowWriter(abs_writer.AbsWriter):
+  def __init__(self, delay_seconds: float = 0.2, **kwargs) -> None:
+    super().__init__(**kwargs)
+    self.delay_seconds = delay_seconds
+    self.written = []
+
+  def write(self, report: report.GarfReport, destination: str) -> str:
+    time.sleep(self.delay_seconds)
+    self.written.append(report.to_list(row_type='dict'))
+    return f'{destination} is written'
+
+
+class FailingWriter(abs_writer.AbsWriter):
+  def write(self, report: report.GarfReport, destination: str) -> str:
+    raise ValueError('Failed to write')
+
+
+@pytest.fixture
+def test_report():
+  return report.GarfReport(results=[[1], [2]], column_names=['id'])
+
+
+class TestWriteMany:
+  def test_write_many_runs_writers_concurrently(self, test_report):
+    writers = [SlowWriter(), SlowWriter(), SlowWriter()]
+
+    start = time.perf_counter()
+    result = executor.write_many(writers, test_report, 'test')
+    duration = time.perf_counter() - start
+
+    assert result == 'test is written'
+    assert duration < 0.5
+    assert all(writer.written == [[{'id': 1}, {'id': 2}]] for writer in writers)
+
+  def test_write_many_runs_writers_sequentially_with_single_parallel_writer(
+    self, monkeypatch, test_report
+  ):
+    monkeypatch.setattr(executor, '_MAX_PARALLEL_WRITERS', 1)
+    writers = [SlowWriter(delay_seconds=0.1), SlowWriter(delay_seconds=0.1)]
+
+    start = time.perf_counter()
+    executor.write_many(writers, test_report, 'test')
+
+    assert time.perf_counter() - start >= 0.2
+
+  def test_write_many_isolates_failed_writer(self, test_report):
+    successful_writer = SlowWriter(delay_seconds=0)
+
+    with pytest.raises(ValueError, match='Failed to write'):
+      executor.write_many(
+        [FailingWriter(), successful_writer], test_report, 'test'
+      )
+
+    assert successful_writer.written == [[{'id': 1}, {'id': 2}]]
+
+  def test_write_many_materializes_arrow_backed_report_before_writing(self):
+    pa = pytest.importorskip('pyarrow')
+    test_report = report.GarfReport.from_arrow(pa.table({'id': [1, 2]}))
+    writers = [SlowWriter(delay_seconds=0), SlowWriter(delay_seconds=0)]
+
+    executor.write_many(writers, test_report, 'test')
+
+    assert not test_report.is_columnar
+    assert all(writer.written == [[{'id': 1}, {'id': 2}]] for writer in writers)
@@ -0,0 +1,41 @@
+# Copyright 2026 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import pytest
+from garf.core import report_fetcher
+from garf.core.fetchers import fake
+from garf.executors import fetchers
+
+
+def test_get_report_fetcher_returns_cached_fetcher():
+  fetchers.invalidate_cache()
+  first = fetchers.get_report_fetcher('fake')
+  second = fetchers.get_report_fetcher('fake')
+
+  assert first is second is fake.FakeApiReportFetcher
+  assert fetchers.get_entrypoints.cache_info().misses == 1
+  assert fetchers._load_report_fetcher.cache_info().hits == 1
+
+
+def test_get_report_fetcher_raises_error_on_missing_fetcher():
+  with pytest.raises(report_fetcher.MissingApiReportFetcherError):
+    fetchers.get_report_fetcher('non-existing-source')
+
+
+def test_invalidate_cache_rescans_entrypoints():
+  fetchers.find_fetchers()
+  fetchers.invalidate_cache()
+
+  assert fetchers.get_entrypoints.cache_info().currsize == 0
+  assert 'fake' in fetchers.find_fetchers()
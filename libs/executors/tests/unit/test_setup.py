@@ -0,0 +1,29 @@
+# Copyright 2026 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import importlib
+
+from garf.executors import setup
+
+
+def test_available_executors_skips_executor_failing_to_import(monkeypatch):
+  import_module = importlib.import_module
+
+  def fake_import_module(name, *args, **kwargs):
+    if name == 'garf.executors.sql_executor':
+      raise ImportError(name)
+    return import_module(name, *args, **kwargs)
+
+  monkeypatch.setattr(setup.importlib, 'import_module', fake_import_module)
+
+  assert 'sqldb' not in setup.available_executors()
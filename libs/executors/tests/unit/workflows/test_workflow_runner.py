@@ -12,9 +12,11 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 import pathlib
+import threading
 
+import pytest
 from garf.executors.workflows import workflow_runner
-from garf.executors.workflows.workflow import Workflow
+from garf.executors.workflows.workflow import GarfWorkflowError, Workflow
 
 _SCRIPT_PATH = pathlib.Path(__file__).parent
 
@@ -40,3 +42,112 @@ class TestWorkflowRunner:
     runner = workflow_runner.WorkflowRunner.from_file(_TEST_WORKFLOW_PATH)
     result = runner.deploy(tmp_workflow_path)
     assert result == f'Workflow is saved to {tmp_workflow_path}'
+
+
+class TestWorkflowRunnerScheduling:
+  @pytest.fixture
+  def fake_step(self):
+    return {
+      'fetcher': 'fake',
+      'queries': [{'query': {'title': 'test', 'text': 'SELECT 1 AS one'}}],
+    }
+
+  @pytest.fixture
+  def recorded_events(self, monkeypatch):
+    events = []
+
+    def fake_run_step(self, i, step_name, **kwargs):
+      events.append(f'start {step_name}')
+      events.append(f'end {step_name}')
+      return {}
+
+    monkeypatch.setattr(
+      workflow_runner.WorkflowRunner, '_run_step', fake_run_step
+    )
+    return events
+
+  def test_run_executes_steps_without_depends_on_sequentially(
+    self, fake_step, recorded_events
+  ):
+    workflow = Workflow(
+      steps=[{**fake_step, 'alias': 'first'}, {**fake_step, 'alias': 'second'}]
+    )
+    runner = workflow_runner.WorkflowRunner(execution_workflow=workflow)
+    results = runner.run()
+
+    assert list(results) == ['1-fake-first', '2-fake-second']
+    assert recorded_events == [
+      'start 1-fake-first',
+      'end 1-fake-first',
+      'start 2-fake-second',
+      'end 2-fake-second',
+    ]
+
+  def test_run_executes_independent_steps_concurrently(
+    self, fake_step, monkeypatch
+  ):
+    barrier = threading.Barrier(2, timeout=5)
+
+    def fake_run_step(self, i, step_name, **kwargs):
+      # Fails with BrokenBarrierError unless both steps run at the same time.
+      barrier.wait()
+      return {}
+
+    monkeypatch.setattr(
+      workflow_runner.WorkflowRunner, '_run_step', fake_run_step
+    )
+    workflow = Workflow(
+      steps=[
+        {**fake_step, 'alias': 'first', 'depends_on': []},
+        {**fake_step, 'alias': 'second', 'depends_on': []},
+      ]
+    )
+    runner = workflow_runner.WorkflowRunner(execution_workflow=workflow)
+    results = runner.run()
+
+    assert list(results) == ['1-fake-first', '2-fake-second']
+
+  def test_run_waits_for_steps_in_depends_on(self, fake_step, recorded_events):
+    workflow = Workflow(
+      steps=[
+        {**fake_step, 'alias': 'first', 'depends_on': []},
+        {**fake_step, 'alias': 'second', 'depends_on': ['first']},
+      ]
+    )
+    runner = workflow_runner.WorkflowRunner(execution_workflow=workflow)
+    runner.run()
+
+    assert recorded_events == [
+      'start 1-fake-first',
+      'end 1-fake-first',
+      'start 2-fake-second',
+      'end 2-fake-second',
+    ]
+
+  def test_run_executes_steps_sequentially_with_single_parallel_step(
+    self, fake_step, recorded_events
+  ):
+    workflow = Workflow(
+      steps=[
+        {**fake_step, 'alias': 'first', 'depends_on': []},
+        {**fake_step, 'alias': 'second', 'depends_on': []},
+      ]
+    )
+    runner = workflow_runner.WorkflowRunner(
+      execution_workflow=workflow, max_parallel_steps=1
+    )
+    runner.run()
+
+    assert recorded_events == [
+      'start 1-fake-first',
+      'end 1-fake-first',
+      'start 2-fake-second',
+      'end 2-fake-second',
+    ]
+
+  def test_run_raises_error_on_unknown_dependency(self, fake_step):
+    workflow = Workflow(steps=[{**fake_step, 'depends_on': ['missing']}])
+    runner = workflow_runner.WorkflowRunner(execution_workflow=workflow)
+
+    with pytest.raises(GarfWorkflowError, match='unknown step'):
+      runner.run()
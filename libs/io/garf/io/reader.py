@@ -15,7 +15,6 @@
 import abc
 import enum
 
-import smart_open
 from typing_extensions import override
 
 
@@ -37,6 +36,8 @@ class FileReader(AbsReader):
 
   @override
   def read(self, query_path, **kwargs):
+    import smart_open
+
     with smart_open.open(query_path, 'r') as f:
       return f.read()
 
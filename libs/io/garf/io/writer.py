@@ -16,6 +16,7 @@
 from __future__ import annotations
 
 import enum
+import functools
 import inspect
 import sys
 from importlib.metadata import entry_points
@@ -27,6 +28,7 @@ from garf.io.writers import abs_writer
 from opentelemetry import trace
 
 
+@functools.cache
 @tracer.start_as_current_span('get_writers')
 def _get_writers():
   if sys.version_info.major == 3 and sys.version_info.minor == 9:
@@ -36,13 +38,25 @@ def _get_writers():
       writers = []
   else:
     writers = entry_points(group='garf_writer')
-  return writers
+  return tuple(writers)
+
+
+def invalidate_cache() -> None:
+  """Forgets discovered and loaded writers.
+
+  Writers are discovered once per process; invalidation allows to pick up
+  writers installed afterwards.
+  """
+  _get_writers.cache_clear()
+  _load_writer.cache_clear()
 
 
 class StrEnumBase(str, enum.Enum):
   """String enum."""
 
 
+# Snapshot of writers available on import; `create_writer` validates options
+# against currently discovered writers.
 _writer_options = {writer.name: writer.name for writer in _get_writers()}
 
 WriterOption = enum.Enum(
@@ -77,10 +91,19 @@ def create_writer(
     GarfIoError: When incorrect writer option is specified.
   """
   span = trace.get_current_span()
-  try:
-    WriterOption[writer_option]
-  except KeyError as e:
-    raise GarfIoWriterError(f'{writer_option} is unknown writer type!') from e
+  writer_option = getattr(writer_option, 'value', writer_option)
+  if writer_option not in {writer.name for writer in _get_writers()}:
+    raise GarfIoWriterError(f'{writer_option} is unknown writer type!')
+  concrete_writer = _load_writer(writer_option)
+  span.set_attribute('writer.alias', writer_option)
+  for k, v in kwargs.items():
+    span.set_attribute(f'{writer_option}.{k}', v)
+  return concrete_writer(**kwargs)
+
+
+@functools.cache
+def _load_writer(writer_option: str) -> type[abs_writer.AbsWriter]:
+  """Loads writer class; failed lookups raise and are not cached."""
   found_writers = {}
   for writer in _get_writers():
     try:
@@ -97,10 +120,7 @@ def create_writer(
         raise e
       continue
   if concrete_writer := found_writers.get(writer_option):
-    span.set_attribute('writer.alias', writer_option)
-    for k, v in kwargs.items():
-      span.set_attribute(f'{writer_option}.{k}', v)
-    return concrete_writer(**kwargs)
+    return concrete_writer
   raise GarfIoWriterError(f'Failed to load {writer_option}!')
 
 
@@ -18,6 +18,7 @@ from __future__ import annotations
 import abc
 import asyncio
 import logging
+from collections.abc import Iterable
 from typing import Literal
 
 import pydantic
@@ -59,10 +60,45 @@ class AbsWriter(abc.ABC):
       self.write, report=report, destination=destination
     )
 
+  async def awrite_chunks(
+    self, reports: Iterable[GarfReport], destination: str
+  ) -> str | None:
+    """Writes report chunks to destination."""
+    return await asyncio.to_thread(
+      self.write_chunks, reports=reports, destination=destination
+    )
+
   @abc.abstractmethod
   def write(self, report: GarfReport, destination: str) -> str | None:
     """Writes report to destination."""
 
+  def write_chunks(
+    self, reports: Iterable[GarfReport], destination: str
+  ) -> str | None:
+    """Writes report chunks to destination.
+
+    Writers that can append data to destination incrementally override this
+    method; by default all chunks are combined into a single report.
+
+    Args:
+      reports: Chunks of the same report.
+      destination: Where report should be written to.
+    """
+    results = []
+    combined_report = GarfReport()
+    for report in reports:
+      results.extend(report.results)
+      combined_report = report
+    return self.write(
+      GarfReport(
+        results=results,
+        column_names=combined_report.column_names,
+        results_placeholder=combined_report.results_placeholder,
+        query_specification=combined_report.query_specification,
+      ),
+      destination,
+    )
+
   @tracer.start_as_current_span('format_for_write')
   def format_for_write(self, report: GarfReport) -> GarfReport:
     """Prepares report for writing."""
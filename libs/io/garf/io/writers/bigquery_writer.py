@@ -28,6 +28,7 @@ except ImportError as e:
 
 import contextlib
 import logging
+from collections.abc import Iterable
 
 import numpy as np
 import pydantic
@@ -194,33 +195,63 @@ class BigQueryWriter(abs_writer.AbsWriter):
     Returns:
       Name of the table in `dataset.table` format.
     """
-    span = trace.get_current_span()
-    report = self.format_for_write(report)
+    return self.write_chunks([report], destination)
+
+  @tracer.start_as_current_span('bq.write_chunks')
+  def write_chunks(
+    self, reports: Iterable[garf_report.GarfReport], destination: str
+  ) -> str:
+    """Writes chunks of Garf report to a BigQuery table one by one.
+
+    The first chunk is written according to `write_disposition`,
+    all subsequent chunks are appended to the table.
+    Table schema comes from chunks, so when `reports` is empty no table
+    is created and an existing table is left unchanged; empty reports
+    (with placeholder) produce an empty table with the schema.
+
+    Args:
+      reports: Chunks of Garf report.
+      destination: Name of the table report should be written to.
+
+    Returns:
+      Name of the table in `dataset.table` format.
+    """
     destination = formatter.format_extension(
       destination, prefix=self.options.prefix, suffix=self.options.suffix
     )
     table = f'{self.options.dataset_id}.{destination}'
+    if_exists = self.options.write_disposition
+    is_first_chunk = True
+    for report in reports:
+      df = self._to_dataframe(self.format_for_write(report))
+      logger.debug('Writing %d rows of data to %s', len(df), destination)
+      pandas_gbq.to_gbq(
+        dataframe=df,
+        project_id=self.options.project,
+        destination_table=table,
+        if_exists=if_exists,
+        progress_bar=False,
+        time_partitioning_column=self.options.time_partitioning_column,
+        time_partitioning_type=self.options.time_partitioning_type,
+        time_partitioning_expiration_ms=self.options.time_partitioning_expiration_ms,
+        range_partitioning_column=self.options.range_partitioning_column,
+        range_partitioning_range=self.options.range_partitioning_range,
+        clustering_columns=self.options.clustering_columns,
+      )
+      if_exists = 'append'
+      is_first_chunk = False
+    if is_first_chunk:
+      logger.warning('No data to write to %s, table is not created', table)
+    logger.debug('Writing to %s is completed', destination)
+    return f'[BigQuery] - at {self.options.dataset_id}.{destination}'
+
+  def _to_dataframe(self, report: garf_report.GarfReport) -> pd.DataFrame:
+    """Converts report or its placeholder to DataFrame."""
     if not report:
       df = pd.DataFrame(
         data=report.results_placeholder, columns=report.column_names
       ).head(0)
-      span.set_attribute('is_placeholder_report', True)
+      trace.get_current_span().set_attribute('is_placeholder_report', True)
     else:
       df = report.to_pandas()
-    df = df.replace({np.nan: None})
-    logger.debug('Writing %d rows of data to %s', len(df), destination)
-    pandas_gbq.to_gbq(
-      dataframe=df,
-      project_id=self.options.project,
-      destination_table=table,
-      if_exists=self.options.write_disposition,
-      progress_bar=False,
-      time_partitioning_column=self.options.time_partitioning_column,
-      time_partitioning_type=self.options.time_partitioning_type,
-      time_partitioning_expiration_ms=self.options.time_partitioning_expiration_ms,
-      range_partitioning_column=self.options.range_partitioning_column,
-      range_partitioning_range=self.options.range_partitioning_range,
-      clustering_columns=self.options.clustering_columns,
-    )
-    logger.debug('Writing to %s is completed', destination)
-    return f'[BigQuery] - at {self.options.dataset_id}.{destination}'
+    return df.replace({np.nan: None})
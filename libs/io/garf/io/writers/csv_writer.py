@@ -22,6 +22,7 @@ import csv
 import logging
 import os
 import pathlib
+from collections.abc import Iterable
 from typing import Literal, Union
 
 import smart_open
@@ -83,7 +84,21 @@ class CsvWriter(file_writer.FileWriter):
     Returns:
       Full path where data are written.
     """
-    report = self.format_for_write(report)
+    return self.write_chunks([report], destination)
+
+  @tracer.start_as_current_span('csv.write_chunks')
+  def write_chunks(
+    self, reports: Iterable[garf_report.GarfReport], destination: str
+  ) -> str:
+    """Writes chunks of Garf report to a CSV file one by one.
+
+    Args:
+      reports: Chunks of Garf report.
+      destination: Base file name report should be written to.
+
+    Returns:
+      Full path where data are written.
+    """
     destination = formatter.format_extension(
       destination,
       new_extension='.csv',
@@ -91,7 +106,6 @@ class CsvWriter(file_writer.FileWriter):
       suffix=self.options.suffix,
     )
     self.create_dir()
-    logger.debug('Writing %d rows of data to %s', len(report), destination)
     output_path = os.path.join(self.destination_folder, destination)
     with smart_open.open(
       output_path,
@@ -104,7 +118,17 @@ class CsvWriter(file_writer.FileWriter):
         quotechar=self.quotechar,
         quoting=self.quoting,
       )
-      writer.writerow(report.column_names)
-      writer.writerows(report.results)
+      is_first_chunk = True
+      for report in reports:
+        report = self.format_for_write(report)
+        if is_first_chunk:
+          writer.writerow(report.column_names)
+          is_first_chunk = False
+        logger.debug('Writing %d rows of data to %s', len(report), destination)
+        writer.writerows(report.results)
+      if is_first_chunk:
+        # No chunks were provided, write the same file as for empty report.
+        empty_report = self.format_for_write(garf_report.GarfReport())
+        writer.writerow(empty_report.column_names)
     logger.debug('Writing to %s is completed', output_path)
     return f'[CSV] - at {output_path}'
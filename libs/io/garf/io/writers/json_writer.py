@@ -15,9 +15,11 @@
 
 from __future__ import annotations
 
+import json
 import logging
 import os
 import pathlib
+from collections.abc import Iterable
 from typing import Literal, Union
 
 import smart_open
@@ -65,7 +67,21 @@ class JsonWriter(file_writer.FileWriter):
     Returns:
       Base filename where data are written.
     """
-    report = self.format_for_write(report)
+    return self.write_chunks([report], destination)
+
+  @tracer.start_as_current_span('json.write_chunks')
+  def write_chunks(
+    self, reports: Iterable[garf_report.GarfReport], destination: str
+  ) -> str:
+    """Writes chunks of Garf report to a JSON file one by one.
+
+    Args:
+      reports: Chunks of Garf report.
+      destination: Base file name report should be written to.
+
+    Returns:
+      Base filename where data are written.
+    """
     file_extension = '.json' if self.format == 'json' else '.jsonl'
     destination = formatter.format_extension(
       destination,
@@ -74,9 +90,21 @@ class JsonWriter(file_writer.FileWriter):
       suffix=self.options.suffix,
     )
     self.create_dir()
-    logger.debug('Writing %d rows of data to %s', len(report), destination)
     output_path = os.path.join(self.destination_folder, destination)
+    separator = ', ' if self.format == 'json' else '\n'
     with smart_open.open(output_path, 'w', encoding='utf-8') as f:
-      f.write(report.to_json(output=self.format))
+      if self.format == 'json':
+        f.write('[')
+      is_first_row = True
+      for report in reports:
+        report = self.format_for_write(report)
+        logger.debug('Writing %d rows of data to %s', len(report), destination)
+        for row in report.to_list(row_type='dict'):
+          if not is_first_row:
+            f.write(separator)
+          f.write(json.dumps(row))
+          is_first_row = False
+      if self.format == 'json':
+        f.write(']')
     logger.debug('Writing to %s is completed', output_path)
     return f'[JSON] - at {output_path}'
@@ -14,6 +14,7 @@
 """Shared functionality of writing GarfReport to Search index."""
 
 import logging
+from collections.abc import Iterable, Iterator
 from typing import Any, List, Union
 
 from garf.core import report as garf_report
@@ -70,8 +71,18 @@ class SearchWriter(abs_writer.AbsWriter):
       report: GarfReport to write.
       destination: Index name.
     """
+    return self.write_chunks([report], destination)
+
+  def write_chunks(
+    self, reports: Iterable[garf_report.GarfReport], destination: str
+  ) -> str:
+    """Writes chunks of report as a single stream of bulk actions.
+
+    Args:
+      reports: Chunks of GarfReport to write.
+      destination: Index name.
+    """
     with tracer.start_as_current_span(f'{self.name.lower()}.write'):
-      report = self.format_for_write(report)
       destination = formatter.format_extension(
         destination,
         prefix=self.options.prefix,
@@ -79,10 +90,13 @@ class SearchWriter(abs_writer.AbsWriter):
       )
       self._create_index_if_not_exists(destination)
 
-      data = report.to_list(row_type='dict')
-      actions = [{'_index': destination, '_source': row} for row in data]
+      def actions() -> Iterator[dict[str, Any]]:
+        for report in reports:
+          data = self.format_for_write(report).to_list(row_type='dict')
+          for row in data:
+            yield {'_index': destination, '_source': row}
 
-      success, failed = self.bulk(self.client, actions)
+      success, failed = self.bulk(self.client, actions())
       return (
         f'[{self.name}] - successfully indexed {success} documents to '
         f'{destination}. Failed: {failed}'
@@ -24,6 +24,7 @@ except ImportError as e:
   ) from e
 
 import logging
+from collections.abc import Iterable
 
 import pandas as pd
 from garf.core import report as garf_report
@@ -67,35 +68,64 @@ class SqlAlchemyWriter(abs_writer.AbsWriter):
       report: GarfReport to be written.
       destination: Name of the output table.
     """
-    report = self.format_for_write(report)
+    self.write_chunks([report], destination)
+
+  @tracer.start_as_current_span('sqldb.write_chunks')
+  def write_chunks(
+    self, reports: Iterable[garf_report.GarfReport], destination: str
+  ) -> None:
+    """Writes chunks of Garf report to the table one by one.
+
+    The first chunk is written according to `if_exists`,
+    all subsequent chunks are appended to the table.
+    Table schema comes from chunks, so when `reports` is empty no table
+    is created and an existing table is left unchanged; empty reports
+    (with placeholder) produce an empty table with the schema.
+
+    Args:
+      reports: Chunks of GarfReport to be written.
+      destination: Name of the output table.
+    """
     destination = formatter.format_extension(
       destination,
       prefix=self.options.prefix,
       suffix=self.options.suffix,
     )
-    dtypes = {}
-    if report:
-      for column in report.column_names:
-        if (isinstance(report[0][column], dict)) or (
-          not report and isinstance(report.results_placeholder[0][column], dict)
-        ):
-          dtypes.update({column: sqlalchemy.types.JSON})
-    if not report:
-      df = pd.DataFrame(
-        data=report.results_placeholder, columns=report.column_names
-      ).head(0)
-    else:
-      df = report.to_pandas()
-    logger.debug('Writing %d rows of data to %s', len(df), destination)
-    write_params = {
-      'name': destination,
-      'con': self.engine,
-      'index': False,
-      'if_exists': self.if_exists,
-    }
-    if dtypes:
-      write_params.update({'dtype': dtypes})
-    df.to_sql(**write_params)
+    engine = self.engine
+    if_exists = self.if_exists
+    is_first_chunk = True
+    for report in reports:
+      report = self.format_for_write(report)
+      dtypes = {}
+      if report:
+        for column in report.column_names:
+          if (isinstance(report[0][column], dict)) or (
+            not report
+            and isinstance(report.results_placeholder[0][column], dict)
+          ):
+            dtypes.update({column: sqlalchemy.types.JSON})
+      if not report:
+        df = pd.DataFrame(
+          data=report.results_placeholder, columns=report.column_names
+        ).head(0)
+      else:
+        df = report.to_pandas()
+      logger.debug('Writing %d rows of data to %s', len(df), destination)
+      write_params = {
+        'name': destination,
+        'con': engine,
+        'index': False,
+        'if_exists': if_exists,
+      }
+      if dtypes:
+        write_params.update({'dtype': dtypes})
+      df.to_sql(**write_params)
+      if_exists = 'append'
+      is_first_chunk = False
+    if is_first_chunk:
+      logger.warning(
+        'No data to write to %s, table is not created', destination
+      )
     logger.debug('Writing to %s is completed', destination)
 
   @property
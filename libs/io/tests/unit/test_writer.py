@@ -13,6 +13,8 @@
 # limitations under the License.
 from __future__ import annotations
 
+import types
+
 import pytest
 from garf.io import writer
 
@@ -76,3 +78,66 @@ def test_create_writer_returns_correct_fields_for_json_option(option):
 def test_null_writer_raises_unknown_writer_error():
   with pytest.raises(writer.GarfIoWriterError):
     writer.create_writer('non-existing-option')
+
+
+def test_create_writer_reuses_discovered_writers():
+  writer.invalidate_cache()
+  writer.create_writer('csv', destination_folder='/fake_folder')
+  writer.create_writer('json', destination_folder='/fake_folder')
+
+  assert writer._get_writers.cache_info().misses == 1
+
+
+def test_invalidate_cache_discovers_writers_again():
+  writer.create_writer('csv', destination_folder='/fake_folder')
+  writer.invalidate_cache()
+  csv_writer = writer.create_writer('csv', destination_folder='/fake_folder')
+
+  assert writer._get_writers.cache_info().misses == 1
+  assert csv_writer.destination_folder == '/fake_folder'
+
+
+def _get_csv_writer_module():
+  return next(
+    entry_point
+    for entry_point in writer._get_writers()
+    if entry_point.name == 'csv'
+  ).load()
+
+
+def test_create_writer_accepts_writer_discovered_after_invalidation(mocker):
+  new_entry_point = mocker.Mock(load=_get_csv_writer_module)
+  new_entry_point.name = 'new-csv'
+  mocker.patch.object(
+    writer,
+    'entry_points',
+    return_value=[*writer._get_writers(), new_entry_point],
+  )
+  writer.invalidate_cache()
+
+  new_writer = writer.create_writer(
+    'new-csv', destination_folder='/fake_folder'
+  )
+
+  writer.invalidate_cache()
+  assert new_writer.destination_folder == '/fake_folder'
+
+
+def test_create_writer_does_not_cache_failed_writer_lookup(mocker):
+  flaky_entry_point = mocker.Mock()
+  flaky_entry_point.name = 'flaky'
+  flaky_entry_point.load.side_effect = [
+    types.ModuleType('empty'),
+    _get_csv_writer_module(),
+  ]
+  mocker.patch.object(writer, '_get_writers', return_value=(flaky_entry_point,))
+  writer.invalidate_cache()
+
+  with pytest.raises(writer.GarfIoWriterError, match='Failed to load'):
+    writer.create_writer('flaky')
+  flaky_writer = writer.create_writer(
+    'flaky', destination_folder='/fake_folder'
+  )
+
+  writer.invalidate_cache()
+  assert flaky_writer.destination_folder == '/fake_folder'
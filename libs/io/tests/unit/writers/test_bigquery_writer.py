@@ -129,3 +129,11 @@ class TestBigQueryWriter:
     )
     result = writer.write(report, 'test')
     assert result
+
+  def test_write_chunks_without_chunks_does_not_write_table(self, mocker):
+    to_gbq = mocker.patch.object(bigquery_writer.pandas_gbq, 'to_gbq')
+    writer = bigquery_writer.BigQueryWriter(project='test', dataset='test')
+
+    writer.write_chunks([], 'test')
+
+    to_gbq.assert_not_called()
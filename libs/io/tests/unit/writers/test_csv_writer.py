@@ -14,6 +14,7 @@
 from __future__ import annotations
 
 import pytest
+from garf.core import report as garf_report
 from garf.io.writers import csv_writer
 
 _TMP_FILENAME = 'test.csv'
@@ -65,3 +66,29 @@ class TestCsvWriter:
     with open(output, 'r') as f:
       file = f.readlines()
     assert [row.strip() for row in file] == expected
+
+  def test_write_chunks_writes_header_once(
+    self, csv_writer, single_column_data, output_folder
+  ):
+    output = output_folder / _TMP_FILENAME
+    expected = ['column_1', '1', '2', '3', '1', '2', '3']
+    csv_writer.write_chunks(
+      [single_column_data, single_column_data], _TMP_FILENAME
+    )
+    with open(output, 'r') as f:
+      file = f.readlines()
+    assert [row.strip() for row in file] == expected
+
+  def test_write_chunks_without_chunks_writes_same_file_as_empty_report(
+    self, csv_writer, output_folder
+  ):
+    output = output_folder / _TMP_FILENAME
+    csv_writer.write(garf_report.GarfReport(), _TMP_FILENAME)
+    with open(output, 'r') as f:
+      expected = f.read()
+    output.unlink()
+
+    csv_writer.write_chunks([], _TMP_FILENAME)
+
+    with open(output, 'r') as f:
+      assert f.read() == expected
@@ -121,3 +121,25 @@ class TestJsonWriter:
       data = json.load(f)
 
     assert data == expected
+
+  @pytest.mark.parametrize('output_format', ['json', 'jsonl'])
+  def test_write_chunks_returns_correct_data(
+    self, single_column_data, output_folder, output_format
+  ):
+    writer = json_writer.JsonWriter(output_folder, format=output_format)
+    output = output_folder / f'test.{output_format}'
+    expected = [
+      {'column_1': 1},
+      {'column_1': 2},
+      {'column_1': 3},
+    ] * 2
+
+    writer.write_chunks([single_column_data, single_column_data], output)
+
+    with open(output, 'r') as f:
+      if output_format == 'json':
+        data = json.load(f)
+      else:
+        data = [json.loads(line) for line in f]
+
+    assert data == expected
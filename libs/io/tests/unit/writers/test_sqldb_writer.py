@@ -16,6 +16,7 @@ from __future__ import annotations
 
 import pandas as pd
 import pytest
+import sqlalchemy
 from garf.core import report as garf_report
 from garf.io.writers import sqldb_writer
 
@@ -50,3 +51,30 @@ class TestSqlAlchemyWriter:
     df = pd.read_sql(f'SELECT * FROM {_TMP_NAME}', sql_writer.connection_string)
 
     assert garf_report.GarfReport.from_pandas(df) == expected_report
+
+  def test_write_chunks_appends_all_chunks(
+    self, sql_writer, single_column_data
+  ):
+    sql_writer.write_chunks([single_column_data, single_column_data], _TMP_NAME)
+    df = pd.read_sql(f'SELECT * FROM {_TMP_NAME}', sql_writer.connection_string)
+
+    assert (
+      garf_report.GarfReport.from_pandas(df)
+      == single_column_data + single_column_data
+    )
+
+  def test_write_chunks_without_chunks_does_not_create_table(self, sql_writer):
+    sql_writer.write_chunks([], _TMP_NAME)
+
+    assert not sqlalchemy.inspect(sql_writer.engine).has_table(_TMP_NAME)
+
+  def test_write_chunks_with_empty_report_creates_empty_table(self, sql_writer):
+    empty_report = garf_report.GarfReport(
+      column_names=['column_1'], results_placeholder=[[1]]
+    )
+
+    sql_writer.write_chunks([empty_report], _TMP_NAME)
+    df = pd.read_sql(f'SELECT * FROM {_TMP_NAME}', sql_writer.connection_string)
+
+    assert df.empty
+    assert list(df.columns) == ['column_1']